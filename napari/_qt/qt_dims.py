@@ -1,7 +1,10 @@
+import time
 import warnings
+from collections import deque
 from typing import Optional, Tuple
 
 import numpy as np
+from qtpy.QtCore import Signal
 from qtpy.QtGui import QFont, QFontMetrics
 from qtpy.QtWidgets import QLineEdit, QSizePolicy, QVBoxLayout, QWidget
 
@@ -28,6 +31,11 @@ class QtDims(QWidget):
         List of slider widgets
     """
 
+    # emitted during playback with the axis and the upcoming points
+    prefetch_requested = Signal(int, tuple)
+    # emitted during playback with the axis and point of each drawn frame
+    frame_drawn = Signal(int, float)
+
     def __init__(self, dims: Dims, parent=None):
 
         super().__init__(parent=parent)
@@ -46,6 +54,9 @@ class QtDims(QWidget):
         self._last_used = None
         self._play_ready = True  # False if currently awaiting a draw event
         self._animation_thread = None
+        self._animation_worker = None
+        # times at which the last frames of the animation were set
+        self._frame_times = deque(maxlen=30)
 
         # Initialises the layout:
         layout = QVBoxLayout()
@@ -281,6 +292,8 @@ class QtDims(QWidget):
         fps: Optional[float] = None,
         loop_mode: Optional[str] = None,
         frame_range: Optional[Tuple[int, int]] = None,
+        buffer_size: Optional[int] = None,
+        drop_frames: Optional[bool] = None,
     ):
         """Animate (play) axis.
 
@@ -303,6 +316,14 @@ class QtDims(QWidget):
                     stopped
         frame_range: tuple | list
             If specified, will constrain animation to loop [first, last] frames
+        buffer_size: int
+            Number of upcoming frames to prefetch while the current one is
+            displayed. Only layers with lazily loaded data make use of it.
+        drop_frames: bool
+            If True frames are dropped when the view cannot keep up with the
+            requested fps. If False every frame is displayed, and the
+            animation slows down instead. The achieved fps is available as
+            ``achieved_fps``.
 
         Raises
         ------
@@ -326,8 +347,16 @@ class QtDims(QWidget):
         if axis >= len(self.dims.range):
             raise IndexError('axis argument out of range')
 
+        slider = self.slider_widgets[axis]
+        if buffer_size is not None:
+            slider.buffer_size = buffer_size
+        if drop_frames is not None:
+            slider.drop_frames = drop_frames
+
         if self.is_playing:
             if self._animation_worker.axis == axis:
+                self._animation_worker.buffer_size = slider.buffer_size
+                self._animation_worker.drop_frames = slider.drop_frames
                 self.slider_widgets[axis]._update_play_settings(
                     fps, loop_mode, frame_range
                 )
@@ -341,6 +370,9 @@ class QtDims(QWidget):
             work = self.slider_widgets[axis]._play(fps, loop_mode, frame_range)
             if work:
                 self._animation_worker, self._animation_thread = work
+                self.frame_drawn.connect(
+                    self._animation_worker.frame_displayed
+                )
             else:
                 self._animation_worker, self._animation_thread = None, None
         else:
@@ -351,8 +383,11 @@ class QtDims(QWidget):
         if self._animation_thread:
             self._animation_thread.quit()
             self._animation_thread.wait()
+        if self._animation_worker is not None:
+            self.frame_drawn.disconnect(self._animation_worker.frame_displayed)
         self._animation_thread = None
         self._animation_worker = None
+        self._frame_times.clear()
         self.enable_play()
 
     @property
@@ -360,6 +395,16 @@ class QtDims(QWidget):
         """Return True if any axis is currently animated."""
         return self._animation_thread and self._animation_thread.isRunning()
 
+    @property
+    def achieved_fps(self):
+        """float: Frames per second actually displayed by the animation."""
+        if len(self._frame_times) < 2:
+            return 0.0
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        if elapsed <= 0:
+            return 0.0
+        return (len(self._frame_times) - 1) / elapsed
+
     def _set_frame(self, axis, frame):
         """Safely tries to set `axis` to the requested `point`.
 
@@ -367,13 +412,22 @@ class QtDims(QWidget):
         the canvas, it will simply do nothing.  If the timer plays faster than
         the canvas can draw, this will drop the intermediate frames, keeping
         the effective frame rate constant even if the canvas cannot keep up.
+        Frames requested by an animation that does not drop frames are always
+        set, as that animation only requests a frame once the previous one
+        has been drawn.
         """
-        if self._play_ready:
+        worker = self._animation_worker
+        if self._play_ready or (worker is not None and not worker.drop_frames):
             # disable additional point advance requests until this one draws
             self._play_ready = False
             self.dims.set_point(axis, frame)
+            self._frame_times.append(time.perf_counter())
 
     def enable_play(self, *args):
         # this is mostly here to connect to the main SceneCanvas.events.draw
         # event in the qt_viewer
         self._play_ready = True
+        if self._animation_worker is not None:
+            # lets the worker advance when it is not dropping frames
+            axis = self._animation_worker.axis
+            self.frame_drawn.emit(axis, float(self.dims.point[axis]))
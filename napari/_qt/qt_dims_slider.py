@@ -80,6 +80,11 @@ class QtDimSliderWidget(QWidget):
         self._minframe = None
         self._maxframe = None
         self._loop_mode = LoopMode.LOOP
+        # number of upcoming frames prefetched during playback
+        self.buffer_size = 8
+        # if False, wait for each frame to be drawn rather than dropping
+        # frames to keep up with the requested fps
+        self.drop_frames = True
 
         layout = QHBoxLayout()
         self._create_axis_label_widget()
@@ -291,7 +296,10 @@ class QtDimSliderWidget(QWidget):
             AnimationWorker,
             self,
             start=True,
-            connections={'frame_requested': self.qt_dims._set_frame},
+            connections={
+                'frame_requested': self.qt_dims._set_frame,
+                'frames_upcoming': self.qt_dims.prefetch_requested,
+            },
         )
         worker.finished.connect(self.qt_dims.stop)
         thread.finished.connect(self.play_stopped.emit)
@@ -439,9 +447,17 @@ class AnimationWorker(QObject):
 
     This prevents mouseovers and other events from causing animation lag. See
     QtDims.play() for public-facing docstring.
+
+    Every time a frame is requested the upcoming `buffer_size` frames are
+    announced with `frames_upcoming`, so that they can be prefetched while
+    the current one is displayed. If `drop_frames` is False the worker does
+    not advance before `frame_displayed` reports that the requested frame
+    has been drawn, so every frame is shown even if that is slower than the
+    requested fps.
     """
 
     frame_requested = Signal(int, int)  # axis, point
+    frames_upcoming = Signal(int, tuple)  # axis, points
     finished = Signal()
     started = Signal()
 
@@ -451,6 +467,10 @@ class AnimationWorker(QObject):
         self.dims = slider.dims
         self.axis = slider.axis
         self.loop_mode = slider.loop_mode
+        self.buffer_size = getattr(slider, 'buffer_size', 0)
+        self.drop_frames = getattr(slider, 'drop_frames', True)
+        self._displayed = True
+        self._waiting = False
         slider.fps_changed.connect(self.set_fps)
         slider.mode_changed.connect(self.set_loop_mode)
         slider.range_changed.connect(self.set_frame_range)
@@ -513,41 +533,115 @@ class AnimationWorker(QObject):
     def set_loop_mode(self, mode):
         self.loop_mode = LoopMode(mode)
 
-    def advance(self):
-        """Advance the current frame in the animation.
-
-        Takes dims scale into account and restricts the animation to the
-        requested frame_range, if entered.
+    def _next_frame(self, current, step):
+        """Find the frame following `current` when playing with `step`.
+
+        Parameters
+        ----------
+        current : int
+            Current frame.
+        step : int
+            Direction of playback, 1 or -1.
+
+        Returns
+        -------
+        frame : 2-tuple or None
+            Next frame and direction of playback after reaching it, or None if
+            the animation is over.
         """
-        self.current += self.step * self.dimsrange[2]
-        if self.current < self.min_point:
+        current += step * self.dimsrange[2]
+        if current < self.min_point:
             if (
                 self.loop_mode == LoopMode.BACK_AND_FORTH
             ):  # 'loop_back_and_forth'
-                self.step *= -1
-                self.current = self.min_point + self.step * self.dimsrange[2]
+                step *= -1
+                current = self.min_point + step * self.dimsrange[2]
             elif self.loop_mode == LoopMode.LOOP:  # 'loop'
-                self.current = self.max_point + self.current - self.min_point
+                current = self.max_point + current - self.min_point
             else:  # loop_mode == 'once'
-                return self.finish()
-        elif self.current >= self.max_point:
+                return None
+        elif current >= self.max_point:
             if (
                 self.loop_mode == LoopMode.BACK_AND_FORTH
             ):  # 'loop_back_and_forth'
-                self.step *= -1
-                self.current = (
-                    self.max_point + 2 * self.step * self.dimsrange[2]
-                )
+                step *= -1
+                current = self.max_point + 2 * step * self.dimsrange[2]
             elif self.loop_mode == LoopMode.LOOP:  # 'loop'
-                self.current = self.min_point + self.current - self.max_point
+                current = self.min_point + current - self.max_point
             else:  # loop_mode == 'once'
-                return self.finish()
+                return None
+        return current, step
+
+    def upcoming_frames(self, n):
+        """Frames that will be requested after the current one.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of frames.
+
+        Returns
+        -------
+        frames : tuple of int
+            Upcoming frames, in the order in which they will be requested.
+        """
+        frames = []
+        current, step = self.current, self.step
+        for _ in range(n):
+            following = self._next_frame(current, step)
+            if following is None:
+                break
+            current, step = following
+            frames.append(current)
+        return tuple(frames)
+
+    def advance(self):
+        """Advance the current frame in the animation.
+
+        Takes dims scale into account and restricts the animation to the
+        requested frame_range, if entered.
+        """
+        if not self.drop_frames and not self._displayed:
+            # frame_displayed advances once the requested frame is drawn
+            self._waiting = True
+            return
+        following = self._next_frame(self.current, self.step)
+        if following is None:
+            # the animation ends one step past the last frame
+            self.current += self.step * self.dimsrange[2]
+            return self.finish()
+        self.current, self.step = following
+        self._displayed = False
         with self.dims.events.axis.blocker(self._on_axis_changed):
             self.frame_requested.emit(self.axis, self.current)
+        if self.buffer_size > 0:
+            self.frames_upcoming.emit(
+                self.axis, self.upcoming_frames(self.buffer_size)
+            )
         # using a singleShot timer here instead of timer.start() because
         # it makes it easier to update the interval using signals/slots
         self.timer.singleShot(self.interval, self.advance)
 
+    @Slot(int, float)
+    def frame_displayed(self, axis, point):
+        """Notify the worker that a frame has been drawn.
+
+        Parameters
+        ----------
+        axis : int
+            Axis of the drawn frame.
+        point : float
+            Point of the drawn frame along `axis`. Draws of other frames than
+            the last requested one are ignored.
+        """
+        if axis != self.axis or point != self.current:
+            return
+        self._displayed = True
+        if self._waiting:
+            # the interval has already elapsed, so advance right away
+            self._waiting = False
+            self.advance()
+
     def finish(self):
         self.finished.emit()
 
@@ -313,11 +313,23 @@ class QtLayerWidget(QFrame):
         super().__init__()
 
         self.layer = layer
-        layer.events.select.connect(lambda v: self.setSelected(True))
-        layer.events.deselect.connect(lambda v: self.setSelected(False))
-        layer.events.name.connect(self._on_layer_name_change)
-        layer.events.visible.connect(self._on_visible_change)
-        layer.events.thumbnail.connect(self._on_thumbnail_change)
+        callbacks = [
+            (layer.events.select, lambda v: self.setSelected(True)),
+            (layer.events.deselect, lambda v: self.setSelected(False)),
+            (layer.events.name, self._on_layer_name_change),
+            (layer.events.visible, self._on_visible_change),
+            (layer.events.thumbnail, self._on_thumbnail_change),
+        ]
+        for emitter, callback in callbacks:
+            emitter.connect(callback)
+
+        def disconnect():
+            for emitter, callback in callbacks:
+                emitter.disconnect(callback)
+
+        # the layer can outlive the widget, which must not be updated once
+        # Qt has deleted it
+        self.destroyed.connect(disconnect)
 
         self.setObjectName('layer')
 
@@ -329,6 +341,7 @@ class QtLayerWidget(QFrame):
         tb.setObjectName('thumbmnail')
         tb.setToolTip('Layer thumbmnail')
         self.thumbnailLabel = tb
+        self._thumbnail_stale = True
         self._on_thumbnail_change()
         self.layout.addWidget(tb)
 
@@ -397,7 +410,18 @@ class QtLayerWidget(QFrame):
         with self.layer.events.visible.blocker():
             self.visibleCheckBox.setChecked(self.layer.visible)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._thumbnail_stale:
+            self._on_thumbnail_change()
+
     def _on_thumbnail_change(self, event=None):
+        # Only fetch the thumbnail, which renders it if it is out of date,
+        # when the widget is on screen
+        if not self.isVisible():
+            self._thumbnail_stale = True
+            return
+        self._thumbnail_stale = False
         thumbnail = self.layer.thumbnail
         # Note that QImage expects the image width followed by height
         image = QImage(
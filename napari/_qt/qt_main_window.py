@@ -330,4 +330,5 @@ class Window:
         # AnimationThread before close, otherwise it will cauyse a segFault or Abort trap.
         # (calling stop() when no animation is occuring is also not a problem)
         self.qt_viewer.dims.stop()
+        self.qt_viewer._detach_layers()
         event.accept()
@@ -0,0 +1,191 @@
+import warnings
+from types import GeneratorType
+
+from qtpy.QtCore import QObject, QRunnable, Signal
+
+
+class QtSliceRunnable(QRunnable):
+    """Runnable loading a single layer slice on a thread pool.
+
+    Parameters
+    ----------
+    slicer : QtLayerSlicer
+        Slicer that submitted the task and receives its result.
+    layer : napari.layers.Layer
+        Layer being sliced.
+    request_id : int
+        Identifier of the request, used to discard stale results.
+    task : callable
+        Callable taking no arguments that loads the slice, or that returns a
+        generator yielding successively refined slices.
+    """
+
+    def __init__(self, slicer, layer, request_id, task):
+        super().__init__()
+        self.slicer = slicer
+        self.layer = layer
+        self.request_id = request_id
+        self.task = task
+        # the slicer keeps a reference to pending runnables so that they
+        # can be cancelled with `QThreadPool.tryTake`
+        self.setAutoDelete(False)
+
+    def run(self):
+        # signals are emitted from the worker thread, and delivered in order
+        # on the main thread
+        try:
+            result = self.task()
+            if isinstance(result, GeneratorType):
+                for refined in result:
+                    self.slicer.sliced.emit(
+                        self.layer, self.request_id, refined
+                    )
+                    current = self.slicer._request_ids.get(self.layer)
+                    if current != self.request_id:
+                        # stop refining a slice that will not be shown
+                        break
+            else:
+                self.slicer.sliced.emit(self.layer, self.request_id, result)
+        except Exception as e:
+            self.slicer.sliced.emit(self.layer, self.request_id, e)
+        self.slicer.finished.emit(self.layer, self.request_id)
+
+
+class QtLayerSlicer(QObject):
+    """Slice layers asynchronously on a thread pool.
+
+    Only the most recent request for each layer is ever applied: submitting
+    a new request cancels any request for the same layer that is still
+    queued, and results of requests that were already running are dropped
+    when they arrive. Results are applied to the layer on the main thread,
+    so `events.set_data` is only emitted for the latest request. Requests
+    that fail are reported with a warning and leave the view slice of the
+    layer unchanged.
+
+    Parameters
+    ----------
+    pool : qtpy.QtCore.QThreadPool
+        Thread pool on which slices are loaded.
+
+    Attributes
+    ----------
+    pool : qtpy.QtCore.QThreadPool
+        Thread pool on which slices are loaded.
+    """
+
+    sliced = Signal(object, int, object)  # layer, request_id, result
+    finished = Signal(object, int)  # layer, request_id
+
+    def __init__(self, pool):
+        super().__init__()
+        self.pool = pool
+        self._request_ids = {}
+        self._pending = {}
+        self.sliced.connect(self._on_sliced)
+        self.finished.connect(self._on_finished)
+
+    @property
+    def busy(self):
+        """bool: Whether any slice is currently being loaded."""
+        return len(self._pending) > 0
+
+    def pending(self, layer):
+        """Whether a slice of a layer is being loaded.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer being sliced.
+
+        Returns
+        -------
+        pending : bool
+            True if a request for the layer has not completed yet.
+        """
+        return layer in self._pending
+
+    def submit(self, layer, task):
+        """Load a slice of a layer on the thread pool.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer being sliced. Once the task completes its result is passed
+            to `layer._apply_slice`.
+        task : callable
+            Callable taking no arguments that loads the slice. It may instead
+            return a generator yielding successively refined slices, such as
+            a low resolution placeholder followed by the full slice, which
+            are each applied to the layer as they arrive.
+
+        Returns
+        -------
+        request_id : int
+            Identifier of the request.
+        """
+        self.cancel(layer)
+        request_id = self._request_ids.get(layer, 0) + 1
+        self._request_ids[layer] = request_id
+        runnable = QtSliceRunnable(self, layer, request_id, task)
+        self._pending.setdefault(layer, []).append(runnable)
+        self.pool.start(runnable)
+        return request_id
+
+    def cancel(self, layer):
+        """Cancel all queued requests for a layer.
+
+        Requests that are already running cannot be interrupted, but their
+        results will be discarded.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer whose requests are cancelled.
+        """
+        self._request_ids[layer] = self._request_ids.get(layer, 0) + 1
+        running = []
+        for runnable in self._pending.get(layer, []):
+            if not self.pool.tryTake(runnable):
+                running.append(runnable)
+        if running:
+            self._pending[layer] = running
+        else:
+            self._pending.pop(layer, None)
+
+    def remove(self, layer):
+        """Cancel all requests for a layer and forget about it.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer being removed.
+        """
+        self.cancel(layer)
+        # running requests stay referenced in `_pending` until they finish
+        self._request_ids.pop(layer, None)
+
+    def _on_finished(self, layer, request_id):
+        pending = [
+            r
+            for r in self._pending.get(layer, [])
+            if r.request_id != request_id
+        ]
+        if pending:
+            self._pending[layer] = pending
+        else:
+            self._pending.pop(layer, None)
+
+    def _on_sliced(self, layer, request_id, result):
+        if self._request_ids.get(layer) != request_id:
+            # a newer request has been made since, so this one is stale
+            return
+        if isinstance(result, Exception):
+            # the slice was not loaded, so it is requested again the next
+            # time the layer is refreshed, whatever its dims
+            layer._view_slice_key = None
+            message = f'slicing layer {layer.name} failed: {result!r}'
+            layer.status = message
+            warnings.warn(message)
+            return
+        layer._apply_slice(result)
+        layer._on_view_slice()
@@ -0,0 +1,172 @@
+import warnings
+from time import perf_counter
+
+from qtpy.QtCore import QObject, QRunnable, QTimer, Signal
+
+
+class QtThumbnailRunnable(QRunnable):
+    """Runnable rendering a single layer thumbnail on a thread pool.
+
+    Parameters
+    ----------
+    thumbnailer : QtThumbnailer
+        Thumbnailer that submitted the task and receives its result.
+    layer : napari.layers.Layer
+        Layer whose thumbnail is rendered.
+    request_id : int
+        Identifier of the request, used to discard out of order results.
+    task : callable
+        Callable taking no arguments that renders the thumbnail.
+    """
+
+    def __init__(self, thumbnailer, layer, request_id, task):
+        super().__init__()
+        self.thumbnailer = thumbnailer
+        self.layer = layer
+        self.request_id = request_id
+        self.task = task
+
+    def run(self):
+        try:
+            result = self.task()
+        except Exception as e:
+            result = e
+        # emitted from the worker thread, delivered on the main thread
+        self.thumbnailer.rendered.emit(self.layer, self.request_id, result)
+
+
+class QtThumbnailer(QObject):
+    """Render layer thumbnails at a limited rate.
+
+    Requests for the thumbnail of a layer are coalesced, so that it is
+    rendered at most once every `interval` milliseconds however often the
+    layer changes. Layers that provide a `_thumbnail_task` are rendered on
+    the thread pool, and the others on the main thread. Results are set as
+    the thumbnail of the layer on the main thread, unless a more recent
+    thumbnail has already been set. Renders that fail are reported with a
+    warning and leave the thumbnail stale.
+
+    Parameters
+    ----------
+    pool : qtpy.QtCore.QThreadPool
+        Thread pool on which thumbnails are rendered.
+    interval : int
+        Minimum time between two renders of the thumbnail of a layer, in
+        milliseconds.
+
+    Attributes
+    ----------
+    pool : qtpy.QtCore.QThreadPool
+        Thread pool on which thumbnails are rendered.
+    interval : int
+        Minimum time between two renders of the thumbnail of a layer, in
+        milliseconds.
+    """
+
+    rendered = Signal(object, int, object)  # layer, request_id, result
+
+    def __init__(self, pool, interval=250):
+        super().__init__()
+        self.pool = pool
+        self.interval = interval
+        self._timers = {}
+        self._last_render = {}
+        self._request_ids = {}
+        self._applied_ids = {}
+        self._pending = {}
+        self.rendered.connect(self._on_rendered)
+
+    @property
+    def busy(self):
+        """bool: Whether any thumbnail is scheduled or being rendered."""
+        scheduled = any(t.isActive() for t in self._timers.values())
+        return scheduled or len(self._pending) > 0
+
+    def request(self, layer):
+        """Schedule rendering the thumbnail of a layer.
+
+        The thumbnail is rendered right away if it was not rendered within
+        the last `interval` milliseconds, and otherwise once that time has
+        passed. Requests made in the meantime are merged into that one.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer whose thumbnail is out of date.
+        """
+        timer = self._timers.get(layer)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._render(layer))
+            self._timers[layer] = timer
+        if timer.isActive():
+            return
+        last = self._last_render.get(layer)
+        if last is None:
+            delay = 0
+        else:
+            elapsed = 1000 * (perf_counter() - last)
+            delay = int(max(self.interval - elapsed, 0))
+        timer.start(delay)
+
+    def remove(self, layer):
+        """Cancel the scheduled render of a layer and forget about it.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer being removed.
+        """
+        timer = self._timers.pop(layer, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        self._last_render.pop(layer, None)
+        self._request_ids.pop(layer, None)
+        self._applied_ids.pop(layer, None)
+        # running renders stay referenced in `_pending` until they finish,
+        # and their results are dropped as the layer has no request id
+
+    def _render(self, layer):
+        self._last_render[layer] = perf_counter()
+        task = layer._thumbnail_task()
+        if task is None:
+            layer._update_thumbnail()
+            return
+        request_id = self._request_ids.get(layer, 0) + 1
+        self._request_ids[layer] = request_id
+        runnable = QtThumbnailRunnable(self, layer, request_id, task)
+        self._pending.setdefault(layer, []).append(runnable)
+        self.pool.start(runnable)
+
+    def _on_rendered(self, layer, request_id, result):
+        pending = [
+            r
+            for r in self._pending.get(layer, [])
+            if r.request_id != request_id
+        ]
+        if pending:
+            self._pending[layer] = pending
+        else:
+            self._pending.pop(layer, None)
+
+        if layer not in self._request_ids:
+            # the layer has been removed
+            return
+        if request_id <= self._applied_ids.get(layer, 0):
+            # a thumbnail rendered more recently has already been set
+            return
+        self._applied_ids[layer] = request_id
+        if isinstance(result, Exception):
+            # the thumbnail stays stale, so that it is rendered again on the
+            # main thread the next time it is read
+            layer._thumbnail_stale = True
+            warnings.warn(
+                f'rendering the thumbnail of layer {layer.name} failed: '
+                f'{result!r}'
+            )
+            return
+        layer.thumbnail = result
+        # a request made while rendering is still waiting on its timer
+        layer._thumbnail_stale = self._timers[layer].isActive()
@@ -12,6 +12,8 @@ from vispy.visuals.transforms import ChainTransform
 
 from .qt_dims import QtDims
 from .qt_layerlist import QtLayerList
+from .qt_slicer import QtLayerSlicer
+from .qt_thumbnailer import QtThumbnailer
 from ..resources import resources_dir
 from ..utils.theme import template
 from ..utils.misc import str_to_rgb
@@ -40,6 +42,9 @@ class QtViewer(QSplitter):
         super().__init__()
 
         self.pool = QThreadPool()
+        self.slicer = QtLayerSlicer(self.pool)
+        self.thumbnailer = QtThumbnailer(self.pool)
+        self._async_slicing = False
 
         QCoreApplication.setAttribute(
             Qt.AA_UseStyleSheetPropagationInWidgetStyles, True
@@ -104,6 +109,7 @@ class QtViewer(QSplitter):
         self.canvas = SceneCanvas(keys=None, vsync=True)
         self.canvas.events.ignore_callback_errors = False
         self.canvas.events.draw.connect(self.dims.enable_play)
+        self.dims.prefetch_requested.connect(self.viewer._prefetch_slices)
         self.canvas.native.setMinimumSize(QSize(200, 200))
         self.canvas.context.set_depth_func('lequal')
 
@@ -168,6 +174,26 @@ class QtViewer(QSplitter):
         else:
             self.controls.setMaximumWidth(220)
 
+    @property
+    def async_slicing(self):
+        """bool: Whether layers are sliced on the thread pool.
+
+        When `True` layers that support it load their view slices on
+        `self.pool` rather than blocking the main thread, and only the result
+        of the latest slice request of each layer is displayed.
+        """
+        return self._async_slicing
+
+    @async_slicing.setter
+    def async_slicing(self, async_slicing):
+        self._async_slicing = async_slicing
+        for layer in self.viewer.layers:
+            if async_slicing:
+                layer._slicer = self.slicer
+            else:
+                self.slicer.remove(layer)
+                layer._slicer = None
+
     def _add_layer(self, event):
         """When a layer is added, set its parent and order."""
         layers = event.source
@@ -177,10 +203,17 @@ class QtViewer(QSplitter):
         vispy_layer.node.parent = self.view.scene
         vispy_layer.order = len(layers)
         self.layer_to_visual[layer] = vispy_layer
+        layer._thumbnailer = self.thumbnailer
+        if self.async_slicing:
+            layer._slicer = self.slicer
 
     def _remove_layer(self, event):
         """When a layer is removed, remove its parent."""
         layer = event.item
+        self.slicer.remove(layer)
+        layer._slicer = None
+        self.thumbnailer.remove(layer)
+        layer._thumbnailer = None
         vispy_layer = self.layer_to_visual[layer]
         vispy_layer.node.transforms = ChainTransform()
         vispy_layer.node.parent = None
@@ -435,13 +468,26 @@ class QtViewer(QSplitter):
                 filenames.append(url.toString())
         self._add_files(filenames)
 
+    def _detach_layers(self):
+        """Stop slicing and rendering thumbnails of the layers.
+
+        Queued tasks are dropped, and results of the tasks that are already
+        running are discarded once they finish, as widgets showing them
+        might have been deleted by then.
+        """
+        self.pool.clear()
+        for layer in self.viewer.layers:
+            self.slicer.remove(layer)
+            layer._slicer = None
+            self.thumbnailer.remove(layer)
+            layer._thumbnailer = None
+
     def closeEvent(self, event):
-        if self.pool.activeThreadCount() > 0:
-            self.pool.clear()
+        self._detach_layers()
         event.accept()
 
     def shutdown(self):
-        self.pool.clear()
+        self._detach_layers()
         self.canvas.close()
         self.console.shutdown()
 
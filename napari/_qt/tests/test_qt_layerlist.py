@@ -2,7 +2,7 @@ import numpy as np
 
 from napari.components import LayerList
 from napari.layers import Image
-from napari._qt.qt_layerlist import QtLayerList, QtDivider
+from napari._qt.qt_layerlist import QtLayerList, QtLayerWidget, QtDivider
 
 
 def check_layout_layers(layout, layers):
@@ -206,3 +206,17 @@ def test_reordering_layers(qtbot):
     assert view.vbox_layout.count() == 2 * (len(layers) + 1)
     assert check_layout_layers(view.vbox_layout, layers)
     assert check_layout_dividers(view.vbox_layout, len(layers))
+
+
+def test_deleted_widget_disconnected(qtbot):
+    """Test a deleted layer widget no longer follows its layer."""
+    layer = Image(np.random.random((10, 10)))
+    widget = QtLayerWidget(layer)
+    callbacks = len(layer.events.thumbnail.callbacks)
+    widget.deleteLater()
+    qtbot.waitUntil(lambda: len(layer.events.thumbnail.callbacks) < callbacks)
+    # changes of the layer are not sent to the deleted widget
+    layer.name = 'renamed'
+    layer.visible = False
+    layer.events.thumbnail()
+
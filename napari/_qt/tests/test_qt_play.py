@@ -1,10 +1,12 @@
 from contextlib import contextmanager
 
+import dask.array as da
 import numpy as np
 import pytest
 
 from napari._qt.qt_viewer import QtViewer
 from napari.components import ViewerModel
+from napari.layers.image.slice_cache import SliceCache, slice_key
 
 from ...components import Dims
 from ..qt_dims import QtDims
@@ -98,6 +100,46 @@ def test_animation_thread_once(qtbot):
     assert worker.current == worker.nz
 
 
+def test_upcoming_frames(qtbot):
+    """Upcoming frames follow the loop mode without advancing the worker"""
+    with make_worker(qtbot) as worker:
+        worker.current = 6
+        assert worker.upcoming_frames(4) == (7, 0, 1, 2)
+        worker.loop_mode = LoopMode.ONCE
+        assert worker.upcoming_frames(4) == (7,)
+        assert worker.current == 6
+
+
+def test_animation_waits_for_display(qtbot):
+    """Without dropping frames the worker waits for each frame to draw"""
+    with make_worker(qtbot, fps=100) as worker:
+        worker.drop_frames = False
+        worker.advance()
+        qtbot.wait(100)
+        assert worker._count == 1
+        # draws of other frames than the requested one are ignored
+        worker.frame_displayed(0, worker.current - 1)
+        worker.frame_displayed(1, worker.current)
+        qtbot.wait(50)
+        assert worker._count == 1
+        worker.frame_displayed(0, worker.current)
+        assert worker._count == 2
+        worker.finish()
+
+
+def test_achieved_fps(qtbot):
+    """Displayed frames are timed to measure the achieved fps"""
+    dims = Dims(3)
+    qtdims = QtDims(dims)
+    dims.set_range(0, (0, 8, 1))
+    for i in range(4):
+        qtdims._set_frame(0, i)
+        qtbot.wait(10)
+        qtdims.enable_play()
+    assert dims.point[0] == 3
+    assert 0 < qtdims.achieved_fps < 100
+
+
 @pytest.fixture()
 def view(qtbot):
     """basic viewer with data that we will use a few times"""
@@ -180,3 +222,21 @@ def test_playing_hidden_slider_does_nothing(qtbot, view):
 
     view.dims.play(2, 20)
     assert not view.dims.is_playing
+
+
+def test_play_prefetches_upcoming_frames(qtbot):
+    """Upcoming frames of lazy layers are read ahead during playback"""
+    viewer = ViewerModel()
+    view = QtViewer(viewer)
+    qtbot.addWidget(view)
+    data = da.from_array(np.random.random((10, 10, 15)), chunks=(1, 10, 15))
+    layer = viewer.add_image(data)
+    cache = SliceCache()
+    layer._slice_cache = cache
+
+    view.dims.prefetch_requested.emit(0, (3, 4))
+    cache.wait()
+    for i in (3, 4):
+        key = slice_key(layer._cache_token, 0, (i, slice(None), slice(None)))
+        assert key in cache
+    view.shutdown()
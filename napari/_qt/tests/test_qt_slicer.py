@@ -0,0 +1,169 @@
+import threading
+
+import dask.array as da
+import numpy as np
+import pytest
+from qtpy.QtCore import QThreadPool
+
+from napari._qt.qt_slicer import QtLayerSlicer
+from napari._qt.qt_viewer import QtViewer
+from napari.components import ViewerModel
+from napari.layers import Image
+from napari.layers.image.slice_cache import SliceCache
+
+
+def test_async_refresh(qtbot):
+    """Test slicing an image layer on the thread pool."""
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    slicer = QtLayerSlicer(QThreadPool())
+    layer._slicer = slicer
+
+    layer.dims.set_point(0, 5)
+    qtbot.waitUntil(lambda: not slicer.busy)
+    np.testing.assert_array_equal(layer._data_view, data[5])
+
+
+def test_stale_requests_dropped(qtbot):
+    """Test only the latest request of a layer gets applied."""
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    slicer = QtLayerSlicer(pool)
+    layer._slicer = slicer
+
+    applied = []
+    layer.events.set_data.connect(lambda e: applied.append(layer._data_view))
+
+    # block the pool so that later requests are queued behind the first one
+    release = threading.Event()
+    request = layer._slice_request()
+
+    def blocked_task():
+        release.wait()
+        return layer._load_slice(request)
+
+    slicer.submit(layer, blocked_task)
+    for i in range(1, 5):
+        layer.dims.set_point(0, i)
+    release.set()
+    qtbot.waitUntil(lambda: not slicer.busy)
+
+    assert len(applied) == 1
+    np.testing.assert_array_equal(layer._data_view, data[4])
+
+
+def test_view_transform_applied_with_slice(qtbot):
+    """Test the view scale of a pyramid changes along with the sliced data."""
+    base = np.random.random((64, 64))
+    pyramid = [base[:: 2 ** i, :: 2 ** i] for i in range(3)]
+    layer = Image(pyramid, is_pyramid=True)
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    slicer = QtLayerSlicer(pool)
+    layer._slicer = slicer
+    scale_view = layer._scale_view.copy()
+
+    release = threading.Event()
+    request = layer._slice_request()
+
+    def blocked_task():
+        release.wait()
+        return layer._load_slice(request)
+
+    slicer.submit(layer, blocked_task)
+    try:
+        layer.data_level = 0
+        # the request for the new level is still queued
+        np.testing.assert_array_equal(layer._scale_view, scale_view)
+    finally:
+        release.set()
+    qtbot.waitUntil(lambda: not slicer.busy)
+    np.testing.assert_array_equal(layer._scale_view, [1, 1])
+    np.testing.assert_array_equal(layer._data_view, base)
+
+
+def test_failed_request(qtbot):
+    """Test a failing slice task is reported and the slicer still works."""
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    slicer = QtLayerSlicer(QThreadPool())
+    layer._slicer = slicer
+
+    def failing_task():
+        raise OSError('unreadable chunk')
+
+    layer._slice_task = lambda: failing_task
+    with pytest.warns(UserWarning, match='unreadable chunk'):
+        layer.dims.set_point(0, 5)
+        qtbot.waitUntil(lambda: not slicer.busy)
+    assert not slicer.busy
+    assert 'unreadable chunk' in layer.status
+    np.testing.assert_array_equal(layer._data_view, data[0])
+
+    # later requests are still applied
+    del layer._slice_task
+    layer.dims.set_point(0, 6)
+    qtbot.waitUntil(lambda: not slicer.busy)
+    np.testing.assert_array_equal(layer._data_view, data[6])
+
+
+def test_async_tiles(qtbot):
+    """Test missing tiles are shown as placeholders until they are read."""
+    base = np.random.random((100, 100))
+    pyramid = [da.from_array(base[:: 2 ** i, :: 2 ** i]) for i in range(3)]
+    layer = Image(pyramid, is_pyramid=True)
+    layer._slice_cache = SliceCache()
+    layer._max_tile_shape = 40
+    layer._tile_shape = 16
+    slicer = QtLayerSlicer(QThreadPool())
+    layer._slicer = slicer
+
+    applied = []
+    layer.events.set_data.connect(
+        lambda e: applied.append(layer._data_view.copy())
+    )
+    layer.data_level = 0
+    # nothing is read on the main thread
+    assert len(applied) == 0
+    qtbot.waitUntil(lambda: not slicer.busy)
+
+    # the placeholder is the upsampled lowest level
+    coarse = np.asarray(layer._data_pyramid[-1])
+    factor = int(layer.level_downsamples[-1, 0])
+    upsampled = coarse[
+        np.ix_(np.arange(32) // factor, np.arange(32) // factor)
+    ]
+    assert len(applied) == 2
+    np.testing.assert_array_equal(applied[0], upsampled)
+    np.testing.assert_array_equal(applied[1], base[:32, :32])
+    np.testing.assert_array_equal(layer._data_view, base[:32, :32])
+
+
+def test_async_slicing_viewer(qtbot):
+    """Test toggling async slicing on the viewer."""
+    viewer = ViewerModel()
+    view = QtViewer(viewer)
+    qtbot.addWidget(view)
+
+    data = np.random.random((10, 15, 20))
+    layer = viewer.add_image(data)
+    assert layer._slicer is None
+
+    view.async_slicing = True
+    assert layer._slicer is view.slicer
+    viewer.dims.set_point(0, 3)
+    qtbot.waitUntil(lambda: not view.slicer.busy)
+    np.testing.assert_array_equal(layer._data_view, data[3])
+
+    other = viewer.add_image(data)
+    assert other._slicer is view.slicer
+    viewer.layers.remove(other)
+    assert other._slicer is None
+
+    view.async_slicing = False
+    assert layer._slicer is None
+    viewer.dims.set_point(0, 7)
+    np.testing.assert_array_equal(layer._data_view, data[7])
+    view.shutdown()
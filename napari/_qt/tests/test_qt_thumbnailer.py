@@ -0,0 +1,112 @@
+import threading
+
+import numpy as np
+import pytest
+from qtpy.QtCore import QThreadPool
+
+from napari._qt.qt_thumbnailer import QtThumbnailer
+from napari._qt.qt_viewer import QtViewer
+from napari.components import ViewerModel
+from napari.layers import Image, Points
+
+
+def test_thumbnail_on_pool(qtbot):
+    """Test rendering an image thumbnail on the thread pool."""
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    thumbnailer = QtThumbnailer(QThreadPool())
+    layer._thumbnailer = thumbnailer
+
+    layer.dims.set_point(0, 5)
+    assert layer._thumbnail_stale
+    qtbot.waitUntil(lambda: not thumbnailer.busy)
+    assert not layer._thumbnail_stale
+    rendered = layer.thumbnail.copy()
+    layer._update_thumbnail()
+    np.testing.assert_array_equal(rendered, layer.thumbnail)
+
+
+def test_failed_render(qtbot):
+    """Test a failing render is reported and leaves the thumbnail stale."""
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    thumbnailer = QtThumbnailer(QThreadPool())
+    layer._thumbnailer = thumbnailer
+
+    def failing_task():
+        raise OSError('unreadable chunk')
+
+    layer._thumbnail_task = lambda: failing_task
+    with pytest.warns(UserWarning, match='unreadable chunk'):
+        layer.dims.set_point(0, 5)
+        qtbot.waitUntil(lambda: not thumbnailer.busy)
+    assert layer._thumbnail_stale
+
+    # the thumbnail is rendered on the main thread once read
+    del layer._thumbnail_task
+    rendered = layer.thumbnail.copy()
+    assert not layer._thumbnail_stale
+    layer._update_thumbnail()
+    np.testing.assert_array_equal(rendered, layer.thumbnail)
+
+
+def test_thumbnail_requests_coalesced(qtbot):
+    """Test changes within the interval are rendered once."""
+    layer = Points(20 * np.random.random((10, 3)))
+    thumbnailer = QtThumbnailer(QThreadPool(), interval=200)
+    layer._thumbnailer = thumbnailer
+    qtbot.waitUntil(lambda: not thumbnailer.busy)
+
+    updates = []
+    layer.events.thumbnail.connect(lambda e: updates.append(e))
+    # the first change is rendered right away, and the others together
+    for i in range(10):
+        layer.dims.set_point(0, i)
+    qtbot.waitUntil(lambda: not thumbnailer.busy)
+    assert len(updates) <= 2
+    assert not layer._thumbnail_stale
+
+
+def test_thumbnailer_viewer(qtbot):
+    """Test the viewer sets and removes the thumbnailer of layers."""
+    viewer = ViewerModel()
+    view = QtViewer(viewer)
+    qtbot.addWidget(view)
+
+    layer = viewer.add_image(np.random.random((10, 15, 20)))
+    assert layer._thumbnailer is view.thumbnailer
+    viewer.layers.remove(layer)
+    assert layer._thumbnailer is None
+    view.shutdown()
+
+
+def test_running_render_dropped_on_shutdown(qtbot):
+    """Test a render still running when the viewer shuts down is dropped."""
+    viewer = ViewerModel()
+    view = QtViewer(viewer)
+    qtbot.addWidget(view)
+    layer = viewer.add_image(np.random.random((10, 15, 20)))
+    qtbot.waitUntil(lambda: not view.thumbnailer.busy)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocked_task():
+        started.set()
+        release.wait()
+        return np.zeros(layer._thumbnail_shape, dtype=np.uint8)
+
+    layer._thumbnail_task = lambda: blocked_task
+    updates = []
+    layer.events.thumbnail.connect(lambda e: updates.append(e))
+    try:
+        layer.dims.set_point(0, 5)
+        qtbot.waitUntil(started.is_set)
+        view.shutdown()
+    finally:
+        release.set()
+    qtbot.waitUntil(lambda: view.pool.activeThreadCount() == 0)
+    qtbot.wait(50)
+    assert layer._thumbnailer is None
+    assert updates == []
+
@@ -0,0 +1,65 @@
+import numpy as np
+from unittest.mock import patch
+
+from napari.layers import Image
+from napari._vispy.vispy_image_layer import VispyImageLayer
+
+
+def test_texture_staging_buffer():
+    """Test views are converted into a reused buffer before upload."""
+    np.random.seed(0)
+    data = np.random.random((10, 15, 8))
+    layer = Image(data)
+    visual = VispyImageLayer(layer)
+    staging = visual._staging
+    assert staging.dtype == np.float32
+    np.testing.assert_array_equal(staging, data[0].astype(np.float32))
+
+    # a new view of the same shape is converted into the same buffer
+    layer.dims.set_point(0, 1)
+    assert visual._staging is staging
+    np.testing.assert_array_equal(staging, data[1].astype(np.float32))
+
+
+def test_texture_zero_copy():
+    """Test contiguous views of a texture dtype are uploaded without copy."""
+    data = np.zeros((10, 15, 8), dtype=np.uint8)
+    layer = Image(data)
+    visual = VispyImageLayer(layer)
+    assert visual._staging is None
+    assert visual.node._data is layer._data_view
+
+
+def test_texture_region_update():
+    """Test only the changed region of the view is uploaded."""
+    data = np.zeros((15, 8), dtype=np.float32)
+    layer = Image(data, contrast_limits=[0, 2])
+    visual = VispyImageLayer(layer)
+    # upload the whole view, as happens on the first draw
+    visual.node._build_texture()
+    texture = visual.node._texture
+
+    layer._data_view[2:4, 1:3] = 1
+    with patch.object(texture, 'set_data') as mocked_method:
+        layer.events.set_data(region=(slice(2, 4), slice(1, 3)))
+    mocked_method.assert_called_once()
+    region, = mocked_method.call_args[0]
+    assert region.shape == (2, 2)
+    np.testing.assert_allclose(region, 0.5)
+    assert mocked_method.call_args[1]['offset'] == (2, 1)
+
+
+def test_texture_region_update_equal_clims():
+    """Test equal contrast limits fall back to a full upload."""
+    data = np.zeros((15, 8), dtype=np.float32)
+    layer = Image(data)
+    visual = VispyImageLayer(layer)
+    visual.node.clim = (1, 1)
+    visual.node._build_texture()
+    texture = visual.node._texture
+
+    layer._data_view[2:4, 1:3] = 1
+    with patch.object(texture, 'set_data') as mocked_method:
+        layer.events.set_data(region=(slice(2, 4), slice(1, 3)))
+    mocked_method.assert_not_called()
+    assert visual.node._need_texture_upload
@@ -17,11 +17,42 @@ texture_dtypes = [
 ]
 
 
+def get_texture_dtype(dtype):
+    """Find the dtype data must have to be uploaded to a texture.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        Dtype of the data.
+
+    Returns
+    -------
+    texture_dtype : np.dtype
+        Dtype supported by textures that can represent the data.
+    """
+    dtype = np.dtype(dtype)
+    if dtype in texture_dtypes:
+        return dtype
+    try:
+        return np.dtype(
+            dict(i=np.int16, f=np.float32, u=np.uint16, b=np.uint8)[
+                dtype.kind
+            ]
+        )
+    except KeyError:  # not an int or float
+        raise TypeError(
+            f'type {dtype} not allowed for texture; must be one of {set(texture_dtypes)}'  # noqa: E501
+        )
+
+
 class VispyImageLayer(VispyBaseLayer):
     def __init__(self, layer):
         node = ImageNode(None, method='auto')
         super().__init__(layer, node)
 
+        # reusable buffer that views are converted into before upload
+        self._staging = None
+
         self.layer.events.rendering.connect(self._on_rendering_change)
         self.layer.events.interpolation.connect(self._on_interpolation_change)
         self.layer.events.colormap.connect(self._on_colormap_change)
@@ -51,22 +82,13 @@ class VispyImageLayer(VispyBaseLayer):
 
     def _on_data_change(self, event=None):
         data = self.layer._data_view
-        dtype = np.dtype(data.dtype)
-        if dtype not in texture_dtypes:
-            try:
-                dtype = dict(
-                    i=np.int16, f=np.float32, u=np.uint16, b=np.uint8
-                )[dtype.kind]
-            except KeyError:  # not an int or float
-                raise TypeError(
-                    f'type {dtype} not allowed for texture; must be one of {set(texture_dtypes)}'  # noqa: E501
-                )
-            data = data.astype(dtype)
+        dtype = get_texture_dtype(data.dtype)
 
         if self.layer.dims.ndisplay == 3 and self.layer.dims.ndim == 2:
             data = np.expand_dims(data, axis=0)
 
-        # Check if data exceeds MAX_TEXTURE_SIZE and downsample
+        # Check if data exceeds MAX_TEXTURE_SIZE and downsample. This only
+        # creates a strided view, so it happens before any copy is made
         if (
             self.MAX_TEXTURE_SIZE_2D is not None
             and self.layer.dims.ndisplay == 2
@@ -86,8 +108,11 @@ class VispyImageLayer(VispyBaseLayer):
             self.layer.dims.ndisplay == 2
             and not isinstance(self.node, ImageNode)
         ):
-            self._on_display_change(data)
-        else:
+            self._on_display_change(self._stage_texture(data, dtype))
+        elif not self._update_texture_region(
+            data, dtype, getattr(event, 'region', None)
+        ):
+            data = self._stage_texture(data, dtype)
             if self.layer.dims.ndisplay == 2:
                 self.node._need_colortransform_update = True
                 self.node.set_data(data)
@@ -95,6 +120,101 @@ class VispyImageLayer(VispyBaseLayer):
                 self.node.set_data(data, clim=self.layer.contrast_limits)
         self.node.update()
 
+    def _stage_texture(self, data, dtype):
+        """Return data ready to be uploaded to the texture.
+
+        C-contiguous data of a texture dtype, including memory-mapped
+        arrays, is passed on without a copy. Anything else is converted in
+        place into a staging buffer that is kept and reused as long as the
+        shape and dtype of the view stay the same, so refreshing the view
+        does not allocate a new array each time.
+
+        Parameters
+        ----------
+        data : array
+            Data of the current view.
+        dtype : np.dtype
+            Texture dtype the data must be converted to.
+
+        Returns
+        -------
+        data : np.ndarray
+            C-contiguous array of the texture dtype.
+        """
+        if data.dtype == dtype and data.flags['C_CONTIGUOUS']:
+            return data
+        if (
+            self._staging is None
+            or self._staging.shape != data.shape
+            or self._staging.dtype != dtype
+        ):
+            self._staging = np.empty(data.shape, dtype=dtype)
+        np.copyto(self._staging, data, casting='unsafe')
+        return self._staging
+
+    def _update_texture_region(self, data, dtype, region):
+        """Upload only the part of the view that changed to the texture.
+
+        Parameters
+        ----------
+        data : array
+            Data of the current view.
+        dtype : np.dtype
+            Texture dtype the data must be converted to.
+        region : tuple of slice or None
+            Region of the view that changed, one slice per displayed axis.
+
+        Returns
+        -------
+        updated : bool
+            False if the texture could not be partially updated, in which
+            case the whole view needs to be uploaded.
+        """
+        if region is None or data is not self.layer._data_view:
+            # the view was reshaped or downsampled, or everything changed
+            return False
+        ndisplay = self.layer.dims.ndisplay
+        texture = getattr(
+            self.node, '_texture' if ndisplay == 2 else '_tex', None
+        )
+        if (
+            texture is None
+            or getattr(self.node, '_need_texture_upload', False)
+            or tuple(texture.shape[:ndisplay]) != data.shape[:ndisplay]
+        ):
+            return False
+        region = tuple(
+            slice(*sl.indices(size)[:2]) for sl, size in zip(region, data.shape)
+        )
+        if any(sl.start >= sl.stop for sl in region):
+            return True
+        normalized = data.ndim == ndisplay or data.shape[-1] == 1
+        if normalized:
+            low, high = np.asarray(self.node.clim, dtype=np.float32)
+            if high <= low:
+                # vispy fills equal contrast limits depending on the whole
+                # view, so leave those to a full upload
+                return False
+
+        # keep the array held by the node in sync, so that a later full
+        # upload, e.g. on a contrast limits change, is still correct
+        if self._staging is not None and self._staging.shape == data.shape:
+            np.copyto(self._staging[region], data[region], casting='unsafe')
+        subregion = np.asarray(data[region])
+        if normalized:
+            # vispy normalizes single channel data by the contrast limits
+            # on the CPU before uploading, so the same is done here
+            subregion = subregion.astype(np.float32)
+            subregion -= low
+            subregion /= high - low
+        elif subregion.dtype != dtype:
+            subregion = subregion.astype(dtype)
+        texture.set_data(
+            np.ascontiguousarray(subregion),
+            offset=tuple(sl.start for sl in region[:ndisplay]),
+        )
+        return True
+
     def _on_interpolation_change(self, event=None):
         if self.layer.dims.ndisplay == 3 and isinstance(self.layer, Labels):
             self.node.interpolation = 'nearest'
@@ -220,8 +340,9 @@ class VispyImageLayer(VispyBaseLayer):
             top_left, 0, np.subtract(self.layer.level_shapes[0], 1)
         )
 
-        # Convert to offset for image array
-        rounding_factor = self.layer._max_tile_shape / 4
+        # Snap to the tile grid, so that the view only changes when panning
+        # across a tile boundary
+        rounding_factor = self.layer._tile_shape
         top_left = rounding_factor * np.floor(top_left / rounding_factor)
 
         return top_left.astype(int)
@@ -51,12 +51,8 @@ class VispyPointsLayer(VispyBaseLayer):
             self._on_highlight_change()
 
         if len(self.layer._data_view) > 0:
-            edge_color = [
-                self.layer.edge_color[i] for i in self.layer._indices_view
-            ]
-            face_color = [
-                self.layer.face_color[i] for i in self.layer._indices_view
-            ]
+            edge_color = self.layer.edge_color[self.layer._indices_view]
+            face_color = self.layer.face_color[self.layer._indices_view]
         else:
             edge_color = 'white'
             face_color = 'white'
@@ -97,9 +93,8 @@ class VispyPointsLayer(VispyBaseLayer):
             if data.ndim == 1:
                 data = np.expand_dims(data, axis=0)
             size = self.layer._size_view[self.layer._highlight_index]
-            face_color = [
-                self.layer.face_color[i]
-                for i in self.layer._indices_view[self.layer._highlight_index]
+            face_color = self.layer.face_color[
+                self.layer._indices_view[self.layer._highlight_index]
             ]
         else:
             data = np.zeros((1, self.layer.dims.ndisplay))
@@ -33,7 +33,8 @@ class Dims:
         POINT mode, one for each dimension
     interval : list of 2-tuple
         List of tuples (min, max) setting the current selection of the range
-        slider when in INTERVAL mode, one for each dimension
+        slider when in INTERVAL mode, one for each dimension. The max is
+        excluded from the selection.
     mode : list of DimsMode
         List of DimsMode, one for each dimension
     clip : bool
@@ -259,24 +260,74 @@ class Dims:
 
     @property
     def indices(self):
-        """Tuple of slice objects for slicing arrays on each dimension."""
+        """Tuple of slice objects for slicing arrays on each dimension.
+
+        Displayed dimensions are sliced entirely, and the others at the index
+        of their point if in POINT mode, or over the indices of their
+        interval if in INTERVAL mode.
+        """
         slice_list = []
         for axis in range(self.ndim):
             if axis in self.displayed:
                 slice_list.append(slice(None))
+            elif self.mode[axis] == DimsMode.INTERVAL:
+                slice_list.append(
+                    self._interval_to_slice(axis, self.interval[axis])
+                )
             else:
-                if self.clip:
-                    p = np.clip(
-                        self.point[axis],
-                        np.round(self.range[axis][0]),
-                        np.round(self.range[axis][1]) - 1,
-                    )
-                else:
-                    p = self.point[axis]
-                p = np.round(p / self.range[axis][2]).astype(int)
-                slice_list.append(p)
+                slice_list.append(self._point_to_index(axis, self.point[axis]))
         return tuple(slice_list)
 
+    def _point_to_index(self, axis, point):
+        """Convert a point along an axis to the index used to slice arrays.
+
+        Parameters
+        ----------
+        axis : int
+            Dimension index.
+        point : int or float
+            Value of the point.
+
+        Returns
+        -------
+        index : int
+            Index of the point along the axis.
+        """
+        if self.clip:
+            point = np.clip(
+                point,
+                np.round(self.range[axis][0]),
+                np.round(self.range[axis][1]) - 1,
+            )
+        return np.round(point / self.range[axis][2]).astype(int)
+
+    def _interval_to_slice(self, axis, interval):
+        """Convert an interval along an axis to the slice used to slice arrays.
+
+        Parameters
+        ----------
+        axis : int
+            Dimension index.
+        interval : 2-tuple of int or float
+            Values of the (min, max) of the interval, max excluded.
+
+        Returns
+        -------
+        indices : slice
+            Slice of the indices of the interval along the axis, with at least
+            one index.
+        """
+        low, high = interval
+        step = self.range[axis][2]
+        start = int(np.round(low / step))
+        stop = int(np.round(high / step))
+        if self.clip:
+            first = int(np.round(self.range[axis][0] / step))
+            last = int(np.round(self.range[axis][1] / step))
+            start = int(np.clip(start, first, last - 1))
+            stop = int(np.clip(stop, first, last))
+        return slice(start, max(stop, start + 1))
+
     @property
     def ndisplay(self):
         """Int: Number of displayed dimensions."""
@@ -131,6 +131,31 @@ def test_indices():
     assert dims.indices == (1, 2) + (slice(None, None, None),) * 2
 
 
+def test_interval_indices():
+    """
+    Test indices of dims in interval mode.
+    """
+    dims = Dims(4)
+    dims.set_range(0, (0, 10, 1))
+    dims.set_range(1, (0, 20, 2))
+    dims.set_interval(0, (2, 6))
+    dims.set_interval(1, (4, 12))
+    # intervals are ignored in point mode
+    assert dims.indices == (0, 0) + (slice(None, None, None),) * 2
+
+    dims.set_mode(0, DimsMode.INTERVAL)
+    dims.set_mode(1, DimsMode.INTERVAL)
+    assert dims.indices == (slice(2, 6), slice(2, 6)) + (slice(None),) * 2
+
+    # intervals are clipped to the range and contain at least one index
+    dims.set_interval(0, (-5, 50))
+    dims.set_interval(1, (30, 30))
+    assert dims.indices == (slice(0, 10), slice(9, 10)) + (slice(None),) * 2
+
+    # displayed dims are not sliced
+    dims.order = [2, 3, 0, 1]
+    assert dims.indices == (slice(None),) * 2 + (0, 0)
+
 def test_axis_labels():
     dims = Dims(4)
     assert dims.axis_labels == ['0', '1', '2', '3']
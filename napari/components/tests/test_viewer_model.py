@@ -1,5 +1,6 @@
 import numpy as np
 from napari.components import ViewerModel
+from napari.components.dims_constants import DimsMode
 
 
 def test_viewer_model():
@@ -315,3 +316,55 @@ def test_add_remove_layer_dims_change():
     viewer.layers.remove(layer)
     assert len(viewer.layers) == 0
     assert viewer.dims.ndim == 2
+
+
+def test_interval_projection():
+    """Test intervals of the viewer are projected by image layers only."""
+    np.random.seed(0)
+    viewer = ViewerModel()
+    data = np.random.random((10, 15, 20))
+    image = viewer.add_image(data, projection='mean')
+    points = viewer.add_points(20 * np.random.random((10, 3)))
+
+    viewer.dims.set_interval(0, (2, 6))
+    viewer.dims.set_mode(0, DimsMode.INTERVAL)
+    assert image.dims.mode[0] == DimsMode.INTERVAL
+    assert image.dims.indices[0] == slice(2, 6)
+    np.testing.assert_allclose(image._data_view, data[2:6].mean(axis=0))
+    assert points.dims.mode[0] == DimsMode.POINT
+
+    viewer.dims.set_mode(0, DimsMode.POINT)
+    np.testing.assert_allclose(image._data_view, data[0])
+
+
+def test_update_layers_refresh_once():
+    """Test dims changes refresh each layer once, and only if sliced anew."""
+    np.random.seed(0)
+    viewer = ViewerModel()
+    layers = [
+        viewer.add_image(np.random.random((10, 15, 20))),
+        viewer.add_points(20 * np.random.random((10, 3))),
+    ]
+    refreshes = {layer.name: 0 for layer in layers}
+
+    def count(event):
+        refreshes[event.source.name] += 1
+
+    for layer in layers:
+        layer.events.set_data.connect(count)
+
+    viewer.dims.ndisplay = 3
+    assert list(refreshes.values()) == [1, 1]
+
+    # the order changes the transpose of the displayed dimensions
+    viewer.dims.order = [0, 2, 1]
+    assert list(refreshes.values()) == [2, 2]
+
+    viewer.dims.ndisplay = 2
+    viewer.dims.set_point(0, 4)
+    assert list(refreshes.values()) == [4, 4]
+
+    # moving the point within a slice does not slice the layers again
+    viewer.dims.set_point(0, 4.2)
+    assert list(refreshes.values()) == [4, 4]
+    assert layers[0].dims.point[0] == 4.2
@@ -403,6 +403,7 @@ class ViewerModel(KeymapMixin):
         rendering='mip',
         iso_threshold=0.5,
         attenuation=0.5,
+        projection='max',
         name=None,
         metadata=None,
         scale=None,
@@ -462,6 +463,9 @@ class ViewerModel(KeymapMixin):
             Threshold for isosurface.
         attenuation : float
             Attenuation rate for attenuated maximum intensity projection.
+        projection : str
+            Reduction used to project the data over the intervals of dimensions
+            in INTERVAL mode. One of {'max', 'min', 'mean', 'sum'}.
         name : str
             Name of the layer.
         metadata : dict
@@ -510,6 +514,7 @@ class ViewerModel(KeymapMixin):
                 rendering=rendering,
                 iso_threshold=iso_threshold,
                 attenuation=attenuation,
+                projection=projection,
                 name=name,
                 metadata=metadata,
                 scale=scale,
@@ -570,6 +575,7 @@ class ViewerModel(KeymapMixin):
                     gamma=_gamma,
                     interpolation=interpolation,
                     rendering=rendering,
+                    projection=projection,
                     name=name,
                     metadata=metadata,
                     scale=scale,
@@ -1021,26 +1027,58 @@ class ViewerModel(KeymapMixin):
         layers = layers or self.layers
 
         for layer in layers:
-            # adjust the order of the global dims based on the number of
-            # dimensions that a layer has - for example a global order of
-            # [2, 1, 0, 3] -> [0, 1] for a layer that only has two dimesnions
-            # or -> [1, 0, 2] for a layer with three as that corresponds to
-            # the relative order of the last two and three dimensions
-            # respectively
-            offset = self.dims.ndim - layer.dims.ndim
-            order = np.array(self.dims.order)
-            if offset <= 0:
-                order = list(range(-offset)) + list(order - offset)
-            else:
-                order = list(order[order >= offset] - offset)
-            layer.dims.order = order
-            layer.dims.ndisplay = self.dims.ndisplay
-
-            # Update the point values of the layers for the dimensions that
-            # the layer has
-            for axis in range(layer.dims.ndim):
-                point = self.dims.point[axis + offset]
-                layer.dims.set_point(axis, point)
+            # each change of the dims of the layer requests a refresh, which
+            # are merged into at most one once all of them are applied
+            with layer._batch_refresh():
+                self._update_layer_dims(layer)
+
+    def _update_layer_dims(self, layer):
+        """Set the order, ndisplay, points and intervals of a layer's dims.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            Layer to update.
+        """
+        # adjust the order of the global dims based on the number of
+        # dimensions that a layer has - for example a global order of
+        # [2, 1, 0, 3] -> [0, 1] for a layer that only has two dimesnions
+        # or -> [1, 0, 2] for a layer with three as that corresponds to
+        # the relative order of the last two and three dimensions
+        # respectively
+        offset = self.dims.ndim - layer.dims.ndim
+        order = np.array(self.dims.order)
+        if offset <= 0:
+            order = list(range(-offset)) + list(order - offset)
+        else:
+            order = list(order[order >= offset] - offset)
+        layer.dims.order = order
+        layer.dims.ndisplay = self.dims.ndisplay
+
+        # Update the point values of the layers for the dimensions that
+        # the layer has, and the intervals of layers that project them
+        for axis in range(layer.dims.ndim):
+            point = self.dims.point[axis + offset]
+            layer.dims.set_point(axis, point)
+            if layer._projectable:
+                interval = self.dims.interval[axis + offset]
+                layer.dims.set_interval(axis, interval)
+                layer.dims.set_mode(axis, self.dims.mode[axis + offset])
+
+    def _prefetch_slices(self, axis, points):
+        """Prefetch the slices of all layers at upcoming points along an axis.
+
+        Parameters
+        ----------
+        axis : int
+            Dimension index of the viewer.
+        points : tuple of int or float
+            Upcoming values of the point along the axis, in order.
+        """
+        for layer in self.layers:
+            layer_axis = axis - (self.dims.ndim - layer.dims.ndim)
+            if layer_axis >= 0:
+                layer._prefetch_points(layer_axis, points)
 
     def _update_active_layer(self, event):
         """Set the active layer by iterating over the layers list and
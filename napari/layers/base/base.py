@@ -89,6 +89,28 @@ class Layer(KeymapMixin, ABC):
     scale_factor : float
         Conversion factor from canvas coordinates to image coordinates, which
         depends on the current zoom level.
+    _slicer : object or None
+        Slicing engine used to load view slices asynchronously. Must provide
+        a `submit(layer, task)` method. If None, slicing is synchronous.
+    _thumbnail_stale : bool
+        Flag if the thumbnail is out of date with the view slice, in which
+        case it is rendered the next time it is read.
+    _thumbnailer : object or None
+        Service rendering thumbnails at a limited rate. Must provide a
+        `request(layer)` method. If None, thumbnails are rendered when read.
+    _projectable : bool
+        Flag if the layer can project its data over the intervals of dims in
+        INTERVAL mode. The viewer only sets the mode and interval of the dims
+        of layers that can, and slices the others at the point of each dims.
+    _refresh_batches : int
+        Number of nested `_batch_refresh` contexts the layer is in. While
+        positive, refreshes are deferred to the end of the outermost one.
+    _refresh_pending : bool
+        Flag if a refresh was requested within a `_batch_refresh` context.
+    _view_slice_key : tuple or None
+        Slice key of the dims when the layer was last sliced, see
+        `_slice_key`. Changes of the dims that keep the same key do not
+        slice the layer again.
 
     Notes
     -----
@@ -98,9 +120,15 @@ class Layer(KeymapMixin, ABC):
 
     May define the following:
         * `_set_view_slice(indices)`: called to set currently viewed slice
+        * `_slice_task()`: returns a callable that loads the current slice
+          off the main thread, whose result is passed to `_apply_slice`
+        * `_thumbnail_task()`: returns a callable that renders the thumbnail
+          off the main thread, whose result is set as the `thumbnail`
         * `_basename()`: base/default name of the layer
     """
 
+    _projectable = False
+
     def __init__(
         self,
         ndim,
@@ -128,6 +156,10 @@ class Layer(KeymapMixin, ABC):
         self._interactive = True
         self._value = None
         self.scale_factor = 1
+        self._slicer = None
+        self._refresh_batches = 0
+        self._refresh_pending = False
+        self._view_slice_key = None
 
         self.dims = Dims(ndim)
         if scale is None:
@@ -148,6 +180,8 @@ class Layer(KeymapMixin, ABC):
 
         self._thumbnail_shape = (32, 32, 4)
         self._thumbnail = np.zeros(self._thumbnail_shape, dtype=np.uint8)
+        self._thumbnail_stale = False
+        self._thumbnailer = None
         self._update_properties = True
         self._name = ''
         self.events = EmitterGroup(
@@ -176,10 +210,10 @@ class Layer(KeymapMixin, ABC):
 
         self.events.data.connect(lambda e: self._set_editable())
         self.dims.events.ndisplay.connect(lambda e: self._set_editable())
-        self.dims.events.order.connect(self.refresh)
+        self.dims.events.order.connect(self._refresh_dims)
         self.dims.events.ndisplay.connect(self._update_dims)
         self.dims.events.order.connect(self._update_dims)
-        self.dims.events.axis.connect(self.refresh)
+        self.dims.events.axis.connect(self._refresh_dims)
 
         self.mouse_move_callbacks = []
         self.mouse_drag_callbacks = []
@@ -226,7 +260,7 @@ class Layer(KeymapMixin, ABC):
             )
 
         self._opacity = opacity
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.status = format_float(self.opacity)
         self.events.opacity()
 
@@ -265,7 +299,7 @@ class Layer(KeymapMixin, ABC):
     @visible.setter
     def visible(self, visibility):
         self._visible = visibility
-        self.refresh()
+        self._refresh_view()
         self.events.visible()
         if self.visible:
             self.editable = self._set_editable()
@@ -380,8 +414,11 @@ class Layer(KeymapMixin, ABC):
         for i, r in enumerate(curr_range):
             self.dims.set_range(i, r)
 
-        self.refresh()
-        self._update_coordinates()
+        self._refresh_view()
+        if self._refresh_batches == 0:
+            # deferred refreshes update the coordinates once the view slice
+            # matches the new dims
+            self._update_coordinates()
 
     @property
     @abstractmethod
@@ -438,6 +475,10 @@ class Layer(KeymapMixin, ABC):
     @property
     def thumbnail(self):
         """array: Integer array of thumbnail for the layer"""
+        if self._thumbnail_stale:
+            self._thumbnail_stale = False
+            with self.events.thumbnail.blocker():
+                self._update_thumbnail()
         return self._thumbnail
 
     @thumbnail.setter
@@ -462,8 +503,34 @@ class Layer(KeymapMixin, ABC):
         thumbnail = thumbnail * f_dest + background * f_source
 
         self._thumbnail = thumbnail.astype(np.uint8)
+        self._thumbnail_stale = False
         self.events.thumbnail()
 
+    def _invalidate_thumbnail(self):
+        """Mark the thumbnail as out of date without rendering it.
+
+        If the layer has a thumbnailer the thumbnail is requested from it,
+        otherwise it is rendered the next time it is read, so views that are
+        not displaying it do not pay for it.
+        """
+        self._thumbnail_stale = True
+        if self._thumbnailer is not None:
+            self._thumbnailer.request(self)
+        else:
+            self.events.thumbnail()
+
+    def _thumbnail_task(self):
+        """Callable rendering the thumbnail off the main thread.
+
+        Returns
+        -------
+        task : callable or None
+            Callable taking no arguments that returns the thumbnail, or None
+            if the thumbnail must be rendered on the main thread by
+            `_update_thumbnail`.
+        """
+        return None
+
     @property
     def ndim(self):
         """int: Number of dimensions in the data."""
@@ -593,15 +660,123 @@ class Layer(KeymapMixin, ABC):
         """
         pass
 
+    def _slice_task(self):
+        """Get a callable that loads the current view slice.
+
+        Layers whose slicing can be done off the main thread return a
+        callable taking no arguments. It is run by the slicer on a worker
+        thread and its result is later passed to `_apply_slice` on the main
+        thread. If it returns a generator, each slice it yields is applied
+        in turn, so that a coarse slice can be shown while the full one is
+        loaded.
+
+        Returns
+        -------
+        task : callable or None
+            Callable loading the slice, or None if the layer must be sliced
+            synchronously.
+        """
+        return None
+
+    def _apply_slice(self, loaded):
+        """Set the view slice from the result of a slice task.
+
+        Parameters
+        ----------
+        loaded : object
+            Result of calling the callable returned by `_slice_task`.
+        """
+        raise NotImplementedError()
+
+    def _prefetch_points(self, axis, points):
+        """Prefetch the slices at upcoming points along an axis.
+
+        Called during playback so that layers with lazily loaded data can
+        read upcoming slices ahead of time. Does nothing by default.
+
+        Parameters
+        ----------
+        axis : int
+            Dimension index of the layer.
+        points : tuple of int or float
+            Upcoming values of the point along the axis, in order.
+        """
+        pass
+
+    @contextmanager
+    def _batch_refresh(self):
+        """Refresh the layer at most once for the changes made in the context.
+
+        Refreshes requested within the context, such as the one triggered by
+        each change of the dims, are deferred to its end and merged into a
+        single one. It is skipped if the slice key is the same as when the
+        layer was last sliced.
+        """
+        self._refresh_batches += 1
+        try:
+            yield
+        finally:
+            self._refresh_batches -= 1
+        if self._refresh_batches == 0 and self._refresh_pending:
+            self._refresh_pending = False
+            if self._slice_key() != self._view_slice_key:
+                self._refresh_view()
+
+    def _slice_key(self):
+        """Cheap key identifying the view slice of the layer.
+
+        Layers whose view slice depends on more than their dims, such as the
+        level of an image pyramid, add it to the key.
+
+        Returns
+        -------
+        key : tuple
+            Indices of the dims, along with their order and the number of
+            displayed dimensions.
+        """
+        return (
+            tuple(self.dims.indices),
+            tuple(self.dims.order),
+            self.dims.ndisplay,
+        )
+
+    def _refresh_dims(self, event=None):
+        """Refresh the layer after a change of its dims, if it changed the
+        view slice.
+        """
+        if self._slice_key() != self._view_slice_key:
+            self._refresh_view()
+
     def refresh(self, event=None):
         """Refresh all layer data based on current view slice.
         """
+        self._refresh_view()
+
+    def _refresh_view(self):
+        """Slice the layer again, keeping anything it caches about its data.
+
+        Used internally when the data is known to be unchanged, while
+        `refresh` can also be called after the data was edited in place.
+        """
+        if self._refresh_batches > 0:
+            self._refresh_pending = True
+            return
         if self.visible:
+            self._view_slice_key = self._slice_key()
+            if self._slicer is not None:
+                task = self._slice_task()
+                if task is not None:
+                    self._slicer.submit(self, task)
+                    return
             self._set_view_slice()
-            self.events.set_data()
-            self._update_thumbnail()
-            self._update_coordinates()
-            self._set_highlight(force=True)
+            self._on_view_slice()
+
+    def _on_view_slice(self):
+        """Update everything that depends on a newly set view slice."""
+        self.events.set_data()
+        self._invalidate_thumbnail()
+        self._update_coordinates()
+        self._set_highlight(force=True)
 
     def _update_coordinates(self):
         """Insert the cursor position into the correct position in the
@@ -610,6 +785,10 @@ class Layer(KeymapMixin, ABC):
         coords = list(self.dims.indices)
         for d, p in zip(self.dims.displayed, self.position):
             coords[d] = p
+        for d in self.dims.not_displayed:
+            if isinstance(coords[d], slice):
+                # projected dimensions are located at the interval start
+                coords[d] = coords[d].start
         self.coordinates = tuple(coords)
         self._value = self.get_value()
         self.status = self.get_message()
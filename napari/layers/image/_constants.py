@@ -52,3 +52,18 @@ class Rendering(StringEnum):
     ISO = auto()
     MIP = auto()
     ATTENUATED_MIP = auto()
+
+
+class Projection(StringEnum):
+    """Projection: Reduction along the intervals of dims in INTERVAL mode.
+
+            * max: maximum intensity projection.
+            * min: minimum intensity projection.
+            * mean: mean of the values in the interval.
+            * sum: sum of the values in the interval.
+    """
+
+    MAX = auto()
+    MIN = auto()
+    MEAN = auto()
+    SUM = auto()
@@ -1,6 +1,8 @@
 import types
 import warnings
 from base64 import b64encode
+from functools import partial
+from operator import getitem
 from xml.etree.ElementTree import Element
 
 import numpy as np
@@ -11,10 +13,22 @@ from ...utils.colormaps import AVAILABLE_COLORMAPS
 from ...utils.event import Event
 from ...utils.status_messages import format_float
 from ..base import Layer
-from ..layer_utils import calc_data_range
+from ..layer_utils import (
+    calc_data_range,
+    calc_percentile_range,
+    is_large_lazy,
+    sample_data,
+)
 from ..intensity_mixin import IntensityVisualizationMixin
-from ._constants import Interpolation, Rendering
-from .image_utils import get_pyramid_and_rgb
+from ._constants import Interpolation, Projection, Rendering
+from .image_utils import get_pyramid_and_rgb, project
+from .slice_cache import (
+    new_cache_token,
+    prefetch_indices,
+    slice_cache,
+    slice_key,
+    tile_grid,
+)
 
 
 # Mixin must come before Layer
@@ -61,6 +75,9 @@ class Image(IntensityVisualizationMixin, Layer):
         Threshold for isosurface.
     attenuation : float
         Attenuation rate for attenuated maximum intensity projection.
+    projection : str
+        Reduction used to project the data over the intervals of dimensions
+        in INTERVAL mode. One of {'max', 'min', 'mean', 'sum'}.
     name : str
         Name of the layer.
     metadata : dict
@@ -121,6 +138,10 @@ class Image(IntensityVisualizationMixin, Layer):
         Threshold for isosurface.
     attenuation : float
         Attenuation rate for attenuated maximum intensity projection.
+    projection : str
+        Reduction used to project the data over the intervals of dimensions
+        in INTERVAL mode. One of {'max', 'min', 'mean', 'sum'}. Projections
+        are computed chunk by chunk and kept in the slice cache.
 
     Extended Summary
     ----------
@@ -128,12 +149,27 @@ class Image(IntensityVisualizationMixin, Layer):
         Image data for the currently viewed slice. Must be 2D image data, but
         can be multidimensional for RGB or RGBA images if multidimensional is
         `True`.
+    _slice_cache : SliceCache
+        Cache of sliced planes of lazy (non numpy) data, shared by all
+        layers. Planes ahead of the current one are prefetched into it when
+        moving along an axis.
+    _pyramid_method : str
+        How pixels are downsampled when a pyramid is generated for large
+        data, see `image_utils.downsample`.
+    _tile_shape : int
+        Size of the tiles that the viewed region of large pyramid levels is
+        split into. Tiles of lazy data are cached individually, so that
+        panning only reads the tiles that were not viewed before.
     _colorbar : array
         Colorbar for current colormap.
     """
 
     _colormaps = AVAILABLE_COLORMAPS
+    _projectable = True
     _max_tile_shape = 1600
+    _pyramid_method = 'mean'
+    _tile_shape = 256
+    _slice_cache = slice_cache
 
     def __init__(
         self,
@@ -148,6 +184,7 @@ class Image(IntensityVisualizationMixin, Layer):
         rendering='mip',
         iso_threshold=0.5,
         attenuation=0.5,
+        projection='max',
         name=None,
         metadata=None,
         scale=None,
@@ -160,7 +197,7 @@ class Image(IntensityVisualizationMixin, Layer):
             data = list(data)
 
         ndim, rgb, is_pyramid, data_pyramid = get_pyramid_and_rgb(
-            data, pyramid=is_pyramid, rgb=rgb
+            data, pyramid=is_pyramid, rgb=rgb, method=self._pyramid_method,
         )
 
         super().__init__(
@@ -179,6 +216,7 @@ class Image(IntensityVisualizationMixin, Layer):
             rendering=Event,
             iso_threshold=Event,
             attenuation=Event,
+            projection=Event,
         )
 
         # Set data
@@ -186,6 +224,8 @@ class Image(IntensityVisualizationMixin, Layer):
         self.rgb = rgb
         self._data = data
         self._data_pyramid = data_pyramid
+        self._cache_token = new_cache_token()
+        self._last_slice = None
         self._top_left = np.zeros(ndim, dtype=int)
         if self.is_pyramid:
             self._data_level = len(data_pyramid) - 1
@@ -206,11 +246,24 @@ class Image(IntensityVisualizationMixin, Layer):
         self._gamma = gamma
         self._iso_threshold = iso_threshold
         self._attenuation = attenuation
+        self._projection = Projection(projection)
+        # the range of large lazy data is refined as more of it is viewed
+        self._refine_range = False
         if contrast_limits is None:
-            self.contrast_limits_range = self._calc_data_range()
+            input_data = self._data_pyramid[-1] if self.is_pyramid else data
+            if is_large_lazy(input_data) and not self.rgb:
+                # read a sample once and use it for both the range and the
+                # contrast limits, which ignore outlying values
+                samples = sample_data(input_data)
+                self.contrast_limits_range = calc_data_range(samples)
+                self._contrast_limits = tuple(calc_percentile_range(samples))
+                self._refine_range = True
+            else:
+                self.contrast_limits_range = self._calc_data_range()
+                self._contrast_limits = tuple(self.contrast_limits_range)
         else:
             self.contrast_limits_range = contrast_limits
-        self._contrast_limits = tuple(self.contrast_limits_range)
+            self._contrast_limits = tuple(self.contrast_limits_range)
         self.colormap = colormap
         self.contrast_limits = self._contrast_limits
         self.interpolation = interpolation
@@ -238,12 +291,16 @@ class Image(IntensityVisualizationMixin, Layer):
     @data.setter
     def data(self, data):
         ndim, rgb, is_pyramid, data_pyramid = get_pyramid_and_rgb(
-            data, pyramid=self.is_pyramid, rgb=self.rgb
+            data,
+            pyramid=self.is_pyramid,
+            rgb=self.rgb,
+            method=self._pyramid_method,
         )
         self.is_pyramid = is_pyramid
         self.rgb = rgb
         self._data = data
         self._data_pyramid = data_pyramid
+        self._clear_slice_cache()
 
         self._update_dims()
         self.events.data()
@@ -265,7 +322,7 @@ class Image(IntensityVisualizationMixin, Layer):
         if self._data_level == level:
             return
         self._data_level = level
-        self.refresh()
+        self._refresh_view()
 
     @property
     def level_shapes(self):
@@ -297,7 +354,7 @@ class Image(IntensityVisualizationMixin, Layer):
         if np.all(self._top_left == top_left):
             return
         self._top_left = top_left.astype(int)
-        self.refresh()
+        self._refresh_view()
 
     @property
     def iso_threshold(self):
@@ -308,7 +365,7 @@ class Image(IntensityVisualizationMixin, Layer):
     def iso_threshold(self, value):
         self.status = format_float(value)
         self._iso_threshold = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.iso_threshold()
 
     @property
@@ -320,9 +377,26 @@ class Image(IntensityVisualizationMixin, Layer):
     def attenuation(self, value):
         self.status = format_float(value)
         self._attenuation = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.attenuation()
 
+    @property
+    def projection(self):
+        """str: Reduction used to project the data over the intervals of
+        dimensions in INTERVAL mode, one of {'max', 'min', 'mean', 'sum'}.
+        """
+        return str(self._projection)
+
+    @projection.setter
+    def projection(self, projection):
+        if isinstance(projection, str):
+            projection = Projection(projection)
+        if self._projection == projection:
+            return
+        self._projection = projection
+        self.events.projection()
+        self._refresh_view()
+
     @property
     def interpolation(self):
         """{
@@ -388,6 +462,7 @@ class Image(IntensityVisualizationMixin, Layer):
                 'rendering': self.rendering,
                 'iso_threshold': self.iso_threshold,
                 'attenuation': self.attenuation,
+                'projection': self.projection,
                 'gamma': self.gamma,
                 'data': self.data,
             }
@@ -412,10 +487,67 @@ class Image(IntensityVisualizationMixin, Layer):
         image = raw
         return image
 
-    def _set_view_slice(self):
-        """Set the view given the indices to slice with."""
-        not_disp = self.dims.not_displayed
+    def _slice_key(self):
+        """Cheap key identifying the view slice of the layer.
+
+        Returns
+        -------
+        key : tuple
+            Key of the dims, along with the viewed level of the pyramid and
+            the top left pixel that tiles are read around.
+        """
+        key = super()._slice_key()
+        if self.is_pyramid:
+            key = key + (self.data_level, tuple(self._top_left))
+        return key
+
+    def _slice_indices(self, level):
+        """Indices into a level of the pyramid for the current slice.
+
+        Parameters
+        ----------
+        level : int
+            Level of the pyramid to be sliced.
+
+        Returns
+        -------
+        indices : array
+            Object array of ints for the not displayed dimensions, or slices
+            for those that are projected, and slices for the displayed
+            dimensions.
+        """
+        indices = np.array(self.dims.indices)
+        for d in self.dims.not_displayed:
+            downsample = self.level_downsamples[level, d]
+            size = self.level_shapes[level, d]
+            if isinstance(indices[d], slice):
+                # keep every plane of the level overlapping the interval
+                start = indices[d].start // downsample
+                stop = np.ceil(indices[d].stop / downsample)
+                start = int(np.clip(start, 0, size - 1))
+                stop = int(np.clip(stop, start + 1, size))
+                indices[d] = slice(start, stop)
+            else:
+                index = np.round(indices[d] / downsample).astype(int)
+                indices[d] = np.clip(index, 0, size - 1)
+        return indices
+
+    def _slice_request(self):
+        """Determine what needs to be loaded to set the current view slice.
 
+        Returns
+        -------
+        request : tuple
+            The slice of the image, the slice of the thumbnail (None if the
+            same as for the image), the transpose order of the sliced data,
+            whether the image is read in tiles, the projection of the slices
+            and the view scale and translation of the sliced data. Each slice
+            is a tuple of the array to slice, its pyramid level and the
+            indices to slice it with. The projection is None, or the
+            reduction and the dimensions it projects when dimensions are in
+            INTERVAL mode. The view scale and translation are only set on the
+            layer along with the sliced data, in `_apply_slice`.
+        """
         if self.rgb:
             # if rgb need to keep the final axis fixed during the
             # transpose. The index of the final axis depends on how many
@@ -433,140 +565,509 @@ class Image(IntensityVisualizationMixin, Layer):
 
             # Slice currently viewed level
             level = self.data_level
-            indices = np.array(self.dims.indices)
-            downsampled_indices = (
-                indices[not_disp] / self.level_downsamples[level, not_disp]
-            )
-            downsampled_indices = np.round(
-                downsampled_indices.astype(float)
-            ).astype(int)
-            downsampled_indices = np.clip(
-                downsampled_indices, 0, self.level_shapes[level, not_disp] - 1
-            )
-            indices[not_disp] = downsampled_indices
+            indices = self._slice_indices(level)
 
             disp_shape = self.level_shapes[level, self.dims.displayed]
-            scale = np.ones(self.ndim)
+            scale_view = np.ones(self.ndim)
             for d in self.dims.displayed:
-                scale[d] = self.level_downsamples[self.data_level][d]
-            self._scale_view = scale
+                scale_view[d] = self.level_downsamples[level][d]
 
-            if np.any(disp_shape > self._max_tile_shape):
+            tiled = np.any(disp_shape > self._max_tile_shape)
+            if tiled:
+                # view a block of whole tiles around the top left pixel
+                size = self._tile_shape * (
+                    self._max_tile_shape // self._tile_shape
+                )
+                start = np.zeros(self.ndim, dtype=int)
                 for d in self.dims.displayed:
+                    start[d] = self._top_left[d] - (
+                        self._top_left[d] % self._tile_shape
+                    )
                     indices[d] = slice(
-                        self._top_left[d],
-                        self._top_left[d] + self._max_tile_shape,
+                        start[d],
+                        min(start[d] + size, self.level_shapes[level, d]),
                         1,
                     )
-                self._translate_view = (
-                    self._top_left * self.scale * self._scale_view
-                )
+                translate_view = start * self.scale * scale_view
             else:
-                self._translate_view = [0] * self.ndim
-
-            image = np.asarray(
-                self._data_pyramid[level][tuple(indices)]
-            ).transpose(order)
+                translate_view = np.zeros(self.ndim)
 
+            image_slice = (self._data_pyramid[level], level, tuple(indices))
             if level == len(self._data_pyramid) - 1:
-                thumbnail = image
+                thumbnail_slice = None
             else:
-                # Slice thumbnail
-                indices = np.array(self.dims.indices)
-                downsampled_indices = (
-                    indices[not_disp] / self.level_downsamples[-1, not_disp]
+                thumbnail_slice = (
+                    self._data_pyramid[-1],
+                    len(self._data_pyramid) - 1,
+                    tuple(self._slice_indices(len(self._data_pyramid) - 1)),
                 )
-                downsampled_indices = np.round(
-                    downsampled_indices.astype(float)
-                ).astype(int)
-                downsampled_indices = np.clip(
-                    downsampled_indices, 0, self.level_shapes[-1, not_disp] - 1
+        else:
+            scale_view = np.ones(self.dims.ndim)
+            translate_view = np.zeros(self.dims.ndim)
+            image_slice = (self.data, 0, self.dims.indices)
+            thumbnail_slice = None
+            tiled = False
+
+        axes = tuple(
+            d
+            for d in self.dims.not_displayed
+            if isinstance(image_slice[2][d], slice)
+        )
+        if len(axes) > 0:
+            # projections are read whole and cached, not tile by tile
+            projection = (str(self._projection), axes)
+            tiled = False
+            self._last_slice = None
+        else:
+            projection = None
+            self._prefetch(*image_slice)
+        view = (scale_view, translate_view)
+        return image_slice, thumbnail_slice, order, tiled, projection, view
+
+    def _read_projection(self, data, level, indices, projection):
+        """Read a projection of the data, going through the slice cache.
+
+        Projections are cached whatever the type of the data, as computing
+        them reads every plane of the projected intervals.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, the whole image or a level of the pyramid.
+        level : int
+            Level of the pyramid of the array, 0 if not a pyramid.
+        indices : tuple of int or slice
+            Indices used to slice the array, with slices of the intervals
+            along the projected dimensions.
+        projection : 2-tuple
+            Reduction and projected dimensions, see `_slice_request`.
+
+        Returns
+        -------
+        projected : array
+            Projected data.
+        """
+        method, axes = projection
+        key = slice_key(self._cache_token, level, indices) + (method,)
+        return self._slice_cache.load(
+            key, partial(project, data, indices, axes, method)
+        )
+
+    def _read_slice(self, data, level, indices):
+        """Read a slice of the data, going through the slice cache.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, the whole image or a level of the pyramid.
+        level : int
+            Level of the pyramid of the array, 0 if not a pyramid.
+        indices : tuple of int or slice
+            Indices used to slice the array.
+
+        Returns
+        -------
+        sliced : array
+            Sliced data.
+        """
+        if isinstance(data, np.ndarray):
+            # slicing in-memory arrays just creates a view
+            return data[indices]
+        key = slice_key(self._cache_token, level, indices)
+        return self._slice_cache.load(key, partial(getitem, data, indices))
+
+    def _prefetch(self, data, level, indices):
+        """Prefetch the slices ahead of the current one into the slice cache.
+
+        The planes ahead are along the axis that changed since the last slice,
+        in the direction it changed in.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, the whole image or a level of the pyramid.
+        level : int
+            Level of the pyramid of the array, 0 if not a pyramid.
+        indices : tuple of int or slice
+            Indices of the current slice.
+        """
+        previous = self._last_slice
+        self._last_slice = (level, indices)
+        if isinstance(data, np.ndarray) or previous is None:
+            return
+        if previous[0] != level:
+            return
+        ahead = prefetch_indices(
+            previous[1], indices, data.shape, self._slice_cache.prefetch_depth,
+        )
+        if len(ahead) == 0:
+            return
+        self._slice_cache.prefetch(
+            self._prefetch_requests(data, level, ahead),
+            group=self._cache_token,
+        )
+
+    def _prefetch_requests(self, data, level, slices):
+        """Cache keys and loaders of slices, split into tiles.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, the whole image or a level of the pyramid.
+        level : int
+            Level of the pyramid of the array, 0 if not a pyramid.
+        slices : list of tuple
+            Indices of each slice.
+
+        Returns
+        -------
+        requests : list of 2-tuple
+            Key and loader of each tile, see `SliceCache.prefetch`.
+        """
+        requests = []
+        for indices in slices:
+            for tile_indices, _ in tile_grid(indices, self._tile_shape):
+                requests.append(
+                    (
+                        slice_key(self._cache_token, level, tile_indices),
+                        partial(getitem, data, tile_indices),
+                    )
                 )
-                indices[not_disp] = downsampled_indices
-                thumbnail = np.asarray(
-                    self._data_pyramid[-1][tuple(indices)]
-                ).transpose(order)
+        return requests
+
+    def _prefetch_points(self, axis, points):
+        """Prefetch the slices at upcoming points along an axis.
+
+        The slices are the last one read with the index along `axis`
+        replaced, so they are only prefetched for the current pyramid level.
+
+        Parameters
+        ----------
+        axis : int
+            Dimension index of the layer.
+        points : tuple of int or float
+            Upcoming values of the point along the axis, in order.
+        """
+        if self._last_slice is None or axis in self.dims.displayed:
+            return
+        level, indices = self._last_slice
+        data = self._data_pyramid[level] if self.is_pyramid else self.data
+        if isinstance(data, np.ndarray):
+            return
+        slices = []
+        for point in points:
+            index = self.dims._point_to_index(axis, point)
+            if self.is_pyramid:
+                index = np.round(index / self.level_downsamples[level, axis])
+                index = np.clip(index, 0, self.level_shapes[level, axis] - 1)
+            ahead = list(indices)
+            ahead[axis] = int(index)
+            slices.append(tuple(ahead))
+        self._slice_cache.prefetch(
+            self._prefetch_requests(data, level, slices),
+            group=(self._cache_token, 'playback'),
+        )
+
+    def refresh(self, event=None):
+        """Refresh all layer data based on current view slice.
+
+        Cached slices and projections of the layer are dropped, as the data
+        might have been edited in place.
+        """
+        self._clear_slice_cache()
+        super().refresh(event)
+
+    def _clear_slice_cache(self):
+        """Remove the slices of this layer from the slice cache."""
+        self._slice_cache.clear(self._cache_token)
+        self._last_slice = None
+
+    def _read_tiles(self, data, level, indices, placeholder=None):
+        """Read a region of the data tile by tile, going through the cache.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, a level of the pyramid.
+        level : int
+            Level of the pyramid of the array.
+        indices : tuple of int or slice
+            Indices selecting the region, see `tile_grid`.
+        placeholder : array, optional
+            Data used for the tiles that are not cached yet. If None missing
+            tiles are read.
+
+        Returns
+        -------
+        region : array
+            Sliced region.
+        """
+        if placeholder is None:
+            region = np.empty(self._region_shape(data, indices), data.dtype)
         else:
-            self._scale_view = np.ones(self.dims.ndim)
-            image = np.asarray(self.data[self.dims.indices]).transpose(order)
+            region = placeholder.astype(data.dtype)
+        for tile_indices, location in tile_grid(indices, self._tile_shape):
+            key = slice_key(self._cache_token, level, tile_indices)
+            if placeholder is not None and key not in self._slice_cache:
+                continue
+            region[location] = self._slice_cache.load(
+                key, partial(getitem, data, tile_indices)
+            )
+        return region
+
+    def _missing_tiles(self, data, level, indices):
+        """Whether any tile of a region is not in the slice cache.
+
+        Parameters
+        ----------
+        data : array
+            Array being sliced, a level of the pyramid.
+        level : int
+            Level of the pyramid of the array.
+        indices : tuple of int or slice
+            Indices selecting the region, see `tile_grid`.
+
+        Returns
+        -------
+        missing : bool
+            True if at least one tile needs to be read.
+        """
+        return any(
+            slice_key(self._cache_token, level, tile_indices)
+            not in self._slice_cache
+            for tile_indices, _ in tile_grid(indices, self._tile_shape)
+        )
+
+    def _region_shape(self, data, indices):
+        """Shape of the array obtained by slicing data with indices."""
+        shape = []
+        for size, index in zip(data.shape, indices):
+            if isinstance(index, slice):
+                shape.append(len(range(*index.indices(size))))
+        return tuple(shape) + data.shape[len(indices) :]
+
+    def _upsample(self, coarse, coarse_level, data, level, indices):
+        """Upsample a slice of a lower resolution level onto a region.
+
+        Parameters
+        ----------
+        coarse : array or None
+            Slice of the lower resolution level, covering the whole displayed
+            extent. If None the region is filled with zeros.
+        coarse_level : int
+            Level of the pyramid of `coarse`.
+        data : array
+            Array being sliced, a level of the pyramid.
+        level : int
+            Level of the pyramid of the array.
+        indices : tuple of int or slice
+            Indices selecting the region, with bounded slices along the
+            displayed axes.
+
+        Returns
+        -------
+        region : array
+            Nearest neighbour upsampling of `coarse` onto the region.
+        """
+        if coarse is None:
+            return np.zeros(self._region_shape(data, indices), data.dtype)
+        coords = []
+        for d, index in enumerate(indices):
+            if not isinstance(index, slice):
+                continue
+            ratio = (
+                self.level_downsamples[level, d]
+                / self.level_downsamples[coarse_level, d]
+            )
+            points = np.arange(*index.indices(data.shape[d])) * ratio
+            coords.append(
+                np.clip(points.astype(int), 0, coarse.shape[len(coords)] - 1)
+            )
+        return coarse[np.ix_(*coords)]
+
+    def _load_slice(self, request, placeholder=False):
+        """Load the data requested by `_slice_request`.
+
+        Only reads from the layer data and the thread-safe slice cache, so it
+        is safe to call off the main thread.
+
+        Parameters
+        ----------
+        request : tuple
+            Request returned by `_slice_request`.
+        placeholder : bool
+            If True tiles that are not cached yet are not read, and are
+            replaced by the upsampled thumbnail instead.
+
+        Returns
+        -------
+        loaded : 3-tuple
+            Sliced image, sliced thumbnail and the view scale and translation
+            of the sliced data.
+        """
+        (
+            image_slice,
+            thumbnail_slice,
+            order,
+            tiled,
+            projection,
+            view,
+        ) = request
+        if thumbnail_slice is None:
+            coarse = None
+        elif projection is not None:
+            coarse = self._read_projection(*thumbnail_slice, projection)
+        else:
+            coarse = np.asarray(self._read_slice(*thumbnail_slice))
+
+        if projection is not None:
+            image = self._read_projection(*image_slice, projection)
+        elif tiled and not isinstance(image_slice[0], np.ndarray):
+            fill = None
+            if placeholder:
+                fill = self._upsample(
+                    coarse,
+                    None if coarse is None else thumbnail_slice[1],
+                    *image_slice,
+                )
+            image = self._read_tiles(*image_slice, placeholder=fill)
+        else:
+            image = np.asarray(self._read_slice(*image_slice))
+        image = image.transpose(order)
+
+        if coarse is None:
             thumbnail = image
+        else:
+            thumbnail = coarse.transpose(order)
+        return image, thumbnail, view
+
+    def _slice_task(self):
+        request = self._slice_request()
+        image_slice, _, _, tiled, _, _ = request
+        if tiled and not isinstance(image_slice[0], np.ndarray):
+            if not self._missing_tiles(*image_slice):
+                # every tile is cached, so slicing is fast
+                return None
+            return partial(self._load_refined, request)
+        return partial(self._load_slice, request)
 
+    def _load_refined(self, request):
+        """Load a placeholder of the requested slice, then the slice itself.
+
+        The placeholder shows the cached tiles, and the upsampled thumbnail
+        in place of the missing ones, until all tiles have been read.
+
+        Parameters
+        ----------
+        request : tuple
+            Request returned by `_slice_request`.
+
+        Yields
+        ------
+        loaded : 3-tuple
+            Placeholder of the slice, then the slice, as loaded by
+            `_load_slice`.
+        """
+        yield self._load_slice(request, placeholder=True)
+        yield self._load_slice(request)
+
+    def _apply_slice(self, loaded):
+        image, thumbnail, (scale_view, translate_view) = loaded
+        # the transform of the view changes together with the data it places
+        self._scale_view = scale_view
+        self._translate_view = translate_view
         if self.rgb and image.dtype.kind == 'f':
             self._data_raw = np.clip(image, 0, 1)
             self._data_view = self._raw_to_displayed(self._data_raw)
-            self._data_thumbnail = self._raw_to_displayed(
-                np.clip(thumbnail, 0, 1)
-            )
-
+            if thumbnail is not image:
+                thumbnail = np.clip(thumbnail, 0, 1)
         else:
             self._data_raw = image
             self._data_view = self._raw_to_displayed(self._data_raw)
+        if thumbnail is image:
+            # the view is only mapped once when there is no coarser level
+            self._data_thumbnail = self._data_view
+        else:
             self._data_thumbnail = self._raw_to_displayed(thumbnail)
 
+        if self._refine_range:
+            self._refine_data_range(image)
+
         if self.is_pyramid:
             self.events.scale()
             self.events.translate()
 
+    def _refine_data_range(self, image):
+        """Expand the contrast limits range to the values of a new slice.
+
+        Parameters
+        ----------
+        image : array
+            Newly sliced data.
+        """
+        if image.size == 0:
+            return
+        # the slice is in memory already, so use its exact range
+        low, high = float(np.min(image)), float(np.max(image))
+        current = self.contrast_limits_range
+        if low < current[0] or high > current[1]:
+            self.contrast_limits_range = [
+                min(low, current[0]),
+                max(high, current[1]),
+            ]
+
+    def _set_view_slice(self):
+        """Set the view given the indices to slice with."""
+        self._apply_slice(self._load_slice(self._slice_request()))
+
     def _update_thumbnail(self):
         """Update thumbnail with current image data and colormap."""
-        if self.dims.ndisplay == 3 and self.dims.ndim > 2:
-            image = np.max(self._data_thumbnail, axis=0)
-        else:
-            image = self._data_thumbnail
+        self.thumbnail = self._thumbnail_task()()
 
-        # float16 not supported by ndi.zoom
-        dtype = np.dtype(image.dtype)
-        if dtype in [np.dtype(np.float16)]:
-            image = image.astype(np.float32)
-
-        raw_zoom_factor = np.divide(
-            self._thumbnail_shape[:2], image.shape[:2]
-        ).min()
-        new_shape = np.clip(
-            raw_zoom_factor * np.array(image.shape[:2]),
-            1,  # smallest side should be 1 pixel wide
-            self._thumbnail_shape[:2],
-        )
-        zoom_factor = tuple(new_shape / image.shape[:2])
-        if self.rgb:
-            # warning filter can be removed with scipy 1.4
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                downsampled = ndi.zoom(
-                    image, zoom_factor + (1,), prefilter=False, order=0
-                )
-            if image.shape[2] == 4:  # image is RGBA
-                colormapped = np.copy(downsampled)
-                colormapped[..., 3] = downsampled[..., 3] * self.opacity
-                if downsampled.dtype == np.uint8:
-                    colormapped = colormapped.astype(np.uint8)
-            else:  # image is RGB
-                if downsampled.dtype == np.uint8:
-                    alpha = np.full(
-                        downsampled.shape[:2] + (1,),
-                        int(255 * self.opacity),
-                        dtype=np.uint8,
-                    )
-                else:
-                    alpha = np.full(downsampled.shape[:2] + (1,), self.opacity)
-                colormapped = np.concatenate([downsampled, alpha], axis=2)
-        else:
-            # warning filter can be removed with scipy 1.4
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                downsampled = ndi.zoom(
-                    image, zoom_factor, prefilter=False, order=0
-                )
-            low, high = self.contrast_limits
-            downsampled = np.clip(downsampled, low, high)
-            color_range = high - low
-            if color_range != 0:
-                downsampled = (downsampled - low) / color_range
-            downsampled = downsampled ** self.gamma
-            color_array = self.colormap[1][downsampled.ravel()]
-            colormapped = color_array.rgba.reshape(downsampled.shape + (4,))
-            colormapped[..., 3] *= self.opacity
-        self.thumbnail = colormapped
+    def _thumbnail_task(self):
+        """Callable rendering the thumbnail from the current view.
+
+        The image and display settings are captured when the task is made, so
+        the task can run off the main thread.
+
+        Returns
+        -------
+        task : callable
+            Callable taking no arguments that returns the colormapped
+            thumbnail.
+        """
+        image = self._data_thumbnail
+        project = self.dims.ndisplay == 3 and self.dims.ndim > 2
+        rgb = self.rgb
+        thumbnail_shape = self._thumbnail_shape[:2]
+        opacity = self.opacity
+        contrast_limits = self.contrast_limits
+        gamma = self.gamma
+        colormap = self.colormap[1]
+
+        # Only read about one pixel of the view per pixel of the thumbnail
+        spatial = image.shape[-3:-1] if rgb else image.shape[-2:]
+        stride = np.maximum(np.floor_divide(spatial, thumbnail_shape), 1)
+        strided = (Ellipsis, slice(None, None, stride[0]))
+        strided += (slice(None, None, stride[1]),)
+        if rgb:
+            strided += (slice(None),)
+
+        def task():
+            view = image[strided]
+            if project:
+                view = np.max(view, axis=0)
+            return _render_thumbnail(
+                view,
+                rgb,
+                thumbnail_shape,
+                opacity,
+                contrast_limits,
+                gamma,
+                colormap,
+            )
+
+        return task
 
     def _get_value(self):
         """Returns coordinates, values, and a string for a given mouse position
@@ -626,3 +1127,83 @@ class Image(IntensityVisualizationMixin, Layer):
             'image', width=width, height=height, opacity=opacity, **props
         )
         return [xml]
+
+
+def _render_thumbnail(
+    image, rgb, thumbnail_shape, opacity, contrast_limits, gamma, colormap
+):
+    """Downsample and colormap an image to fit a thumbnail.
+
+    Parameters
+    ----------
+    image : array
+        2D image, with a trailing channel axis if `rgb` is True.
+    rgb : bool
+        Whether the image is RGB or RGBA.
+    thumbnail_shape : tuple of int
+        Height and width of the thumbnail.
+    opacity : float
+        Opacity of the thumbnail.
+    contrast_limits : list of float
+        Contrast limits of a non-RGB image.
+    gamma : float
+        Gamma of a non-RGB image.
+    colormap : vispy.color.Colormap
+        Colormap of a non-RGB image.
+
+    Returns
+    -------
+    colormapped : array
+        RGBA thumbnail that fits in `thumbnail_shape`.
+    """
+    # float16 not supported by ndi.zoom
+    dtype = np.dtype(image.dtype)
+    if dtype in [np.dtype(np.float16)]:
+        image = image.astype(np.float32)
+
+    raw_zoom_factor = np.divide(thumbnail_shape, image.shape[:2]).min()
+    new_shape = np.clip(
+        raw_zoom_factor * np.array(image.shape[:2]),
+        1,  # smallest side should be 1 pixel wide
+        thumbnail_shape,
+    )
+    zoom_factor = tuple(new_shape / image.shape[:2])
+    if rgb:
+        # warning filter can be removed with scipy 1.4
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            downsampled = ndi.zoom(
+                image, zoom_factor + (1,), prefilter=False, order=0
+            )
+        if image.shape[2] == 4:  # image is RGBA
+            colormapped = np.copy(downsampled)
+            colormapped[..., 3] = downsampled[..., 3] * opacity
+            if downsampled.dtype == np.uint8:
+                colormapped = colormapped.astype(np.uint8)
+        else:  # image is RGB
+            if downsampled.dtype == np.uint8:
+                alpha = np.full(
+                    downsampled.shape[:2] + (1,),
+                    int(255 * opacity),
+                    dtype=np.uint8,
+                )
+            else:
+                alpha = np.full(downsampled.shape[:2] + (1,), opacity)
+            colormapped = np.concatenate([downsampled, alpha], axis=2)
+    else:
+        # warning filter can be removed with scipy 1.4
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            downsampled = ndi.zoom(
+                image, zoom_factor, prefilter=False, order=0
+            )
+        low, high = contrast_limits
+        downsampled = np.clip(downsampled, low, high)
+        color_range = high - low
+        if color_range != 0:
+            downsampled = (downsampled - low) / color_range
+        downsampled = downsampled ** gamma
+        color_array = colormap[downsampled.ravel()]
+        colormapped = color_array.rgba.reshape(downsampled.shape + (4,))
+        colormapped[..., 3] *= opacity
+    return colormapped
@@ -1,5 +1,7 @@
+import dask.array as da
 import numpy as np
-from scipy import ndimage as ndi
+
+from .pyramid_cache import pyramid_cache
 
 
 def guess_rgb(shape):
@@ -64,11 +66,127 @@ def should_be_pyramid(shape):
     return np.log2(shape) >= 13
 
 
-def fast_pyramid(data, downscale=2, max_layer=None):
-    """Compute fast image pyramid.
+def _mode(x, axis=None):
+    """Most common value over axes, used as a reduction by `da.coarsen`.
+
+    Parameters
+    ----------
+    x : array
+        Data to reduce.
+    axis : tuple of int, optional
+        Axes to reduce over. If None reduces over all axes.
+
+    Returns
+    -------
+    mode : array
+        Most common value over the axes. Ties are resolved in favor of the
+        value coming first.
+    """
+    axis = tuple(range(x.ndim)) if axis is None else tuple(axis)
+    keep = [i for i in range(x.ndim) if i not in axis]
+    x = x.transpose(keep + list(axis))
+    x = x.reshape(x.shape[: len(keep)] + (-1,))
+    counts = (x[..., :, None] == x[..., None, :]).sum(axis=-1)
+    index = counts.argmax(axis=-1)[..., None]
+    return np.take_along_axis(x, index, axis=-1)[..., 0]
+
+
+_reductions = {'mean': np.mean, 'mode': _mode}
+
+
+def downsample(data, factors, method='mean'):
+    """Lazily downsample an array by integer factors, chunk by chunk.
+
+    Parameters
+    ----------
+    data : dask.array.Array
+        Data to downsample.
+    factors : tuple of int
+        Downsampling factor along each axis. Trailing values of each axis
+        that do not fill a whole block are dropped.
+    method : {'mean', 'mode'}
+        How blocks are reduced to a single value. Use 'mode' for label
+        images, where averaging would create labels that do not exist.
+
+    Returns
+    -------
+    downsampled : dask.array.Array
+        Downsampled data, with the same dtype as the input.
+    """
+    if method not in _reductions:
+        raise ValueError(
+            f"method must be one of {set(_reductions)}, got {method}"
+        )
+    # chunks must be multiples of the factors to be reduced independently
+    chunks = tuple(max(f, c - c % f) for c, f in zip(data.chunksize, factors))
+    data = data.rechunk(chunks)
+    downsampled = da.coarsen(
+        _reductions[method],
+        data,
+        {axis: f for axis, f in enumerate(factors)},
+        trim_excess=True,
+    )
+    if np.issubdtype(data.dtype, np.integer) and method == 'mean':
+        downsampled = da.round(downsampled)
+    return downsampled.astype(data.dtype)
+
+
+_projections = {'max': da.max, 'min': da.min, 'mean': da.mean, 'sum': da.sum}
+
+
+def project(data, indices, axes, method='max'):
+    """Project a region of an array along some of its axes, chunk by chunk.
+
+    The region is reduced by dask's threaded scheduler, so that it is
+    streamed through memory one chunk at a time and reduced in parallel.
+    Data that is not a dask array is wrapped in one, with chunks aligned to
+    those of the data if it has any.
+
+    Parameters
+    ----------
+    data : array
+        Data to project.
+    indices : tuple of int or slice
+        Indices selecting the region to project.
+    axes : tuple of int
+        Axes of the data to project along. They must be sliced by `indices`.
+    method : {'max', 'min', 'mean', 'sum'}
+        How values are reduced along the axes. Means of integer data are
+        rounded to the dtype of the data.
+
+    Returns
+    -------
+    projected : np.ndarray
+        Projected region, without the projected axes.
+    """
+    if method not in _projections:
+        raise ValueError(
+            f"method must be one of {set(_projections)}, got {method}"
+        )
+    if not isinstance(data, da.Array):
+        data = da.from_array(data, chunks='auto', name=False)
+    # position of each axis in the region, where integer indices drop axes
+    kept = [
+        axis
+        for axis in range(data.ndim)
+        if axis >= len(indices) or isinstance(indices[axis], slice)
+    ]
+    region_axes = tuple(kept.index(axis) for axis in axes)
+    projected = _projections[method](data[indices], axis=region_axes)
+    if method == 'mean' and np.issubdtype(data.dtype, np.integer):
+        projected = da.round(projected).astype(data.dtype)
+    return np.asarray(projected.compute(scheduler='threads'))
+
+
+def build_pyramid(
+    data, downscale=2, max_layer=None, method='mean', store=None
+):
+    """Compute an image pyramid by chunked, parallel downsampling.
 
-    In the interest of speed this method subsamples, rather than downsamples,
-    the input image.
+    Each level is computed from the previous one, chunk by chunk, by dask's
+    threaded scheduler. In-memory (numpy) data gives in-memory levels, other
+    data such as dask or zarr arrays gives lazy levels that are only read
+    when sliced.
 
     Parameters
     ----------
@@ -79,27 +197,65 @@ def fast_pyramid(data, downscale=2, max_layer=None):
         must be provided for every axis of the array.
     max_layer : int, optional
         The maximum number of layers of the pyramid to be created.
+    method : {'mean', 'mode'}
+        How blocks of pixels are downsampled, see `downsample`.
+    store : str, optional
+        Path of a zarr group in which the levels are saved. Levels already
+        saved there by a previous call with the same data shape and dtype,
+        downscale and method are reused instead of being computed again.
 
     Returns
     -------
     pyramid : list
         List of arrays where each array is a level of the generated pyramid.
     """
-
     if max_layer is None:
         max_layer = np.floor(np.log2(np.max(data.shape))).astype(int) + 1
 
-    zoom_factor = np.divide(1, downscale)
+    factors = np.broadcast_to(downscale, (data.ndim,)).astype(int)
+    factors = tuple(int(f) for f in factors)
+    in_memory = isinstance(data, np.ndarray)
+    if store is not None:
+        import zarr
+
+        attrs = {
+            'shape': list(data.shape),
+            'dtype': str(np.dtype(data.dtype)),
+            'downscale': list(factors),
+            'method': method,
+        }
+        group = zarr.open_group(store, mode='a')
+        saved = dict(group.attrs)
+        # number of levels completely written by previous calls
+        complete = saved.pop('levels', 0)
+        if saved != attrs:
+            # levels were saved for other data, so start over
+            group.clear()
+            group.attrs.put(attrs)
+            complete = 0
 
     pyramid = [data]
-    for i in range(max_layer - 1):
-        pyramid.append(
-            ndi.zoom(pyramid[i], zoom_factor, prefilter=False, order=0)
-        )
+    level = data if isinstance(data, da.Array) else da.from_array(data)
+    for i in range(1, max_layer):
+        if np.any(np.less(level.shape, factors)):
+            break
+        level = downsample(level, factors, method=method)
+        if store is not None:
+            if i > complete:
+                level.to_zarr(store, component=str(i), overwrite=True)
+                group.attrs['levels'] = i
+            level = da.from_zarr(store, component=str(i))
+            pyramid.append(level)
+        elif in_memory:
+            level = level.compute(scheduler='threads')
+            pyramid.append(level)
+            level = da.from_array(level)
+        else:
+            pyramid.append(level)
     return pyramid
 
 
-def get_pyramid_and_rgb(data, pyramid=None, rgb=None):
+def get_pyramid_and_rgb(data, pyramid=None, rgb=None, method='mean'):
     """Check if data is or needs to be a pyramid and make one if needed.
 
     Parameters
@@ -112,6 +268,9 @@ def get_pyramid_and_rgb(data, pyramid=None, rgb=None):
     rgb : bool, optional
         Value that can force data to be considered as a rgb, otherwise
         computed.
+    method : {'mean', 'mode'}
+        How pixels are downsampled if a pyramid is generated, see
+        `downsample`.
 
     Returns
     -------
@@ -180,9 +339,16 @@ def get_pyramid_and_rgb(data, pyramid=None, rgb=None):
                 largest = np.min(np.array(data.shape)[pyr_axes])
                 # Determine number of downsample steps needed
                 max_layer = np.floor(np.log2(largest) - 9).astype(int)
-                data_pyramid = fast_pyramid(
-                    data, downscale=downscale, max_layer=max_layer
+                store = pyramid_cache.store(data, downscale, method)
+                data_pyramid = build_pyramid(
+                    data,
+                    downscale=downscale,
+                    max_layer=max_layer,
+                    method=method,
+                    store=store,
                 )
+                if store is not None:
+                    pyramid_cache.prune(keep=store)
                 data_pyramid = trim_pyramid(data_pyramid)
             else:
                 data_pyramid = None
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+from ...utils.io import file_token
+
+
+class PyramidCache:
+    """On-disk cache of the levels of generated pyramids.
+
+    Levels are saved as chunked zarr groups, one per dataset, named after a
+    hash of the data, the downscale factors and the downsampling method.
+    Only lazy (dask) data read from files with `magic_imread` is cached,
+    identified by the paths, sizes and modification times of its files, see
+    `napari.utils.io.file_token`. Other data cannot be identified without
+    hashing all of it, and is not cached. Saving levels requires zarr.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory in which the levels are saved. If None the cache is
+        disabled.
+    max_bytes : int
+        Maximum size of the cache on disk. Least recently used pyramids are
+        deleted once it is exceeded.
+
+    Attributes
+    ----------
+    directory : str or None
+        Directory in which the levels are saved, None if disabled.
+    max_bytes : int
+        Maximum size of the cache on disk.
+    """
+
+    def __init__(self, directory=None, max_bytes=2 ** 35):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, data, downscale, method):
+        """Content address of the pyramid of some data.
+
+        Parameters
+        ----------
+        data : array
+            Data from which the pyramid is generated.
+        downscale : list of int
+            Factor to downscale each step of the pyramid by, for every axis.
+        method : str
+            How pixels are downsampled.
+
+        Returns
+        -------
+        key : str or None
+            Hex digest identifying the pyramid, or None if the data cannot
+            be identified.
+        """
+        token = file_token(data)
+        if token is None:
+            return None
+        digest = hashlib.blake2b(token.encode(), digest_size=16)
+        description = (
+            data.shape,
+            str(np.dtype(data.dtype)),
+            [int(f) for f in downscale],
+            method,
+        )
+        digest.update(repr(description).encode())
+        return digest.hexdigest()
+
+    def store(self, data, downscale, method):
+        """Path of the zarr group in which to save the pyramid of some data.
+
+        Parameters
+        ----------
+        data : array
+            Data from which the pyramid is generated.
+        downscale : list of int
+            Factor to downscale each step of the pyramid by, for every axis.
+        method : str
+            How pixels are downsampled.
+
+        Returns
+        -------
+        store : str or None
+            Path of the zarr group, or None if the pyramid cannot be cached.
+        """
+        if self.directory is None:
+            return None
+        try:
+            import zarr  # noqa: F401
+        except ImportError:
+            return None
+        key = self.key(data, downscale, method)
+        if key is None:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        store = os.path.join(self.directory, key + '.zarr')
+        if os.path.exists(store):
+            # mark as recently used
+            os.utime(store)
+        return store
+
+    def _entries(self):
+        if self.directory is None or not os.path.isdir(self.directory):
+            return []
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.zarr')
+        ]
+
+    @property
+    def nbytes(self):
+        """int: Size of the cache on disk."""
+        return sum(_disk_usage(entry) for entry in self._entries())
+
+    def prune(self, keep=None):
+        """Delete least recently used pyramids above the size budget.
+
+        Parameters
+        ----------
+        keep : str, optional
+            Path of a pyramid that must not be deleted.
+        """
+        entries = sorted(
+            (os.path.getmtime(entry), entry, _disk_usage(entry))
+            for entry in self._entries()
+        )
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Delete all saved pyramids."""
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def _disk_usage(path):
+    """Total size of the files in a directory."""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+pyramid_cache = PyramidCache(os.environ.get('NAPARI_PYRAMID_CACHE'))
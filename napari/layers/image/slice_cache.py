@@ -0,0 +1,356 @@
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
+
+
+class SliceCache:
+    """Least recently used cache of sliced planes with a byte budget.
+
+    Sliced planes are keyed by layer, data level and indices. Planes can
+    be read ahead of time on background threads with `prefetch`, and
+    `load` waits for any read of the same key that is already in flight
+    rather than reading the plane twice. All methods are thread-safe.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum number of bytes held by the cache. Least recently used
+        planes are evicted once it is exceeded.
+    prefetch_depth : int
+        Number of planes read ahead in the direction of motion by layers
+        using this cache. If 0 no planes are prefetched.
+    max_workers : int, optional
+        Maximum number of threads used for prefetching.
+
+    Attributes
+    ----------
+    hits : int
+        Number of loads served from the cache.
+    misses : int
+        Number of loads that had to read the data.
+    nbytes : int
+        Number of bytes currently held by the cache.
+    """
+
+    def __init__(self, max_bytes=2 ** 29, prefetch_depth=4, max_workers=4):
+        self._lock = threading.Lock()
+        self._planes = OrderedDict()
+        self._inflight = {}
+        self._groups = {}
+        self._cleared = 0
+        self._token_cleared = {}
+        self._max_bytes = max_bytes
+        self._max_workers = max_workers
+        self._executor = None
+        self.prefetch_depth = prefetch_depth
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._planes)
+
+    def __contains__(self, key):
+        return key in self._planes
+
+    @property
+    def max_bytes(self):
+        """int: Maximum number of bytes held by the cache."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def stats(self):
+        """dict: Hits, misses, size in bytes and number of cached planes."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'nbytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'planes': len(self),
+        }
+
+    def reset_stats(self):
+        """Reset hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self):
+        while self.nbytes > self._max_bytes and len(self._planes) > 0:
+            _, plane = self._planes.popitem(last=False)
+            self.nbytes -= plane.nbytes
+
+    def _put(self, key, plane):
+        if plane.nbytes > self._max_bytes:
+            return
+        if key in self._planes:
+            self.nbytes -= self._planes.pop(key).nbytes
+        self._planes[key] = plane
+        self.nbytes += plane.nbytes
+        self._evict()
+
+    def _generation(self, key):
+        # incremented whenever planes with this key are cleared, so reads
+        # that started before the clear are not cached
+        return self._cleared, self._token_cleared.get(key[0], 0)
+
+    def load(self, key, loader):
+        """Get a plane from the cache, reading it if needed.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable key of the plane, see `slice_key`.
+        loader : callable
+            Callable taking no arguments that reads the plane.
+
+        Returns
+        -------
+        plane : array
+            Sliced plane.
+        """
+        with self._lock:
+            if key in self._planes:
+                self.hits += 1
+                self._planes.move_to_end(key)
+                return self._planes[key]
+            future = self._inflight.get(key)
+            if future is not None and future.cancel():
+                # prefetch has not started yet, so read the plane here
+                del self._inflight[key]
+                self._groups.pop(key, None)
+                future = None
+            if future is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            generation = self._generation(key)
+
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                # failed prefetches are retried below
+                pass
+
+        plane = np.asarray(loader())
+        with self._lock:
+            if generation == self._generation(key):
+                self._put(key, plane)
+        return plane
+
+    def prefetch(self, requests, group=None):
+        """Read planes on background threads and keep them in the cache.
+
+        Prefetches queued by previous calls of the same group that are not
+        part of this one are cancelled if they have not started yet.
+
+        Parameters
+        ----------
+        requests : list of 2-tuple
+            Key and loader of each plane to prefetch, in order of priority.
+        group : hashable, optional
+            Group of the prefetches, so that independent sources of
+            prefetches, such as motion and playback, do not cancel each
+            other.
+        """
+        keys = {key for key, _ in requests}
+        with self._lock:
+            for key, future in list(self._inflight.items()):
+                if (
+                    key not in keys
+                    and self._groups.get(key) == group
+                    and future.cancel()
+                ):
+                    del self._inflight[key]
+                    del self._groups[key]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers)
+            for key, loader in requests:
+                if key in self._planes or key in self._inflight:
+                    continue
+                self._groups[key] = group
+                self._inflight[key] = self._executor.submit(
+                    self._prefetch_one, key, loader, self._generation(key)
+                )
+
+    def _prefetch_one(self, key, loader, generation):
+        try:
+            plane = np.asarray(loader())
+            with self._lock:
+                if generation == self._generation(key):
+                    self._put(key, plane)
+            return plane
+        finally:
+            with self._lock:
+                if generation == self._generation(key):
+                    self._inflight.pop(key, None)
+                    self._groups.pop(key, None)
+
+    def wait(self):
+        """Block until all prefetches in flight are done."""
+        with self._lock:
+            futures = list(self._inflight.values())
+        wait(futures)
+
+    def clear(self, token=None):
+        """Remove planes from the cache.
+
+        Parameters
+        ----------
+        token : int, optional
+            Only remove the planes of the layer with this cache token. If
+            None all planes are removed.
+        """
+        with self._lock:
+            for key, future in list(self._inflight.items()):
+                if token is None or key[0] == token:
+                    future.cancel()
+                    del self._inflight[key]
+                    self._groups.pop(key, None)
+            if token is None:
+                self._cleared += 1
+                self._planes.clear()
+                self.nbytes = 0
+                return
+            self._token_cleared[token] = self._token_cleared.get(token, 0) + 1
+            for key in [k for k in self._planes if k[0] == token]:
+                self.nbytes -= self._planes.pop(key).nbytes
+
+
+_tokens = itertools.count()
+
+
+def new_cache_token():
+    """Get a unique token identifying a layer in the slice cache."""
+    return next(_tokens)
+
+
+def slice_key(token, level, indices):
+    """Make a hashable cache key for a slice of a layer.
+
+    Parameters
+    ----------
+    token : int
+        Cache token of the layer.
+    level : int
+        Data level being sliced.
+    indices : tuple of int or slice
+        Indices used to slice the data.
+
+    Returns
+    -------
+    key : tuple
+        Hashable key.
+    """
+    hashable = tuple(
+        (i.start, i.stop, i.step) if isinstance(i, slice) else int(i)
+        for i in indices
+    )
+    return (token, level, hashable)
+
+
+def prefetch_indices(previous, current, shape, depth):
+    """Indices of the planes ahead of the current one in the direction of
+    motion.
+
+    The direction of motion is only known if exactly one sliced axis
+    changed between the previous and the current indices.
+
+    Parameters
+    ----------
+    previous : tuple of int or slice or None
+        Previously sliced indices.
+    current : tuple of int or slice
+        Currently sliced indices.
+    shape : tuple of int
+        Shape of the data being sliced.
+    depth : int
+        Number of planes to read ahead.
+
+    Returns
+    -------
+    indices : list of tuple
+        Indices of the planes to prefetch, closest first.
+    """
+    if previous is None or len(previous) != len(current) or depth < 1:
+        return []
+    moved = [
+        axis for axis, (p, c) in enumerate(zip(previous, current)) if p != c
+    ]
+    if len(moved) != 1 or isinstance(current[moved[0]], slice):
+        return []
+    axis = moved[0]
+    step = 1 if current[axis] > previous[axis] else -1
+    indices = []
+    for i in range(1, depth + 1):
+        point = current[axis] + i * step
+        if not 0 <= point < shape[axis]:
+            break
+        ahead = list(current)
+        ahead[axis] = point
+        indices.append(tuple(ahead))
+    return indices
+
+
+def tile_grid(indices, tile_shape):
+    """Split the region selected by indices into tiles of a regular grid.
+
+    Bounded slices are split at multiples of `tile_shape`, so that tiles of
+    overlapping regions have the same indices and can share cache entries.
+
+    Parameters
+    ----------
+    indices : tuple of int or slice
+        Indices selecting the region. Only slices with a stop and a step of
+        1 are split into tiles.
+    tile_shape : int
+        Size of the tiles along each split axis.
+
+    Returns
+    -------
+    tiles : list of 2-tuple
+        Indices of each tile into the data, and location of each tile in
+        the region selected by `indices`.
+    """
+    axes = []
+    for index in indices:
+        if (
+            isinstance(index, slice)
+            and index.stop is not None
+            and index.step in (None, 1)
+        ):
+            start = index.start or 0
+            first = -(-start // tile_shape) * tile_shape
+            bounds = sorted(
+                {start, index.stop} | set(range(first, index.stop, tile_shape))
+            )
+            axes.append(
+                [
+                    (slice(a, b, 1), slice(a - start, b - start))
+                    for a, b in zip(bounds[:-1], bounds[1:])
+                ]
+            )
+        elif isinstance(index, slice):
+            axes.append([(index, slice(None))])
+        else:
+            # integer indices drop the axis from the region
+            axes.append([(index, None)])
+
+    tiles = []
+    for tile in itertools.product(*axes):
+        tile_indices = tuple(i for i, _ in tile)
+        location = tuple(loc for _, loc in tile if loc is not None)
+        tiles.append((tile_indices, location))
+    return tiles
+
+
+slice_cache = SliceCache()
@@ -5,6 +5,7 @@ import xarray as xr
 
 import pytest
 from vispy.color import Colormap
+from napari.components.dims_constants import DimsMode
 from napari.layers import Image
 
 
@@ -614,3 +615,96 @@ def test_image_translate(translate):
     np.random.seed(0)
     data = np.random.random((10, 15))
     Image(data, translate=translate)
+
+
+def test_lazy_contrast_limits():
+    """Test contrast limits of large lazy data are estimated and refined."""
+    np.random.seed(0)
+    data = np.random.random((20, 300, 400))
+    data[0, 0, 0] = 1000
+    data[10, 0, 0] = -1000
+    layer = Image(da.from_array(data, chunks=(1, 300, 400)))
+    assert layer.contrast_limits[1] < 1
+    assert layer.contrast_limits_range[1] >= layer.contrast_limits[1]
+
+    # viewing planes with more extreme values expands the range
+    layer.dims.set_point(0, 10)
+    assert layer.contrast_limits_range[0] == -1000
+    assert layer.contrast_limits[1] < 1
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_interval_projection(lazy):
+    """Test dimensions in INTERVAL mode are projected."""
+    np.random.seed(0)
+    data = np.random.random((20, 15, 30, 40))
+    layer = Image(da.from_array(data, chunks=(4, 5, 30, 40)) if lazy else data)
+    assert layer.projection == 'max'
+    layer.dims.set_point(1, 4)
+    layer.dims.set_interval(0, (5, 12))
+    layer.dims.set_mode(0, DimsMode.INTERVAL)
+    np.testing.assert_allclose(layer._data_view, data[5:12, 4].max(axis=0))
+
+    layer.projection = 'mean'
+    np.testing.assert_allclose(layer._data_view, data[5:12, 4].mean(axis=0))
+
+    # the projection is read back from the cache
+    layer.projection = 'max'
+    assert len(layer._slice_cache) > 0
+    np.testing.assert_allclose(layer._data_view, data[5:12, 4].max(axis=0))
+
+    # both dimensions can be projected together
+    layer.dims.set_interval(1, (0, 15))
+    layer.dims.set_mode(1, DimsMode.INTERVAL)
+    np.testing.assert_allclose(layer._data_view, data[5:12].max(axis=(0, 1)))
+    layer.projection = 'sum'
+    np.testing.assert_allclose(layer._data_view, data[5:12].sum(axis=(0, 1)))
+
+    # back to slicing a plane
+    layer.dims.set_mode(0, DimsMode.POINT)
+    layer.dims.set_mode(1, DimsMode.POINT)
+    np.testing.assert_allclose(layer._data_view, data[0, 4])
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_refresh_after_inplace_edit(lazy):
+    """Test refresh shows data edited in place, including projections."""
+    np.random.seed(0)
+    data = np.random.random((10, 15, 20))
+    layer = Image(da.from_array(data, chunks=(1, 15, 20)) if lazy else data)
+    layer.dims.set_point(0, 2)
+    np.testing.assert_allclose(layer._data_view, data[2])
+
+    data[2] = 2
+    layer.refresh()
+    np.testing.assert_allclose(layer._data_view, 2)
+
+    layer.dims.set_interval(0, (0, 5))
+    layer.dims.set_mode(0, DimsMode.INTERVAL)
+    np.testing.assert_allclose(layer._data_view, 2)
+    data[3] = 3
+    layer.refresh()
+    np.testing.assert_allclose(layer._data_view, 3)
+
+
+def test_slice_unchanged_dims():
+    """Test changes of the dims that keep the same slice are not sliced."""
+    np.random.seed(0)
+    data = np.random.random((10, 15, 20))
+    layer = Image(data)
+    layer.dims.set_range(0, (0, 10, 0.5))
+    refreshes = []
+    layer.events.set_data.connect(lambda e: refreshes.append(e))
+
+    # 1.1 and 1.2 both round to the same index with a step of 0.5
+    layer.dims.set_point(0, 1.1)
+    assert len(refreshes) == 1
+    layer.dims.set_point(0, 1.2)
+    assert len(refreshes) == 1
+    layer.dims.set_point(0, 3)
+    assert len(refreshes) == 2
+    np.testing.assert_array_equal(layer._data_view, data[6])
+
+    # explicit refreshes always slice the layer again
+    layer.refresh()
+    assert len(refreshes) == 3
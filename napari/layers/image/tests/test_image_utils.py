@@ -3,14 +3,23 @@ import numpy as np
 import pytest
 from skimage.transform import pyramid_gaussian
 from napari.layers.image.image_utils import (
-    fast_pyramid,
+    build_pyramid,
+    downsample,
     get_pyramid_and_rgb,
     guess_pyramid,
     guess_rgb,
+    project,
     should_be_pyramid,
     trim_pyramid,
 )
 
+try:
+    import zarr  # noqa: F401
+
+    zarr_available = True
+except ImportError:
+    zarr_available = False
+
 
 data_dask = da.random.random(
     size=(100_000, 1000, 1000), chunks=(1, 1000, 1000)
@@ -153,58 +162,73 @@ def test_get_pyramid_and_rgb():
     assert ndim == 2
 
 
-def test_fast_pyramid():
-    shape = (64, 64)
-    data = np.random.random(shape)
-    pyramid = fast_pyramid(data)
-    assert np.all(
-        [
-            p.shape == (shape[0] // 2 ** i, shape[1] // 2 ** i)
-            for i, p in enumerate(pyramid)
-        ]
-    )
-    assert len(pyramid) == 7
+def test_downsample():
+    data = da.from_array(np.arange(36).reshape(6, 6), chunks=3)
+    down = downsample(data, (2, 3))
+    assert down.shape == (3, 2)
+    assert down.dtype == data.dtype
+    expected = np.round(
+        np.arange(36).reshape(3, 2, 2, 3).mean(axis=(1, 3))
+    ).astype(int)
+    np.testing.assert_array_equal(down.compute(), expected)
 
-    shape = (64, 64)
-    data = np.random.random(shape)
-    pyramid = fast_pyramid(data, max_layer=3)
-    assert np.all(
-        [
-            p.shape == (shape[0] // 2 ** i, shape[1] // 2 ** i)
-            for i, p in enumerate(pyramid)
-        ]
+    labels = np.array([[1, 1, 2, 3], [1, 4, 2, 2]])
+    down = downsample(da.from_array(labels), (2, 2), method='mode')
+    np.testing.assert_array_equal(down.compute(), [[1, 2]])
+
+    with pytest.raises(ValueError):
+        downsample(data, (2, 2), method='max')
+
+
+@pytest.mark.parametrize('method', ['max', 'min', 'mean', 'sum'])
+def test_project(method):
+    np.random.seed(0)
+    data = np.random.random((10, 6, 15, 20))
+    indices = (slice(2, 7), 3, slice(None), slice(None))
+    expected = getattr(np, method)(data[2:7, 3], axis=0)
+    np.testing.assert_allclose(project(data, indices, (0,), method), expected)
+    lazy = da.from_array(data, chunks=(3, 2, 15, 10))
+    np.testing.assert_allclose(project(lazy, indices, (0,), method), expected)
+
+
+def test_project_integer_mean():
+    data = np.array([[0, 1], [1, 2]], dtype=np.uint8)
+    projected = project(data, (slice(0, 2), slice(None)), (0,), 'mean')
+    assert projected.dtype == np.uint8
+    np.testing.assert_array_equal(projected, [0, 2])
+
+    with pytest.raises(ValueError):
+        project(data, (slice(0, 2), slice(None)), (0,), 'median')
+
+
+def test_build_pyramid():
+    data = np.random.random((64, 32, 3))
+    pyramid = build_pyramid(data, downscale=(2, 2, 1))
+    assert all(isinstance(p, np.ndarray) for p in pyramid)
+    assert [p.shape for p in pyramid] == [
+        (64 // 2 ** i, 32 // 2 ** i, 3) for i in range(6)
+    ]
+    np.testing.assert_allclose(
+        pyramid[1][0, 0], data[:2, :2].mean(axis=(0, 1))
     )
+
+    # lazy data gives lazy levels
+    pyramid = build_pyramid(da.from_array(data, chunks=5), (2, 2, 1), 3)
     assert len(pyramid) == 3
+    assert all(isinstance(p, da.Array) for p in pyramid)
 
-    shape = (64, 16)
-    data = np.random.random(shape)
-    pyramid = fast_pyramid(data, downscale=(2, 1))
-    assert np.all(
-        [
-            p.shape == (shape[0] // 2 ** i, shape[1])
-            for i, p in enumerate(pyramid)
-        ]
-    )
-    assert len(pyramid) == 7
 
-    shape = (64, 64, 3)
-    data = np.random.random(shape)
-    pyramid = fast_pyramid(data, downscale=(2, 2, 1))
-    assert np.all(
-        [
-            p.shape == (shape[0] // 2 ** i, shape[1] // 2 ** i, 3)
-            for i, p in enumerate(pyramid)
-        ]
-    )
-    assert len(pyramid) == 7
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_build_pyramid_store(tmpdir):
+    store = str(tmpdir / 'pyramid.zarr')
+    data = np.random.random((64, 64))
+    pyramid = build_pyramid(data, max_layer=3, store=store)
+    np.testing.assert_allclose(pyramid[1], build_pyramid(data, max_layer=2)[1])
 
-    shape = (64, 32, 3)
-    data = np.random.random(shape)
-    pyramid = fast_pyramid(data, downscale=(2, 2, 1))
-    assert np.all(
-        [
-            p.shape == (shape[0] // 2 ** i, shape[1] // 2 ** i, 3)
-            for i, p in enumerate(pyramid)
-        ]
-    )
-    assert len(pyramid) == 7
+    # saved levels are reused
+    reused = build_pyramid(np.zeros((64, 64)), max_layer=3, store=store)
+    np.testing.assert_allclose(reused[2], pyramid[2])
+
+    # but not for other data
+    other = build_pyramid(np.zeros((64, 64), int), max_layer=3, store=store)
+    assert np.all(np.asarray(other[2]) == 0)
@@ -0,0 +1,120 @@
+import os
+
+import dask.array as da
+import numpy as np
+import pytest
+
+from napari.layers.image import image_utils
+from napari.layers.image.pyramid_cache import PyramidCache
+from napari.utils import io
+
+try:
+    import zarr  # noqa: F401
+
+    zarr_available = True
+except ImportError:
+    zarr_available = False
+
+
+def _read(tmp_path, data, name='data.npy'):
+    filename = str(tmp_path / name)
+    np.save(filename, data)
+    return io.magic_imread(filename, use_dask=True)
+
+
+def test_key(tmp_path):
+    cache = PyramidCache()
+    data = _read(tmp_path, np.random.random((10, 10)))
+    key = cache.key(data, (2, 2), 'mean')
+    assert key is not None
+    assert key != cache.key(data, (2, 1), 'mean')
+    assert key != cache.key(data, (2, 2), 'mode')
+
+    # other data cannot be identified without hashing its content
+    assert cache.key(np.asarray(data), (2, 2), 'mean') is None
+    assert cache.key(da.from_array(np.asarray(data)), (2, 2), 'mean') is None
+    assert cache.key([data], (2, 2), 'mean') is None
+
+
+def test_key_files(tmp_path):
+    cache = PyramidCache()
+    data = np.random.random((10, 10))
+    filename = str(tmp_path / 'data.npy')
+    np.save(filename, data)
+    key = cache.key(io.magic_imread(filename, use_dask=True), (2, 2), 'mean')
+    assert key is not None
+    assert key == cache.key(
+        io.magic_imread(filename, use_dask=True), (2, 2), 'mean'
+    )
+
+    np.save(filename, data[:5])
+    assert key != cache.key(
+        io.magic_imread(filename, use_dask=True), (2, 2), 'mean'
+    )
+
+
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_key_zarr_chunk_rewritten(tmp_path):
+    cache = PyramidCache()
+    path = str(tmp_path / 'data.zarr')
+    array = zarr.open(
+        path,
+        mode='w',
+        shape=(20, 20),
+        chunks=(10, 10),
+        dimension_separator='/',
+    )
+    array[:] = np.random.random((20, 20))
+    mtime = os.stat(path).st_mtime_ns
+    key = cache.key(io.magic_imread(path), (2, 2), 'mean')
+    assert key is not None
+    assert key == cache.key(io.magic_imread(path), (2, 2), 'mean')
+
+    # chunks are nested in subdirectories, so rewriting one changes neither
+    # the modification time of the array directory nor its shape
+    array[10:, 10:] = np.random.randint(0, 10, (10, 10))
+    assert os.stat(path).st_mtime_ns == mtime
+    assert key != cache.key(io.magic_imread(path), (2, 2), 'mean')
+
+
+def test_disabled():
+    cache = PyramidCache()
+    assert cache.store(np.zeros((10, 10)), (2, 2), 'mean') is None
+
+
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_generated_pyramid_reused(tmpdir, monkeypatch):
+    cache = PyramidCache(str(tmpdir))
+    monkeypatch.setattr(image_utils, 'pyramid_cache', cache)
+    data = np.random.randint(0, 100, (2 ** 13, 20), dtype=np.uint8)
+    data = _read(tmpdir, data)
+    *_, pyramid = image_utils.get_pyramid_and_rgb(data)
+    store = cache.store(data, (2, 1), 'mean')
+    assert os.path.isdir(store)
+    assert cache.nbytes > 0
+
+    # levels are read back from disk rather than saved again
+    def fail(*args, **kwargs):
+        raise AssertionError('pyramid saved again')
+
+    monkeypatch.setattr(da.Array, 'to_zarr', fail)
+    *_, reused = image_utils.get_pyramid_and_rgb(data)
+    assert len(reused) == len(pyramid)
+    for level, saved in zip(pyramid[1:], reused[1:]):
+        np.testing.assert_array_equal(level, saved)
+
+
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_prune(tmpdir):
+    cache = PyramidCache(str(tmpdir / 'cache'), max_bytes=0)
+    zeros = _read(tmpdir, np.zeros((64, 64)), 'zeros.npy')
+    first = cache.store(zeros, (2, 2), 'mean')
+    image_utils.build_pyramid(zeros, max_layer=3, store=first)
+    ones = _read(tmpdir, np.ones((64, 64)), 'ones.npy')
+    second = cache.store(ones, (2, 2), 'mean')
+    image_utils.build_pyramid(ones, max_layer=3, store=second)
+    cache.prune(keep=second)
+    assert not os.path.exists(first)
+    assert os.path.exists(second)
+    cache.clear()
+    assert cache.nbytes == 0
@@ -0,0 +1,191 @@
+import dask.array as da
+import numpy as np
+
+from napari.layers import Image, Labels
+from napari.layers.image.slice_cache import (
+    SliceCache,
+    prefetch_indices,
+    slice_key,
+    tile_grid,
+)
+
+
+def test_cache_hits_and_misses():
+    """Test loading planes through the cache."""
+    cache = SliceCache(max_bytes=1000)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return np.zeros(10, dtype=np.uint8)
+
+    key = slice_key(0, 0, (1, slice(None)))
+    cache.load(key, loader)
+    cache.load(key, loader)
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.nbytes == 10
+    assert cache.stats['planes'] == 1
+
+
+def test_cache_byte_budget():
+    """Test least recently used planes are evicted above the budget."""
+    cache = SliceCache(max_bytes=25)
+    for i in range(3):
+        cache.load((0, 0, (i,)), lambda: np.zeros(10, dtype=np.uint8))
+    assert len(cache) == 2
+    assert (0, 0, (0,)) not in cache
+    assert cache.nbytes == 20
+
+    # touching a plane makes it the most recently used
+    cache.load((0, 0, (1,)), lambda: None)
+    cache.load((0, 0, (3,)), lambda: np.zeros(10, dtype=np.uint8))
+    assert (0, 0, (1,)) in cache
+    assert (0, 0, (2,)) not in cache
+
+    cache.max_bytes = 10
+    assert len(cache) == 1
+
+    # planes larger than the budget are never cached
+    cache.load((0, 0, (4,)), lambda: np.zeros(20, dtype=np.uint8))
+    assert (0, 0, (4,)) not in cache
+
+
+def test_cache_clear():
+    """Test clearing the planes of a single layer."""
+    cache = SliceCache()
+    cache.load((0, 0, (0,)), lambda: np.zeros(10))
+    cache.load((1, 0, (0,)), lambda: np.zeros(10))
+    cache.clear(0)
+    assert (0, 0, (0,)) not in cache
+    assert (1, 0, (0,)) in cache
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_prefetch():
+    """Test prefetched planes end up in the cache."""
+    cache = SliceCache()
+    requests = [((0, 0, (i,)), lambda: np.zeros(10)) for i in range(3)]
+    cache.prefetch(requests)
+    cache.wait()
+    assert len(cache) == 3
+    assert cache.misses == 0
+
+
+def test_prefetch_indices():
+    """Test planes ahead are found in the direction of motion."""
+    s = slice(None)
+    assert prefetch_indices((1, 0, s), (2, 0, s), (5, 3, 10), 2) == [
+        (3, 0, s),
+        (4, 0, s),
+    ]
+    assert prefetch_indices((2, 0, s), (1, 0, s), (5, 3, 10), 3) == [(0, 0, s)]
+    # no motion or motion along several axes
+    assert prefetch_indices((1, 0, s), (1, 0, s), (5, 3, 10), 2) == []
+    assert prefetch_indices((1, 0, s), (2, 1, s), (5, 3, 10), 2) == []
+    assert prefetch_indices(None, (2, 0, s), (5, 3, 10), 2) == []
+
+
+def test_tile_grid():
+    """Test regions are split at multiples of the tile shape."""
+    tiles = tile_grid((3, slice(8, 40, 1), slice(None)), 16)
+    assert tiles == [
+        ((3, slice(8, 16, 1), slice(None)), (slice(0, 8), slice(None))),
+        ((3, slice(16, 32, 1), slice(None)), (slice(8, 24), slice(None))),
+        ((3, slice(32, 40, 1), slice(None)), (slice(24, 32), slice(None))),
+    ]
+    assert tile_grid((1, slice(None)), 16) == [
+        ((1, slice(None)), (slice(None),))
+    ]
+
+
+def _tiled_pyramid(cache):
+    np.random.seed(0)
+    base = np.random.random((100, 100))
+    pyramid = [
+        da.from_array(base[:: 2 ** i, :: 2 ** i], chunks=16) for i in range(3)
+    ]
+    layer = Image(pyramid, is_pyramid=True)
+    layer._slice_cache = cache
+    layer._max_tile_shape = 40
+    layer._tile_shape = 16
+    return layer, pyramid
+
+
+def test_tiled_pyramid():
+    """Test large pyramid levels are read tile by tile."""
+    cache = SliceCache()
+    layer, pyramid = _tiled_pyramid(cache)
+    layer.top_left = np.array([20, 36])
+    layer.data_level = 0
+    np.testing.assert_array_equal(layer._data_view, pyramid[0][16:48, 32:64])
+    np.testing.assert_array_equal(layer._translate_view, [16, 32])
+    misses = cache.misses
+
+    # panning only reads the tiles that were not viewed yet
+    layer.top_left = np.array([20, 50])
+    np.testing.assert_array_equal(layer._data_view, pyramid[0][16:48, 48:80])
+    assert cache.misses == misses + 2
+
+
+def test_tiled_placeholder():
+    """Test missing tiles are replaced by the upsampled lowest level."""
+    cache = SliceCache()
+    layer, pyramid = _tiled_pyramid(cache)
+    layer.top_left = np.array([20, 36])
+    layer.data_level = 0
+    cache.clear()
+
+    request = layer._slice_request()
+    image, _, _ = layer._load_slice(request, placeholder=True)
+    # the lowest level is downsampled by a factor of two
+    assert len(layer._data_pyramid) == 2
+    rows, cols = np.arange(16, 48) // 2, np.arange(32, 64) // 2
+    expected = np.asarray(pyramid[1])[np.ix_(rows, cols)]
+    np.testing.assert_array_equal(image, expected)
+
+
+def test_image_uses_cache():
+    """Test slicing lazy image data goes through the cache."""
+    cache = SliceCache()
+    data = da.from_array(np.random.random((10, 15, 20)), chunks=(1, 15, 20))
+    layer = Image(data)
+    layer._slice_cache = cache
+
+    layer.dims.set_point(0, 1)
+    layer.dims.set_point(0, 2)
+    cache.wait()
+    # planes ahead of the current one have been prefetched
+    for i in range(3, 3 + cache.prefetch_depth):
+        key = slice_key(layer._cache_token, 0, (i, slice(None), slice(None)))
+        assert key in cache
+
+    misses = cache.misses
+    layer.dims.set_point(0, 3)
+    assert cache.misses == misses
+    np.testing.assert_array_equal(layer._data_view, data[3])
+
+
+def test_numpy_image_bypasses_cache():
+    """Test in-memory data is sliced without caching."""
+    cache = SliceCache()
+    layer = Image(np.random.random((10, 15, 20)))
+    layer._slice_cache = cache
+    layer.dims.set_point(0, 1)
+    layer.dims.set_point(0, 2)
+    assert len(cache) == 0
+    assert cache.misses == 0
+
+
+def test_labels_edit_clears_cache():
+    """Test painting labels invalidates the cached planes."""
+    cache = SliceCache()
+    data = np.zeros((3, 10, 10), dtype=int)
+    layer = Labels(data)
+    layer._slice_cache = cache
+    cache.load((layer._cache_token, 0, (0,)), lambda: np.zeros(10))
+    layer.paint((0, 5, 5), 3)
+    assert len(cache) == 0
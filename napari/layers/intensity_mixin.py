@@ -76,7 +76,7 @@ class IntensityVisualizationMixin:
         self._colormap_name = name
         self._cmap = self._colormaps[name]
         self._colorbar = make_colorbar(self._cmap)
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.colormap()
 
     @property
@@ -104,7 +104,7 @@ class IntensityVisualizationMixin:
         newrange[0] = min(newrange[0], contrast_limits[0])
         newrange[1] = max(newrange[1], contrast_limits[1])
         self.contrast_limits_range = newrange
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.contrast_limits()
 
     @property
@@ -144,5 +144,5 @@ class IntensityVisualizationMixin:
     def gamma(self, value):
         self.status = format_float(value)
         self._gamma = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.gamma()
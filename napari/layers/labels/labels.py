@@ -8,7 +8,13 @@ from scipy import ndimage as ndi
 from ..image import Image
 from ...utils.colormaps import colormaps
 from ...utils.event import Event
-from .labels_utils import interpolate_coordinates
+from .labels_utils import (
+    compress_array,
+    decompress_array,
+    interpolate_coordinates,
+    mask_bounding_box,
+    union_region,
+)
 from ...utils.status_messages import format_float
 from ._constants import Mode
 
@@ -107,9 +113,30 @@ class Labels(Image):
     _last_cursor_coord : list or None
         Coordinates of last cursor click before painting, gets reset to None
         after painting is done. Used for interpolating brush strokes.
+    _staged_history : list
+        Regions of the data edited by the current action, each with the
+        values it had before the edit. Merged into a single step of the
+        undo history when the action is finished.
+    _undo_history, _redo_history : deque
+        Steps of the history, each a region of the data with its compressed
+        values before the step was undone or redone.
+    _history_bytes : int
+        Number of bytes used to store the undo and redo histories.
+    _lut : array
+        Displayed value of each label from 0 up to the largest label seen
+        so far for the current seed. Labels are mapped to displayed values by
+        indexing into it, and it is extended as larger labels appear.
     """
 
-    _history_limit = 100
+    # Maximum number of bytes used to store the undo and redo histories.
+    _history_limit = 2 ** 28
+    # The max number of entries in the lookup table of displayed values.
+    # Views with larger labels are mapped without it.
+    _max_lut_size = 2 ** 22
+    # averaging labels would create labels that do not exist
+    _pyramid_method = 'mode'
+    # projections of labels are not labels, and painting needs a plane
+    _projectable = False
 
     def __init__(
         self,
@@ -128,6 +155,7 @@ class Labels(Image):
     ):
 
         self._seed = seed
+        self._lut = np.zeros(0)
         self._num_colors = num_colors
         colormap = ('random', colormaps.label_colormap(self.num_colors))
 
@@ -161,6 +189,8 @@ class Labels(Image):
         self._contiguous = True
         self._brush_size = 10
         self._last_cursor_coord = None
+        # region of the data edited since the view was last updated
+        self._dirty_region = None
 
         self._selected_label = 0
         self._selected_color = None
@@ -177,9 +207,9 @@ class Labels(Image):
         self._update_dims()
         self._set_editable()
 
-        self.dims.events.ndisplay.connect(self._reset_history)
-        self.dims.events.order.connect(self._reset_history)
-        self.dims.events.axis.connect(self._reset_history)
+        # the history holds regions of the data, so it stays valid when the
+        # view changes but not when the data is replaced
+        self.events.data.connect(self._reset_history)
 
     @property
     def contiguous(self):
@@ -221,8 +251,9 @@ class Labels(Image):
     @seed.setter
     def seed(self, seed):
         self._seed = seed
+        self._lut = np.zeros(0)
         self._selected_color = self.get_color(self.selected_label)
-        self.refresh()
+        self._refresh_view()
         self.events.selected_label()
 
     @property
@@ -237,7 +268,7 @@ class Labels(Image):
             self._colormap_name,
             colormaps.label_colormap(num_colors),
         )
-        self.refresh()
+        self._refresh_view()
         self._selected_color = self.get_color(self.selected_label)
         self.events.selected_label()
 
@@ -336,7 +367,7 @@ class Labels(Image):
         self._mode = mode
 
         self.events.mode(mode=mode)
-        self.refresh()
+        self._refresh_view()
 
     def _set_editable(self, editable=None):
         """Set editable mode based on layer properties."""
@@ -366,11 +397,53 @@ class Labels(Image):
         image : array
             Image mapped between 0 and 1 to be displayed.
         """
+        raw = np.asarray(raw)
+        if raw.size > 0 and raw.dtype.kind in 'ui':
+            # negative labels are viewed as unsigned ones past the limit
+            labels = raw.view(raw.dtype.str.replace('i', 'u'))
+            limit = min(self._max_lut_size, np.iinfo(raw.dtype).max + 1)
+            if raw.dtype.itemsize < 8:
+                # indexing checks the bounds, so the labels are only scanned
+                # when the table has to grow. Larger labels would be indexed
+                # as negative integers and wrap around instead.
+                try:
+                    return self._lut[:limit][labels]
+                except IndexError:
+                    pass
+            high = labels.max()
+            if high < limit:
+                return self._displayed_lut(high)[labels]
         image = np.where(
             raw > 0, colormaps._low_discrepancy_image(raw, self._seed), 0
         )
         return image
 
+    def _displayed_lut(self, label):
+        """Lookup table of displayed values covering labels up to a label.
+
+        Parameters
+        -------
+        label : int
+            Largest label that must be in the table.
+
+        Returns
+        -------
+        lut : array
+            Displayed value of each label from 0 up to at least `label`.
+        """
+        if label >= len(self._lut):
+            # grow geometrically so that labels added one by one while
+            # painting do not rebuild the table every time
+            size = max(label + 1, 2 * len(self._lut), 256)
+            size = min(size, self._max_lut_size)
+            labels = np.arange(size)
+            self._lut = np.where(
+                labels > 0,
+                colormaps._low_discrepancy_image(labels, self._seed),
+                0,
+            )
+        return self._lut
+
     def new_colormap(self):
         self.seed = np.random.rand()
 
@@ -384,31 +457,83 @@ class Labels(Image):
         return col
 
     def _reset_history(self, event=None):
+        self._staged_history = []
         self._undo_history = deque()
         self._redo_history = deque()
+        self._history_bytes = 0
+
+    def _push_history(self, history, step):
+        """Append a step to the undo or redo history."""
+        history.append(step)
+        self._history_bytes += len(step[1][0])
+
+    def _pop_history(self, history, oldest=False):
+        """Remove the most recent or the oldest step of a history."""
+        step = history.popleft() if oldest else history.pop()
+        self._history_bytes -= len(step[1][0])
+        return step
 
     def _trim_history(self):
-        while (
-            len(self._undo_history) + len(self._redo_history)
-            > self._history_limit
-        ):
-            self._undo_history.popleft()
+        """Drop the oldest steps until the histories fit in the budget."""
+        for history in [self._undo_history, self._redo_history]:
+            while (
+                len(history) > 0
+                and self._history_bytes > self._history_limit
+            ):
+                self._pop_history(history, oldest=True)
+
+    def _stage_history(self, region):
+        """Save the values of a region of the data before editing it.
+
+        Parameters
+        ----------
+        region : tuple of int or slice
+            Region of the data about to be edited, with one index or bounded,
+            unit step slice per axis.
+        """
+        region = union_region(region, None)
+        self._staged_history.append((region, np.array(self.data[region])))
 
     def _save_history(self):
-        self._redo_history = deque()
-        if not self._block_saving:
-            self._undo_history.append(self.data[self.dims.indices].copy())
-            self._trim_history()
+        """Save the staged edits as a single step of the undo history.
+
+        Only the smallest region containing all the edits is stored, with its
+        values from before the edits. While a paint stroke is in progress,
+        edits keep being staged until the stroke is finished.
+        """
+        if self._block_saving or len(self._staged_history) == 0:
+            return
+        staged, self._staged_history = self._staged_history, []
+        region = None
+        for edited, _ in staged:
+            region = union_region(region, edited)
+        # undo the edits on a copy of the region, most recent first
+        values = np.array(self.data[region])
+        for edited, previous in reversed(staged):
+            local = tuple(
+                slice(e.start - r.start, e.stop - r.start)
+                for e, r in zip(edited, region)
+            )
+            values[local] = previous
+        while len(self._redo_history) > 0:
+            self._pop_history(self._redo_history)
+        self._push_history(
+            self._undo_history, (region, compress_array(values))
+        )
+        self._trim_history()
 
     def _load_history(self, before, after):
         if len(before) == 0:
             return
 
-        prev = before.pop()
-        after.append(self.data[self.dims.indices].copy())
-        self.data[self.dims.indices] = prev
+        region, values = self._pop_history(before)
+        self._push_history(after, (region, compress_array(self.data[region])))
+        self._trim_history()
+        self.data[region] = decompress_array(values)
+        self._clear_slice_cache()
 
-        self.refresh()
+        self._dirty_region = union_region(self._dirty_region, region)
+        self._refresh_dirty()
 
     def undo(self):
         self._load_history(self._undo_history, self._redo_history)
@@ -432,8 +557,6 @@ class Labels(Image):
         new_label : int
             Value of the new label to be filled in.
         """
-        self._save_history()
-
         int_coord = np.round(coord).astype(int)
 
         if self.n_dimensional or self.ndim == 2:
@@ -455,14 +578,26 @@ class Labels(Image):
                     matches, labeled_matches == match_label
                 )
 
+        region = mask_bounding_box(matches)
+        if region is not None and not (self.n_dimensional or self.ndim == 2):
+            index = list(self.dims.indices)
+            for d, sl in zip(self.dims.displayed, region):
+                index[d] = sl
+            region = tuple(index)
+        if region is not None:
+            self._stage_history(region)
+
         # Replace target pixels with new_label
         labels[matches] = new_label
 
         if not (self.n_dimensional or self.ndim == 2):
             # if working with just the slice, update the rest of the raw data
             self.data[tuple(self.dims.indices)] = labels
+        self._clear_slice_cache()
+        self._save_history()
 
-        self.refresh()
+        self._dirty_region = union_region(self._dirty_region, region)
+        self._refresh_dirty()
 
     def paint(self, coord, new_label, refresh=True):
         """Paint over existing labels with a new label, using the selected
@@ -477,11 +612,9 @@ class Labels(Image):
             Value of the new label to be filled in.
         refresh : bool
             Whether to refresh view slice or not. Set to False to batch paint
-            calls.
+            calls, which are saved to the undo history as a single step along
+            with the next call that refreshes.
         """
-        if refresh is True:
-            self._save_history()
-
         if self.n_dimensional or self.ndim == 2:
             slice_coord = tuple(
                 [
@@ -522,10 +655,72 @@ class Labels(Image):
             slice_coord = tuple(slice_coord)
 
         # update the labels image
+        self._stage_history(slice_coord)
         self.data[slice_coord] = new_label
+        self._clear_slice_cache()
+        self._dirty_region = union_region(self._dirty_region, slice_coord)
 
         if refresh is True:
-            self.refresh()
+            self._save_history()
+            self._refresh_dirty()
+
+    def _refresh_dirty(self, update_thumbnail=True):
+        """Update the view slice where the data was edited.
+
+        Only the edited region of the view is recolored and sent to be
+        displayed, rather than slicing and coloring the whole view again. If
+        the view cannot be updated in place, e.g. for pyramids, the layer is
+        refreshed instead.
+
+        Parameters
+        ----------
+        update_thumbnail : bool
+            Whether to update the thumbnail. Set to False while painting
+            strokes, and update the thumbnail once the stroke is finished.
+        """
+        region, self._dirty_region = self._dirty_region, None
+        if region is None:
+            return
+        displayed = self.dims.displayed
+        not_displayed = self.dims.not_displayed
+        indices = self.dims.indices
+        if (
+            self.is_pyramid
+            or not self.visible
+            or (self._slicer is not None and self._slicer.pending(self))
+            or self._data_view.shape
+            != tuple(self.level_shapes[0][d] for d in displayed)
+            or any(isinstance(indices[d], slice) for d in not_displayed)
+        ):
+            self._refresh_view()
+            return
+
+        region = union_region(region, None)
+        if any(
+            not region[d].start <= indices[d] < region[d].stop
+            for d in not_displayed
+        ):
+            # the edit is not visible in the current view
+            return
+
+        index = list(indices)
+        for d in displayed:
+            index[d] = region[d]
+        raw = np.asarray(self.data[tuple(index)])
+        raw = raw.transpose(self.dims.displayed_order)
+        if raw.size == 0:
+            return
+        view_region = tuple(region[d] for d in displayed)
+        self._data_raw[view_region] = raw
+        colored = self._raw_to_displayed(raw)
+        self._data_view[view_region] = colored
+        if self._data_thumbnail is not self._data_view:
+            self._data_thumbnail[view_region] = colored
+
+        self.events.set_data(region=view_region)
+        if update_thumbnail:
+            self._invalidate_thumbnail()
+        self._update_coordinates()
 
     def on_mouse_press(self, event):
         """Called whenever mouse pressed in canvas.
@@ -541,8 +736,8 @@ class Labels(Image):
         elif self._mode == Mode.PICKER:
             self.selected_label = self._value or 0
         elif self._mode == Mode.PAINT:
-            # Start painting with new label
-            self._save_history()
+            # Start painting with new label, saving the whole stroke as a
+            # single step of the undo history once it is finished
             self._block_saving = True
             self.paint(self.coordinates, self.selected_label)
             self._last_cursor_coord = copy(self.coordinates)
@@ -569,7 +764,7 @@ class Labels(Image):
                 )
             for c in interp_coord:
                 self.paint(c, self.selected_label, refresh=False)
-            self.refresh()
+            self._refresh_dirty(update_thumbnail=False)
             self._last_cursor_coord = copy(self.coordinates)
 
     def on_mouse_release(self, event):
@@ -580,5 +775,8 @@ class Labels(Image):
         event : Event
             Vispy event
         """
+        if self._mode == Mode.PAINT:
+            self._invalidate_thumbnail()
         self._last_cursor_coord = None
         self._block_saving = False
+        self._save_history()
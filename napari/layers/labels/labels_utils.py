@@ -1,3 +1,5 @@
+import zlib
+
 import numpy as np
 
 
@@ -32,3 +34,93 @@ def interpolate_coordinates(old_coord, new_coord, brush_size):
         coords = coords[1:]
 
     return coords
+
+
+def mask_bounding_box(mask):
+    """Find the smallest region containing all True values of a mask.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        Boolean array.
+
+    Returns
+    ----------
+    region : tuple of slice or None
+        One slice per axis of the mask, or None if the mask is all False.
+    """
+    region = []
+    for axis in range(mask.ndim):
+        other = tuple(a for a in range(mask.ndim) if a != axis)
+        nonzero = np.flatnonzero(np.any(mask, axis=other))
+        if len(nonzero) == 0:
+            return None
+        region.append(slice(int(nonzero[0]), int(nonzero[-1]) + 1))
+    return tuple(region)
+
+
+def union_region(region, other):
+    """Find the smallest region containing two regions.
+
+    Parameters
+    ----------
+    region : tuple of int or slice or None
+        First region, with one index or bounded, unit step slice per axis.
+        None for an empty region.
+    other : tuple of int or slice or None
+        Second region, in the same format.
+
+    Returns
+    ----------
+    union : tuple of slice or None
+        Region containing both regions, with one slice per axis.
+    """
+    if region is None:
+        region = other
+    elif other is None:
+        other = region
+    if region is None:
+        return None
+    union = []
+    for a, b in zip(region, other):
+        a = a if isinstance(a, slice) else slice(a, a + 1)
+        b = b if isinstance(b, slice) else slice(b, b + 1)
+        union.append(
+            slice(int(min(a.start, b.start)), int(max(a.stop, b.stop)))
+        )
+    return tuple(union)
+
+
+def compress_array(array):
+    """Losslessly compress an array, e.g. for storing it in a history.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array to compress.
+
+    Returns
+    ----------
+    compressed : tuple
+        Compressed bytes, dtype and shape of the array.
+    """
+    array = np.ascontiguousarray(array)
+    return zlib.compress(array.tobytes(), 1), array.dtype, array.shape
+
+
+def decompress_array(compressed):
+    """Restore an array compressed with `compress_array`.
+
+    Parameters
+    ----------
+    compressed : tuple
+        Compressed bytes, dtype and shape of the array.
+
+    Returns
+    ----------
+    array : np.ndarray
+        Restored array.
+    """
+    payload, dtype, shape = compressed
+    array = np.frombuffer(zlib.decompress(payload), dtype=dtype)
+    return array.reshape(shape).copy()
@@ -1,6 +1,12 @@
 import numpy as np
 
-from napari.layers.labels.labels_utils import interpolate_coordinates
+from napari.layers.labels.labels_utils import (
+    compress_array,
+    decompress_array,
+    interpolate_coordinates,
+    mask_bounding_box,
+    union_region,
+)
 
 
 def test_interpolate_coordinates():
@@ -25,3 +31,36 @@ def test_interpolate_coordinates():
         ]
     )
     assert np.all(coords == expected_coords)
+
+
+def test_mask_bounding_box():
+    mask = np.zeros((10, 8), dtype=bool)
+    assert mask_bounding_box(mask) is None
+    mask[2, 3] = True
+    mask[5, 1] = True
+    assert mask_bounding_box(mask) == (slice(2, 6), slice(1, 4))
+
+
+def test_union_region():
+    region = (3, slice(2, 5))
+    assert union_region(None, None) is None
+    assert union_region(region, None) == (slice(3, 4), slice(2, 5))
+    assert union_region(region, (slice(0, 2), slice(4, 9))) == (
+        slice(0, 4),
+        slice(2, 9),
+    )
+
+
+def test_compress_array():
+    array = np.zeros((50, 40), dtype=np.uint32)
+    array[10:20, 5:15] = 7
+    compressed = compress_array(array[::2])
+    assert len(compressed[0]) < array[::2].nbytes
+    restored = decompress_array(compressed)
+    assert restored.dtype == np.uint32
+    np.testing.assert_array_equal(restored, array[::2])
+    # the restored array is a writable copy, independent of the source
+    assert restored.flags.writeable
+    assert not np.shares_memory(restored, array)
+    restored[0, 0] = 1
+    assert array[0, 0] == 0
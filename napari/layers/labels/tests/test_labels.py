@@ -191,6 +191,43 @@ def test_seed():
     assert layer.seed == 0.7
 
 
+def test_raw_to_displayed_lookup_table():
+    """Test labels mapped through the lookup table match the formula."""
+    np.random.seed(0)
+    data = np.random.randint(20, size=(10, 15))
+    layer = Labels(data)
+    phi = 1.6180339887498948482
+
+    def expected(raw, seed):
+        displayed = np.clip((seed + raw / phi) % 1, 0.00001, 1 - 0.00001)
+        return np.where(raw > 0, displayed, 0)
+
+    for seed in [0.5, 0.9]:
+        layer.seed = seed
+        for dtype in [np.uint8, np.int16, np.int32, np.uint32, np.int64]:
+            raw = np.random.randint(100, size=(30, 40)).astype(dtype)
+            np.testing.assert_array_equal(
+                layer._raw_to_displayed(raw), expected(raw, seed)
+            )
+        # the table is extended when larger labels appear
+        raw = np.random.randint(5000, size=(30, 40))
+        np.testing.assert_array_equal(
+            layer._raw_to_displayed(raw), expected(raw, seed)
+        )
+        assert len(layer._lut) > raw.max()
+
+    # negative labels and labels outside of the table are mapped directly
+    raw = np.array([[0, 3, layer._max_lut_size], [-2, 1, 7]])
+    np.testing.assert_array_equal(
+        layer._raw_to_displayed(raw), expected(raw, 0.9)
+    )
+    for dtype in [np.int8, np.int16, np.int32, np.int64]:
+        raw = np.array([[0, 3, -1], [-2, 1, 7]], dtype=dtype)
+        np.testing.assert_array_equal(
+            layer._raw_to_displayed(raw), expected(raw, 0.9)
+        )
+
+
 def test_num_colors():
     """Test setting number of colors in colormap."""
     np.random.seed(0)
@@ -329,6 +366,115 @@ def test_fill():
     assert np.unique(layer.data[5:10, 5:10]) == 2
 
 
+def test_undo_redo():
+    """Test undoing and redoing paint strokes and fills."""
+    np.random.seed(0)
+    data = np.random.randint(20, size=(4, 30, 30))
+    layer = Labels(data.copy())
+    layer.dims.set_point(0, 1)
+    layer.brush_size = 4
+    original = layer.data.copy()
+
+    # a stroke of several batched paint calls is a single step
+    layer._block_saving = True
+    for coord in [[1, 5, 5], [1, 6, 8], [1, 8, 10]]:
+        layer.paint(coord, 25, refresh=False)
+    layer._block_saving = False
+    layer._save_history()
+    painted = layer.data.copy()
+    assert len(layer._undo_history) == 1
+
+    # a fill across all dimensions, undone while viewing another slice
+    layer.n_dimensional = True
+    layer.fill([0, 0, 0], data[0, 0, 0], 30)
+    layer.dims.set_point(0, 3)
+    filled = layer.data.copy()
+    assert len(layer._undo_history) == 2
+
+    layer.undo()
+    np.testing.assert_array_equal(layer.data, painted)
+    layer.undo()
+    np.testing.assert_array_equal(layer.data, original)
+    layer.undo()
+    np.testing.assert_array_equal(layer.data, original)
+    layer.redo()
+    layer.redo()
+    np.testing.assert_array_equal(layer.data, filled)
+
+    # only the bounding box of each edit is stored
+    region, _ = layer._undo_history[0]
+    assert region == (slice(1, 2), slice(4, 10), slice(4, 12))
+
+    # a new edit clears the redo history
+    layer.undo()
+    layer.paint([3, 20, 20], 40)
+    assert len(layer._redo_history) == 0
+    assert np.all(layer.data[3, 18:22, 18:22] == 40)
+
+
+def test_history_limit():
+    """Test the oldest steps are dropped when exceeding the byte budget."""
+    np.random.seed(0)
+    data = np.random.randint(2 ** 16, size=(100, 100))
+    layer = Labels(data)
+    layer._history_limit = 2000
+    layer.brush_size = 40
+    for i in range(10):
+        layer.paint([50, 50], i)
+    # the first step stores random labels, the others a single label that
+    # compresses well
+    assert len(layer._undo_history) == 9
+    assert layer._history_bytes <= layer._history_limit
+
+    def stored_bytes():
+        steps = list(layer._undo_history) + list(layer._redo_history)
+        return sum(len(values[0]) for _, values in steps)
+
+    assert layer._history_bytes == stored_bytes()
+    for i in range(10):
+        layer.undo()
+    assert np.all(layer.data[30:70, 30:70] == 0)
+    assert layer._history_bytes == stored_bytes()
+
+    # undone steps count against the budget too
+    layer.redo()
+    layer._history_limit = stored_bytes() - 1
+    layer.undo()
+    assert layer._history_bytes == stored_bytes()
+    assert layer._history_bytes <= layer._history_limit
+    assert len(layer._redo_history) == 8
+    layer.paint([50, 50], 1)
+    assert len(layer._redo_history) == 0
+    assert layer._history_bytes == stored_bytes()
+
+
+def test_paint_updates_region():
+    """Test painting only updates the painted region of the view."""
+    np.random.seed(0)
+    data = np.random.randint(20, size=(4, 30, 30))
+    layer = Labels(data)
+    layer.dims.set_point(0, 2)
+
+    regions = []
+    layer.events.set_data.connect(lambda e: regions.append(e.region))
+    layer.brush_size = 4
+    layer.paint([2, 10, 10], 50)
+    assert regions == [(slice(8, 12), slice(8, 12))]
+    np.testing.assert_array_equal(
+        layer._data_view, layer._raw_to_displayed(layer.data[2])
+    )
+
+    # painting on another slice leaves the view untouched
+    layer.paint([1, 10, 10], 50)
+    assert len(regions) == 1
+
+    layer.fill([2, 10, 10], 50, 60)
+    assert regions[-1] == (slice(8, 12), slice(8, 12))
+    np.testing.assert_array_equal(
+        layer._data_view, layer._raw_to_displayed(layer.data[2])
+    )
+
+
 def test_value():
     """Test getting the value of the data at the current coordinates."""
     np.random.seed(0)
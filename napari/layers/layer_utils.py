@@ -1,3 +1,4 @@
+import dask.array as da
 import numpy as np
 
 
@@ -22,6 +23,62 @@ def increment_unnamed_colormap(name, names):
     return name
 
 
+def is_large_lazy(data):
+    """Whether data is lazily loaded and too large to be read at once.
+
+    Parameters
+    -------
+    data : array
+        Data to check.
+
+    Returns
+    -------
+    large_lazy : bool
+        True if data is not a numpy array and has more than 1e6 elements.
+    """
+    return not isinstance(data, np.ndarray) and np.prod(data.shape) > 1e6
+
+
+def sample_data(data, max_samples=100_000, seed=0):
+    """Randomly sample values of data.
+
+    Lazy data is sampled from a few randomly chosen whole chunks, so that
+    each chunk only needs to be read once, and the chunks are read in
+    parallel.
+
+    Parameters
+    -------
+    data : array
+        Data to sample.
+    max_samples : int
+        Maximum number of values returned.
+    seed : int
+        Seed of the random number generator, so that sampling is repeatable.
+
+    Returns
+    -------
+    samples : np.ndarray
+        One dimensional array of sampled values.
+    """
+    rng = np.random.RandomState(seed)
+    if np.prod(data.shape) == 0:
+        return np.asarray(data).ravel()
+    if not isinstance(data, np.ndarray):
+        data = data if isinstance(data, da.Array) else da.from_array(data)
+        nblocks = int(np.prod(data.numblocks))
+        block_size = np.prod(data.chunksize)
+        nread = int(np.clip(np.ceil(max_samples / block_size), 3, 32))
+        chosen = rng.permutation(nblocks)[:nread]
+        blocks = [
+            data.blocks[np.unravel_index(i, data.numblocks)] for i in chosen
+        ]
+        data = np.concatenate([np.ravel(b) for b in da.compute(*blocks)])
+    if np.prod(data.shape) <= max_samples:
+        return np.ravel(data)
+    index = tuple(rng.randint(0, size, max_samples) for size in data.shape)
+    return np.asarray(data[index])
+
+
 def calc_data_range(data):
     """Calculate range of data values. If all values are equal return [0, 1].
 
@@ -38,10 +95,13 @@ def calc_data_range(data):
     Notes
     -----
     If the data type is uint8, no calculation is performed, and 0-255 is
-    returned.
+    returned. The range of large lazily loaded data is estimated from a
+    random sample of it, see `sample_data`.
     """
     if data.dtype == np.uint8:
         return [0, 255]
+    if is_large_lazy(data):
+        return calc_data_range(sample_data(data))
     if np.prod(data.shape) > 1e6:
         # If data is very large take the average of the top, bottom, and
         # middle slices
@@ -65,6 +125,33 @@ def calc_data_range(data):
     return [float(min_val), float(max_val)]
 
 
+def calc_percentile_range(data, percentiles=(0.1, 99.9)):
+    """Calculate contrast limits from percentiles of the data values.
+
+    Unlike the minimum and maximum, percentiles are not thrown off by a few
+    outlying values such as hot pixels.
+
+    Parameters
+    -------
+    data : array
+        Data, or a sample of it, to calculate the percentiles over.
+    percentiles : 2-tuple of float
+        Lower and upper percentiles, between 0 and 100.
+
+    Returns
+    -------
+    values : list of float
+        Values of the percentiles, or the range of the data if they are
+        equal.
+    """
+    if is_large_lazy(data):
+        data = sample_data(data)
+    low, high = np.percentile(data, percentiles)
+    if low == high:
+        return calc_data_range(np.asarray(data))
+    return [float(low), float(high)]
+
+
 def segment_normal(a, b, p=(0, 0, 1)):
     """Determines the unit normal of the vector from a to b.
 
@@ -1,14 +1,16 @@
 from typing import Union
 from xml.etree.ElementTree import Element
 import numpy as np
-import itertools
 from copy import copy, deepcopy
+from scipy.spatial import cKDTree
 from ..base import Layer
 from ...utils.event import Event
-from ...utils.misc import ensure_iterable
+from ...utils.buffers import AppendBuffer
+from ...utils.misc import transform_color
 from ...utils.status_messages import format_float
-from vispy.color import get_color_names, Color
+from vispy.color import get_color_names, get_color_dict, Color
 from ._constants import Symbol, SYMBOL_ALIAS, Mode
+from .slice_index import SliceIndex
 
 
 class Points(Layer):
@@ -28,10 +30,10 @@ class Points(Layer):
         broadcastable to the same shape as the data.
     edge_width : float
         Width of the symbol edge in pixels.
-    edge_color : str
-        Color of the point marker border.
-    face_color : str
-        Color of the point marker body.
+    edge_color : str, array or list
+        Color of the point marker border, or one color for each point.
+    face_color : str, array or list
+        Color of the point marker body, or one color for each point.
     n_dimensional : bool
         If True, renders points not just in central plane but also in all
         n-dimensions according to specified point marker size.
@@ -63,10 +65,10 @@ class Points(Layer):
         shape as the layer `data`.
     edge_width : float
         Width of the marker edges in pixels for all points
-    edge_color : list of str (N,)
-        List of edge color strings, one for each point.
-    face_color : list of str (N,)
-        List of face color strings, one for each point.
+    edge_color : array (N, 4)
+        RGBA edge color of each point.
+    face_color : array (N, 4)
+        RGBA face color of each point.
     current_size : float
         Size of the marker for the next point to be added or the currently
         selected point.
@@ -102,6 +104,13 @@ class Points(Layer):
     _selected_view :
         Integer indices of selected points in the currently viewed slice within
         the `_data_view` array.
+    _slice_index : SliceIndex or None
+        Index of the points sorted along the non-displayed axes, used to find
+        the points in a slice. Rebuilt when it is None.
+    _view_tree : cKDTree or None
+        KD-tree of the points in the currently viewed slice, used to find the
+        points under the cursor. Only built once the same view has been
+        queried a few times.
     _selected_box : array (4, 2) or None
         Four corners of any box either around currently selected points or
         being created during a drag action. Starting in the top left and
@@ -115,6 +124,10 @@ class Points(Layer):
     # If more points are present then they are randomly subsampled
     _max_points_thumbnail = 1024
 
+    # Number of queries of the same view after which a KD-tree of the points
+    # in view is built to find the points under the cursor
+    _view_queries_tree = 3
+
     def __init__(
         self,
         data=None,
@@ -160,7 +173,7 @@ class Points(Layer):
         self._colors = get_color_names()
 
         # Save the point coordinates
-        self._data = np.asarray(data)
+        self._data = AppendBuffer(data)
         self.dims.clip = False
 
         # Save the point style params
@@ -211,22 +224,19 @@ class Points(Layer):
         self._size_view = 0
         # Full data indices of points located in the currently viewed slice
         self._indices_view = []
+        self._slice_index = None
+        self._data_range = None
+        self._view_tree = None
+        self._view_queries = 0
+        self._view_radius = 0
 
         self._drag_box = None
         self._drag_box_stored = None
         self._is_selecting = False
         self._clipboard = {}
 
-        self.edge_color = list(
-            itertools.islice(
-                ensure_iterable(edge_color, color=True), 0, len(self.data)
-            )
-        )
-        self.face_color = list(
-            itertools.islice(
-                ensure_iterable(face_color, color=True), 0, len(self.data)
-            )
-        )
+        self._edge_color = AppendBuffer(self._broadcast_colors(edge_color))
+        self._face_color = AppendBuffer(self._broadcast_colors(face_color))
         self.size = size
 
         # Trigger generation of view slice and thumbnail
@@ -235,47 +245,82 @@ class Points(Layer):
     @property
     def data(self) -> np.ndarray:
         """(N, D) array: coordinates for N points in D dimensions."""
-        return self._data
+        return self._data.data
 
     @data.setter
     def data(self, data: np.ndarray):
         cur_npoints = len(self._data)
-        self._data = data
+        self._data = AppendBuffer(data)
+        self._slice_index = None
+        self._data_range = None
 
         # Adjust the size array when the number of points has changed
-        if len(data) < cur_npoints:
+        if len(self._data) < cur_npoints:
             # If there are now less points, remove the size and colors of the
             # extra ones
-            with self.events.set_data.blocker():
-                self.edge_color = self.edge_color[: len(data)]
-                self.face_color = self.face_color[: len(data)]
-                self.size = self._size[: len(data)]
+            npoints = len(self._data)
+            self._edge_color = AppendBuffer(self.edge_color[:npoints])
+            self._face_color = AppendBuffer(self.face_color[:npoints])
+            self._size = AppendBuffer(self.size[:npoints])
 
-        elif len(data) > cur_npoints:
+        elif len(self._data) > cur_npoints:
             # If there are now more points, add the size and colors of the
             # new ones
-            with self.events.set_data.blocker():
-                adding = len(data) - cur_npoints
-                if len(self._size) > 0:
-                    new_size = copy(self._size[-1])
-                    for i in self.dims.displayed:
-                        new_size[i] = self.current_size
-                else:
-                    # Add the default size, with a value for each dimension
-                    new_size = np.repeat(
-                        self.current_size, self._size.shape[1]
-                    )
-                size = np.repeat([new_size], adding, axis=0)
-                self.edge_color += [
-                    self.current_edge_color for i in range(adding)
-                ]
-                self.face_color += [
-                    self.current_face_color for i in range(adding)
-                ]
-                self.size = np.concatenate((self._size, size), axis=0)
+            adding = len(self._data) - cur_npoints
+            self._size.append(
+                np.repeat([self._new_point_size()], adding, axis=0)
+            )
+            edge_color = transform_color(self.current_edge_color)
+            self._edge_color.append(np.repeat(edge_color, adding, axis=0))
+            face_color = transform_color(self.current_face_color)
+            self._face_color.append(np.repeat(face_color, adding, axis=0))
         self._update_dims()
         self.events.data()
 
+    def _new_point_size(self):
+        """Size in each dimension of a newly added point.
+
+        Returns
+        -------
+        size : array (D,)
+            Size of the last point with the displayed dimensions set to the
+            current size, or the current size if there are no points.
+        """
+        if len(self.size) > 0:
+            new_size = copy(self.size[-1])
+            for i in self.dims.displayed:
+                new_size[i] = self.current_size
+        else:
+            # Add the default size, with a value for each dimension
+            new_size = np.repeat(self.current_size, self.size.shape[1])
+        return new_size
+
+    def _append_points(self, data, size, edge_color, face_color):
+        """Append points to the end of the layer without copying the others.
+
+        Parameters
+        ----------
+        data : array (M, D)
+            Coordinates of the new points.
+        size : array (M, D)
+            Sizes of the new points.
+        edge_color : array (M, 4)
+            RGBA edge colors of the new points.
+        face_color : array (M, 4)
+            RGBA face colors of the new points.
+        """
+        data = np.asarray(data)
+        self._data.append(data)
+        self._size.append(size)
+        self._edge_color.append(edge_color)
+        self._face_color.append(face_color)
+        if self._data_range is not None and len(data) > 0:
+            mins, maxs = self._data_range
+            self._data_range = (
+                np.minimum(mins, data.min(axis=0)),
+                np.maximum(maxs, data.max(axis=0)),
+            )
+
     def _get_ndim(self):
         """Determine number of dimensions of the layer."""
         return self.data.shape[1]
@@ -286,8 +331,12 @@ class Points(Layer):
             maxs = np.ones(self.data.shape[1], dtype=int)
             mins = np.zeros(self.data.shape[1], dtype=int)
         else:
-            maxs = np.max(self.data, axis=0)
-            mins = np.min(self.data, axis=0)
+            if self._data_range is None:
+                self._data_range = (
+                    np.min(self.data, axis=0),
+                    np.max(self.data, axis=0),
+                )
+            mins, maxs = self._data_range
 
         return [(min, max, 1) for min, max in zip(mins, maxs)]
 
@@ -300,7 +349,7 @@ class Points(Layer):
     def n_dimensional(self, n_dimensional: bool) -> None:
         self._n_dimensional = n_dimensional
         self.events.n_dimensional()
-        self.refresh()
+        self._refresh_view()
 
     @property
     def symbol(self) -> str:
@@ -323,20 +372,19 @@ class Points(Layer):
     @property
     def size(self) -> Union[int, float, np.ndarray, list]:
         """(N, D) array: size of all N points in D dimensions."""
-        return self._size
+        return self._size.data
 
     @size.setter
     def size(self, size: Union[int, float, np.ndarray, list]) -> None:
         try:
-            self._size = np.broadcast_to(size, self.data.shape).copy()
+            size = np.broadcast_to(size, self.data.shape).copy()
         except Exception:
             try:
-                self._size = np.broadcast_to(
-                    size, self.data.shape[::-1]
-                ).T.copy()
+                size = np.broadcast_to(size, self.data.shape[::-1]).T.copy()
             except Exception:
                 raise ValueError("Size is not compatible for broadcasting")
-        self.refresh()
+        self._size = AppendBuffer(size)
+        self._refresh_view()
 
     @property
     def current_size(self) -> Union[int, float]:
@@ -349,7 +397,7 @@ class Points(Layer):
         if self._update_properties and len(self.selected_data) > 0:
             for i in self.selected_data:
                 self.size[i, :] = (self.size[i, :] > 0) * size
-            self.refresh()
+            self._refresh_view()
         self.status = format_float(self.current_size)
         self.events.size()
 
@@ -366,6 +414,46 @@ class Points(Layer):
         self.events.edge_width()
         self.events.highlight()
 
+    def _broadcast_colors(self, colors):
+        """Convert colors to one RGBA color for each point.
+
+        Parameters
+        ----------
+        colors : str, array or list
+            A single color used for all points, or one color for each point.
+
+        Returns
+        -------
+        rgba : array (N, 4)
+            RGBA color of each point.
+        """
+        rgba = transform_color(colors)
+        if len(rgba) == 1:
+            return np.repeat(rgba, len(self.data), axis=0)
+        return rgba[: len(self.data)]
+
+    @property
+    def edge_color(self) -> np.ndarray:
+        """(N, 4) array: RGBA edge color of each point."""
+        return self._edge_color.data
+
+    @edge_color.setter
+    def edge_color(self, edge_color: Union[str, np.ndarray, list]) -> None:
+        self._edge_color = AppendBuffer(self._broadcast_colors(edge_color))
+        self.events.edge_color()
+        self.events.highlight()
+
+    @property
+    def face_color(self) -> np.ndarray:
+        """(N, 4) array: RGBA face color of each point."""
+        return self._face_color.data
+
+    @face_color.setter
+    def face_color(self, face_color: Union[str, np.ndarray, list]) -> None:
+        self._face_color = AppendBuffer(self._broadcast_colors(face_color))
+        self.events.face_color()
+        self.events.highlight()
+
     @property
     def current_edge_color(self) -> str:
         """str: edge color of marker for the next added point."""
@@ -376,8 +464,8 @@ class Points(Layer):
     def current_edge_color(self, edge_color: str) -> None:
         self._current_edge_color = edge_color
         if self._update_properties and len(self.selected_data) > 0:
-            for i in self.selected_data:
-                self.edge_color[i] = edge_color
+            rgba = transform_color(edge_color)[0]
+            self.edge_color[self.selected_data] = rgba
         self.events.edge_color()
         self.events.highlight()
 
@@ -391,8 +479,8 @@ class Points(Layer):
     def current_face_color(self, face_color: str) -> None:
         self._current_face_color = face_color
         if self._update_properties and len(self.selected_data) > 0:
-            for i in self.selected_data:
-                self.face_color[i] = face_color
+            rgba = transform_color(face_color)[0]
+            self.face_color[self.selected_data] = rgba
         self.events.face_color()
         self.events.highlight()
 
@@ -426,25 +514,21 @@ class Points(Layer):
     @selected_data.setter
     def selected_data(self, selected_data):
         self._selected_data = list(selected_data)
-        selected = []
-        for c in self._selected_data:
-            if c in self._indices_view:
-                ind = list(self._indices_view).index(c)
-                selected.append(ind)
+        selected = self._view_positions(self._selected_data)
         self._selected_view = selected
         self._selected_box = self.interaction_box(self._selected_view)
 
         # Update properties based on selected points
         index = self._selected_data
-        edge_colors = list(set([self.edge_color[i] for i in index]))
+        edge_colors = np.unique(self.edge_color[index], axis=0)
         if len(edge_colors) == 1:
-            edge_color = edge_colors[0]
+            edge_color = color_name(edge_colors[0], self.current_edge_color)
             with self.block_update_properties():
                 self.current_edge_color = edge_color
 
-        face_colors = list(set([self.face_color[i] for i in index]))
+        face_colors = np.unique(self.face_color[index], axis=0)
         if len(face_colors) == 1:
-            face_color = face_colors[0]
+            face_color = color_name(face_colors[0], self.current_face_color)
             with self.block_update_properties():
                 self.current_face_color = face_color
 
@@ -568,27 +652,118 @@ class Points(Layer):
         disp = list(self.dims.displayed)
         indices = np.array(indices)
         if len(self.data) > 0:
+            slice_index = self._get_slice_index(not_disp)
             if self.n_dimensional is True and self.ndim > 2:
-                distances = abs(self.data[:, not_disp] - indices[not_disp])
-                sizes = self.size[:, not_disp] / 2
+                # Only points close enough along the first non-displayed
+                # axis for their size to reach the slice are checked
+                low = high = 0
+                if len(not_disp) > 0:
+                    radius = self.size[:, not_disp[0]].max() / 2
+                    low = indices[not_disp[0]] - radius
+                    high = indices[not_disp[0]] + radius
+                candidates = slice_index.query_range(self.data, low, high)
+                distances = abs(
+                    self.data[np.ix_(candidates, not_disp)] - indices[not_disp]
+                )
+                sizes = self.size[np.ix_(candidates, not_disp)] / 2
                 matches = np.all(distances <= sizes, axis=1)
-                in_slice_data = self.data[np.ix_(matches, disp)]
+                indices = candidates[matches]
+                in_slice_data = self.data[np.ix_(indices, disp)]
                 size_match = sizes[matches]
                 size_match[size_match == 0] = 1
                 scale_per_dim = (size_match - distances[matches]) / size_match
                 scale_per_dim[size_match == 0] = 1
                 scale = np.prod(scale_per_dim, axis=1)
-                indices = np.where(matches)[0].astype(int)
                 return in_slice_data, indices, scale
             else:
-                data = self.data[:, not_disp].astype('int')
-                matches = np.all(data == indices[not_disp], axis=1)
-                in_slice_data = self.data[np.ix_(matches, disp)]
-                indices = np.where(matches)[0].astype(int)
+                indices = slice_index.query(self.data, indices)
+                in_slice_data = self.data[np.ix_(indices, disp)]
                 return in_slice_data, indices, 1
         else:
             return [], [], []
 
+    def _get_slice_index(self, axes):
+        """Get the index of points along the non-displayed axes.
+
+        The index is rebuilt if it does not exist, was built for other axes,
+        or many points have been added since it was built.
+
+        Parameters
+        ----------
+        axes : list of int
+            Non-displayed axes.
+
+        Returns
+        ----------
+        slice_index : SliceIndex
+            Index of the points along the non-displayed axes.
+        """
+        index = self._slice_index
+        if (
+            index is None
+            or index.axes != tuple(axes)
+            or len(self.data) < len(index)
+            or len(self.data) - len(index) > max(1024, len(index) // 8)
+        ):
+            index = SliceIndex(self.data, axes)
+            self._slice_index = index
+        return index
+
+    def _view_positions(self, indices):
+        """Positions within the view of those points that are in view.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Indices of points.
+
+        Returns
+        ----------
+        positions : list of int
+            Positions in `_data_view` of the points that are in view, in the
+            same order as `indices`.
+        """
+        view = np.asarray(self._indices_view, dtype=int)
+        indices = np.asarray(indices, dtype=int)
+        if len(view) == 0 or len(indices) == 0:
+            return []
+        positions = np.searchsorted(view, indices)
+        positions = np.clip(positions, 0, len(view) - 1)
+        found = view[positions] == indices
+        return positions[found].tolist()
+
+    def _view_candidates(self, coord):
+        """Positions of the points in view that may be under a coordinate.
+
+        Until the same view has been queried `_view_queries_tree` times all
+        points in view are returned. After that a KD-tree of the points in
+        view is built, and only points closer than the largest point size are
+        returned.
+
+        Parameters
+        ----------
+        coord : sequence of float
+            Coordinate in the displayed dimensions.
+
+        Returns
+        ----------
+        candidates : array
+            Positions in `_data_view` of the candidate points.
+        """
+        self._view_queries += 1
+        if (
+            self._view_tree is None
+            and self._view_queries >= self._view_queries_tree
+        ):
+            self._view_tree = cKDTree(self._data_view)
+            self._view_radius = np.max(self._size_view) / 2
+        if self._view_tree is None:
+            return np.arange(len(self._data_view))
+        candidates = self._view_tree.query_ball_point(
+            coord, self._view_radius, p=np.inf
+        )
+        return np.array(candidates, dtype=int)
+
     def _get_value(self):
         """Determine if points at current coordinates.
 
@@ -599,18 +774,15 @@ class Points(Layer):
         """
         # Display points if there are any in this slice
         if len(self._data_view) > 0:
+            coord = [self.coordinates[d] for d in self.dims.displayed]
+            candidates = self._view_candidates(coord)
             # Get the point sizes
-            distances = abs(
-                self._data_view
-                - [self.coordinates[d] for d in self.dims.displayed]
-            )
-            in_slice_matches = np.all(
-                distances <= np.expand_dims(self._size_view, axis=1) / 2,
-                axis=1,
-            )
-            indices = np.where(in_slice_matches)[0]
+            distances = abs(self._data_view[candidates] - coord)
+            sizes = np.expand_dims(self._size_view[candidates], axis=1)
+            in_slice_matches = np.all(distances <= sizes / 2, axis=1)
+            indices = candidates[in_slice_matches]
             if len(indices) > 0:
-                selection = self._indices_view[indices[-1]]
+                selection = self._indices_view[indices.max()]
             else:
                 selection = None
         else:
@@ -618,6 +790,16 @@ class Points(Layer):
 
         return selection
 
+    def refresh(self, event=None):
+        """Refresh all layer data based on current view slice.
+
+        The range and slice index of the points are rebuilt, as the data
+        might have been edited in place.
+        """
+        self._data_range = None
+        self._slice_index = None
+        self._update_dims()
+
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
 
@@ -641,13 +823,11 @@ class Points(Layer):
         self._data_view = data
         self._size_view = sizes
         self._indices_view = indices
+        self._view_tree = None
+        self._view_queries = 0
         # Make sure if changing planes any selected points not in the current
         # plane are removed
-        selected = []
-        for c in self.selected_data:
-            if c in self._indices_view:
-                ind = list(self._indices_view).index(c)
-                selected.append(ind)
+        selected = self._view_positions(self.selected_data)
         self._selected_view = selected
         if len(selected) == 0:
             self.selected_data
@@ -679,14 +859,14 @@ class Points(Layer):
             if len(self._selected_view) > 0:
                 index = copy(self._selected_view)
                 if self._value is not None:
-                    hover_point = list(self._indices_view).index(self._value)
+                    hover_point = self._view_positions([self._value])[0]
                     if hover_point in index:
                         pass
                     else:
                         index.append(hover_point)
                 index.sort()
             else:
-                hover_point = list(self._indices_view).index(self._value)
+                hover_point = self._view_positions([self._value])[0]
                 index = [hover_point]
 
             self._highlight_index = index
@@ -724,18 +904,18 @@ class Points(Layer):
                 inds = np.random.randint(
                     0, len(self._data_view), self._max_points_thumbnail
                 )
-                points = self._data_view[inds]
             else:
-                points = self._data_view
+                inds = np.arange(len(self._data_view))
+            points = self._data_view[inds]
             coords = np.floor(
                 (points[:, -2:] - min_vals[-2:] + 0.5) * zoom_factor
             ).astype(int)
             coords = np.clip(
                 coords, 0, np.subtract(self._thumbnail_shape[:2], 1)
             )
-            for i, c in enumerate(coords):
-                col = self.face_color[self._indices_view[i]]
-                colormapped[c[0], c[1], :] = Color(col).rgba
+            # Scatter all colors at once, later points drawn on top
+            colors = self.face_color[self._indices_view[inds]]
+            colormapped[coords[:, 0], coords[:, 1]] = colors
         colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
@@ -746,21 +926,32 @@ class Points(Layer):
         ----------
         coord : sequence of indices to add point at
         """
-        self.data = np.append(self.data, [coord], axis=0)
+        self._append_points(
+            [coord],
+            [self._new_point_size()],
+            transform_color(self.current_edge_color),
+            transform_color(self.current_face_color),
+        )
+        self._update_dims()
+        self.events.data()
 
     def remove_selected(self):
         """Removes selected points if any."""
         index = copy(self.selected_data)
         index.sort()
         if len(index) > 0:
-            self._size = np.delete(self._size, index, axis=0)
-            for i in index[::-1]:
-                del self.edge_color[i]
-                del self.face_color[i]
+            self._size.delete(index)
+            self._edge_color.delete(index)
+            self._face_color.delete(index)
             if self._value in self.selected_data:
                 self._value = None
             self.selected_data = []
-            self.data = np.delete(self.data, index, axis=0)
+            if self._slice_index is not None:
+                self._slice_index.remove(index)
+            self._data.delete(index)
+            self._data_range = None
+            self._update_dims()
+            self.events.data()
 
     def _move(self, index, coord):
         """Moves points relative drag start location.
@@ -782,7 +973,8 @@ class Points(Layer):
             self.data[np.ix_(index, disp)] = (
                 self.data[np.ix_(index, disp)] + shift
             )
-            self.refresh()
+            self._data_range = None
+            self._refresh_view()
 
     def _copy_data(self):
         """Copy selected points to clipboard."""
@@ -790,12 +982,8 @@ class Points(Layer):
             self._clipboard = {
                 'data': deepcopy(self.data[self.selected_data]),
                 'size': deepcopy(self.size[self.selected_data]),
-                'edge_color': deepcopy(
-                    [self.edge_color[i] for i in self.selected_data]
-                ),
-                'face_color': deepcopy(
-                    [self.face_color[i] for i in self.selected_data]
-                ),
+                'edge_color': deepcopy(self.edge_color[self.selected_data]),
+                'face_color': deepcopy(self.face_color[self.selected_data]),
                 'indices': self.dims.indices,
             }
         else:
@@ -814,15 +1002,11 @@ class Points(Layer):
                 for i in not_disp
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
-            self._data = np.append(self.data, data, axis=0)
-            self._size = np.append(
-                self.size, deepcopy(self._clipboard['size']), axis=0
-            )
-            self.edge_color = self.edge_color + deepcopy(
-                self._clipboard['edge_color']
-            )
-            self.face_color = self.face_color + deepcopy(
-                self._clipboard['face_color']
+            self._append_points(
+                data,
+                deepcopy(self._clipboard['size']),
+                self._clipboard['edge_color'],
+                self._clipboard['face_color'],
             )
             self._selected_view = list(
                 range(npoints, npoints + len(self._clipboard['data']))
@@ -830,7 +1014,7 @@ class Points(Layer):
             self._selected_data = list(
                 range(totpoints, totpoints + len(self._clipboard['data']))
             )
-            self.refresh()
+            self._refresh_view()
 
     def to_xml_list(self):
         """Convert the points to a list of xml elements according to the svg
@@ -856,9 +1040,9 @@ class Points(Layer):
             cx = str(d[0])
             cy = str(d[1])
             r = str(s / 2)
-            face_color = (255 * Color(self.face_color[i]).rgba).astype(np.int)
+            face_color = (255 * self.face_color[i]).astype(np.int)
             fill = f'rgb{tuple(face_color[:3])}'
-            edge_color = (255 * Color(self.edge_color[i]).rgba).astype(np.int)
+            edge_color = (255 * self.edge_color[i]).astype(np.int)
             stroke = f'rgb{tuple(edge_color[:3])}'
 
             element = Element(
@@ -929,6 +1113,32 @@ class Points(Layer):
             self._set_highlight(force=True)
 
 
+def color_name(rgba, current):
+    """Name of an RGBA color, preferring the current color name.
+
+    Parameters
+    ----------
+    rgba : array (4,)
+        RGBA color.
+    current : str
+        Current color name, returned if it names the same color.
+
+    Returns
+    -------
+    name : str
+        `current` if it names `rgba`, else a matching color name if there is
+        one, else the hex string of `rgba`.
+    """
+    if np.allclose(transform_color(current)[0], rgba, atol=1e-3):
+        return current
+    color = Color(rgba)
+    names = [n for n, h in get_color_dict().items() if h == color.hex]
+    if len(names) > 0 and color.alpha == 1:
+        # Prefer full names, such as 'black' over 'k'
+        return min(names, key=lambda n: (-len(n), n))
+    return color.hex
+
+
 def create_box(data):
     """Create the axis aligned interaction box of a list of points
 
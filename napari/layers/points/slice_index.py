@@ -0,0 +1,112 @@
+import numpy as np
+
+
+class SliceIndex:
+    """Index of points sorted by their coordinates along the sliced axes.
+
+    Points are sorted lexicographically by the integer part of their
+    coordinates along `axes`, so the points in a slice form a contiguous run
+    that is found by binary search. Points appended after the index was built
+    are not sorted and are scanned separately, which keeps adding points
+    cheap; the index should be rebuilt once that tail grows large.
+
+    Parameters
+    ----------
+    data : array (N, D)
+        Coordinates for N points in D dimensions.
+    axes : sequence of int
+        Non-displayed axes that points are sliced along.
+
+    Attributes
+    ----------
+    axes : tuple of int
+        Non-displayed axes that points are sliced along.
+    _order : array (M, )
+        Indices of the M indexed points in sorted order. Points with equal
+        keys are in increasing index order.
+    _keys : array (M, P)
+        Integer coordinates along the P sliced axes of the points in sorted
+        order.
+    """
+
+    def __init__(self, data, axes):
+        self.axes = tuple(axes)
+        keys = np.asarray(data)[:, list(self.axes)].astype('int')
+        if len(self.axes) > 0:
+            self._order = np.lexsort(keys.T[::-1])
+        else:
+            self._order = np.arange(len(keys))
+        self._keys = keys[self._order]
+
+    def __len__(self):
+        return len(self._order)
+
+    def query(self, data, indices):
+        """Indices of points whose integer coordinates match the slice.
+
+        Parameters
+        ----------
+        data : array (N, D)
+            Coordinates of all points. The first `len(self)` points must be
+            the indexed ones.
+        indices : array (D, )
+            Indices of the slice.
+
+        Returns
+        ----------
+        matches : array
+            Increasing indices of the points in the slice.
+        """
+        values = np.asarray(indices)[list(self.axes)]
+        low, high = 0, len(self._order)
+        for i, value in enumerate(values):
+            column = self._keys[low:high, i]
+            low, high = (
+                low + np.searchsorted(column, value, side='left'),
+                low + np.searchsorted(column, value, side='right'),
+            )
+        matches = self._order[low:high]
+
+        tail = np.asarray(data)[len(self) :, list(self.axes)].astype('int')
+        tail = np.where(np.all(tail == values, axis=1))[0] + len(self)
+        return np.concatenate([matches, tail]).astype(int)
+
+    def query_range(self, data, low, high):
+        """Indices of points that may lie between values along the first axis.
+
+        Parameters
+        ----------
+        data : array (N, D)
+            Coordinates of all points. The first `len(self)` points must be
+            the indexed ones.
+        low, high : float
+            Range of coordinates along the first of the sliced axes.
+
+        Returns
+        ----------
+        candidates : array
+            Increasing indices of all points with a coordinate within the
+            range, possibly along with some points outside it.
+        """
+        if len(self.axes) == 0:
+            return np.arange(len(data))
+        column = self._keys[:, 0]
+        start = np.searchsorted(column, np.floor(low) - 1, side='left')
+        stop = np.searchsorted(column, np.ceil(high) + 1, side='right')
+        candidates = np.sort(self._order[start:stop])
+        tail = np.arange(len(self), len(data))
+        return np.concatenate([candidates, tail]).astype(int)
+
+    def remove(self, indices):
+        """Remove points from the index, renumbering the remaining ones.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Indices of the points being removed.
+        """
+        removed = np.unique(indices)
+        keep = np.isin(self._order, removed, invert=True)
+        self._order = self._order[keep]
+        self._keys = self._keys[keep]
+        self._order = self._order - np.searchsorted(removed, self._order)
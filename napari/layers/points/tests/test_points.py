@@ -2,6 +2,7 @@ import numpy as np
 from copy import copy
 from xml.etree.ElementTree import Element
 from napari.layers import Points
+from napari.utils.misc import transform_color
 
 
 def test_empty_points():
@@ -330,19 +331,19 @@ def test_edge_color():
     layer = Points(data)
     assert layer.current_edge_color == 'black'
     assert len(layer.edge_color) == shape[0]
-    assert np.all([col == 'black' for col in layer.edge_color])
+    assert np.all(layer.edge_color == transform_color('black'))
 
     # With no data selected changing edge color has no effect
     layer.current_edge_color = 'blue'
     assert layer.current_edge_color == 'blue'
-    assert np.all([col == 'black' for col in layer.edge_color])
+    assert np.all(layer.edge_color == transform_color('black'))
 
     # Select data and change edge color of selection
     layer.selected_data = [0, 1]
     assert layer.current_edge_color == 'black'
     layer.current_edge_color = 'green'
-    assert np.all([col == 'green' for col in layer.edge_color[:2]])
-    assert np.all([col == 'black' for col in layer.edge_color[2:]])
+    assert np.all(layer.edge_color[:2] == transform_color('green'))
+    assert np.all(layer.edge_color[2:] == transform_color('black'))
 
     # Add new point and test its color
     coord = [18, 18]
@@ -350,33 +351,39 @@ def test_edge_color():
     layer.current_edge_color = 'blue'
     layer.add(coord)
     assert len(layer.edge_color) == shape[0] + 1
-    assert np.all([col == 'green' for col in layer.edge_color[:2]])
-    assert np.all([col == 'black' for col in layer.edge_color[2:10]])
-    assert np.all(layer.edge_color[10] == 'blue')
+    assert np.all(layer.edge_color[:2] == transform_color('green'))
+    assert np.all(layer.edge_color[2:10] == transform_color('black'))
+    assert np.all(layer.edge_color[10] == transform_color('blue'))
 
     # Instantiate with custom edge color
     layer = Points(data, edge_color='red')
     assert layer.current_edge_color == 'red'
 
+    # Instantiate with a single RGBA edge color
+    layer = Points(data, edge_color=(1, 0, 0, 1))
+    assert layer.edge_color.shape == (shape[0], 4)
+    assert np.all(layer.edge_color == transform_color('red'))
+
     # Instantiate with custom edge color list
     col_list = ['red', 'green'] * 5
     layer = Points(data, edge_color=col_list)
     assert layer.current_edge_color == 'black'
-    assert layer.edge_color == col_list
+    assert np.all(layer.edge_color == transform_color(col_list))
 
     # Add new point and test its color
     coord = [18, 18]
     layer.current_edge_color = 'blue'
     layer.add(coord)
     assert len(layer.edge_color) == shape[0] + 1
-    assert layer.edge_color == col_list + ['blue']
+    assert np.all(layer.edge_color == transform_color(col_list + ['blue']))
 
     # Check removing data adjusts colors correctly
     layer.selected_data = [0, 2]
     layer.remove_selected()
     assert len(layer.data) == shape[0] - 1
     assert len(layer.edge_color) == shape[0] - 1
-    assert layer.edge_color == [col_list[1]] + col_list[3:] + ['blue']
+    col_list = [col_list[1]] + col_list[3:] + ['blue']
+    assert np.all(layer.edge_color == transform_color(col_list))
 
 
 def test_face_color():
@@ -387,19 +394,19 @@ def test_face_color():
     layer = Points(data)
     assert layer.current_face_color == 'white'
     assert len(layer.face_color) == shape[0]
-    assert np.all([col == 'white' for col in layer.face_color])
+    assert np.all(layer.face_color == transform_color('white'))
 
     # With no data selected changing face color has no effect
     layer.current_face_color = 'blue'
     assert layer.current_face_color == 'blue'
-    assert np.all([col == 'white' for col in layer.face_color])
+    assert np.all(layer.face_color == transform_color('white'))
 
     # Select data and change edge color of selection
     layer.selected_data = [0, 1]
     assert layer.current_face_color == 'white'
     layer.current_face_color = 'green'
-    assert np.all([col == 'green' for col in layer.face_color[:2]])
-    assert np.all([col == 'white' for col in layer.face_color[2:]])
+    assert np.all(layer.face_color[:2] == transform_color('green'))
+    assert np.all(layer.face_color[2:] == transform_color('white'))
 
     # Add new point and test its color
     coord = [18, 18]
@@ -407,9 +414,9 @@ def test_face_color():
     layer.current_face_color = 'blue'
     layer.add(coord)
     assert len(layer.face_color) == shape[0] + 1
-    assert np.all([col == 'green' for col in layer.face_color[:2]])
-    assert np.all([col == 'white' for col in layer.face_color[2:10]])
-    assert np.all(layer.face_color[10] == 'blue')
+    assert np.all(layer.face_color[:2] == transform_color('green'))
+    assert np.all(layer.face_color[2:10] == transform_color('white'))
+    assert np.all(layer.face_color[10] == transform_color('blue'))
 
     # Instantiate with custom face color
     layer = Points(data, face_color='red')
@@ -419,21 +426,22 @@ def test_face_color():
     col_list = ['red', 'green'] * 5
     layer = Points(data, face_color=col_list)
     assert layer.current_face_color == 'white'
-    assert layer.face_color == col_list
+    assert np.all(layer.face_color == transform_color(col_list))
 
     # Add new point and test its color
     coord = [18, 18]
     layer.current_face_color = 'blue'
     layer.add(coord)
     assert len(layer.face_color) == shape[0] + 1
-    assert layer.face_color == col_list + ['blue']
+    assert np.all(layer.face_color == transform_color(col_list + ['blue']))
 
     # Check removing data adjusts colors correctly
     layer.selected_data = [0, 2]
     layer.remove_selected()
     assert len(layer.data) == shape[0] - 1
     assert len(layer.face_color) == shape[0] - 1
-    assert layer.face_color == [col_list[1]] + col_list[3:] + ['blue']
+    col_list = [col_list[1]] + col_list[3:] + ['blue']
+    assert np.all(layer.face_color == transform_color(col_list))
 
 
 def test_size():
@@ -717,3 +725,81 @@ def test_xml_list():
     assert type(xml) == list
     assert len(xml) == shape[0]
     assert np.all([type(x) == Element for x in xml])
+
+
+def test_slicing_with_slice_index():
+    """Test slicing matches a scan over all points after edits."""
+    np.random.seed(0)
+    data = np.random.randint(5, size=(100, 4)) + np.random.random((100, 4))
+    layer = Points(data, size=np.random.randint(1, 4, size=(100, 1)))
+    layer.add([2, 3, 10, 10])
+    layer.selected_data = [0, 5, 50]
+    layer.remove_selected()
+    layer.dims.set_point(0, 2)
+    layer.selected_data = list(layer._indices_view[:3])
+    layer._copy_data()
+    layer.dims.set_point(1, 3)
+    layer._paste_data()
+
+    for n_dimensional in [False, True]:
+        layer.n_dimensional = n_dimensional
+        for point in np.ndindex(5, 5):
+            layer.dims.set_point(0, point[0])
+            layer.dims.set_point(1, point[1])
+            distances = abs(layer.data[:, :2] - point)
+            if n_dimensional:
+                matches = np.all(distances <= layer.size[:, :2] / 2, axis=1)
+            else:
+                matches = np.all(layer.data[:, :2].astype(int) == point, 1)
+            np.testing.assert_array_equal(
+                layer._indices_view, np.where(matches)[0]
+            )
+
+
+def test_refresh_after_inplace_edit():
+    """Test refresh picks up points edited in place."""
+    data = np.array([[0, 0, 0], [1, 5, 5], [2, 10, 10]], dtype=float)
+    layer = Points(data)
+    layer.dims.set_point(0, 2)
+    np.testing.assert_array_equal(layer._indices_view, [2])
+    assert layer.dims.range[0] == (0, 2, 1)
+
+    layer.data[0, 0] = 2
+    layer.data[1, 0] = 4
+    layer.refresh()
+    np.testing.assert_array_equal(layer._indices_view, [0, 2])
+    assert layer.dims.range[0] == (2, 4, 1)
+    layer.dims.set_point(0, 4)
+    np.testing.assert_array_equal(layer._indices_view, [1])
+
+
+def test_value_with_view_tree():
+    """Test the value is the same once the points in view are indexed."""
+    np.random.seed(0)
+    data = 20 * np.random.random((200, 2))
+    layer = Points(data, size=np.random.randint(1, 4, size=(200, 1)))
+    for coord in 20 * np.random.random((20, 2)):
+        layer.position = tuple(coord)
+        distances = abs(layer.data - layer.coordinates)
+        matches = np.all(distances <= layer.size / 2, axis=1)
+        expected = np.where(matches)[0][-1] if np.any(matches) else None
+        assert layer.get_value() == expected
+    assert layer._view_tree is not None
+
+
+def test_thumbnail():
+    """Test the thumbnail is rendered lazily with the face colors."""
+    data = np.array([[0, 0], [10, 10], [20, 20]])
+    layer = Points(data, face_color=['red', 'blue', 'green'])
+    assert layer._thumbnail_stale
+    thumbnail = layer.thumbnail
+    assert not layer._thumbnail_stale
+    assert thumbnail.shape == layer._thumbnail_shape
+
+    zoom_factor = np.divide(layer._thumbnail_shape[:2], 21).min()
+    coords = np.floor((data + 0.5) * zoom_factor).astype(int)
+    colors = (255 * transform_color(['red', 'blue', 'green'])).astype(int)
+    np.testing.assert_array_equal(
+        thumbnail[coords[:, 0], coords[:, 1]], colors
+    )
+    assert np.all(thumbnail[[1, 30], [30, 1], :3] == 0)
@@ -0,0 +1,40 @@
+import numpy as np
+from napari.layers.points.slice_index import SliceIndex
+
+
+def test_slice_index_query():
+    """Test querying points in a slice, including appended points."""
+    np.random.seed(0)
+    data = np.random.randint(4, size=(50, 3)) + np.random.random((50, 3))
+    index = SliceIndex(data[:40], [0, 2])
+    assert len(index) == 40
+    for point in np.ndindex(4, 4):
+        matches = index.query(data, [point[0], 0, point[1]])
+        keys = data[:, [0, 2]].astype(int)
+        expected = np.where(np.all(keys == point, axis=1))[0]
+        np.testing.assert_array_equal(matches, expected)
+
+
+def test_slice_index_query_range():
+    """Test querying candidate points near a range along the first axis."""
+    np.random.seed(0)
+    data = 10 * np.random.random((50, 3))
+    index = SliceIndex(data, [1])
+    candidates = index.query_range(data, 2.5, 4.5)
+    expected = np.where((data[:, 1] >= 2.5) & (data[:, 1] <= 4.5))[0]
+    assert set(expected) <= set(candidates)
+    assert np.all(np.diff(candidates) > 0)
+
+
+def test_slice_index_remove():
+    """Test removing points renumbers the remaining ones."""
+    np.random.seed(0)
+    data = np.random.randint(4, size=(50, 3)).astype(float)
+    index = SliceIndex(data, [0])
+    removed = [3, 10, 11, 49]
+    index.remove(removed)
+    data = np.delete(data, removed, axis=0)
+    assert len(index) == len(data)
+    for i in range(4):
+        matches = index.query(data, [i, 0, 0])
+        np.testing.assert_array_equal(matches, np.where(data[:, 0] == i)[0])
@@ -1,4 +1,5 @@
 import numpy as np
+from ...utils.buffers import buffer_property
 
 
 class Mesh:
@@ -47,13 +48,45 @@ class Mesh:
     _types : list
         Length two list of the different mesh types corresponding to faces and
         edges
+    _buffers : dict
+        AppendBuffer holding each of the vertex and triangle arrays, so that
+        adding shapes does not copy the whole mesh.
     """
 
     _types = ['face', 'edge']
 
+    vertices = buffer_property('vertices', 'np.ndarray: Qx2 vertices.')
+    vertices_centers = buffer_property(
+        'vertices_centers', 'np.ndarray: Qx2 centers of vertices.'
+    )
+    vertices_offsets = buffer_property(
+        'vertices_offsets', 'np.ndarray: Qx2 offsets of vertices.'
+    )
+    vertices_index = buffer_property(
+        'vertices_index', 'np.ndarray: Qx2 shape index and mesh type.'
+    )
+    triangles = buffer_property(
+        'triangles', 'np.ndarray: Px3 vertex indices of triangles.'
+    )
+    triangles_index = buffer_property(
+        'triangles_index', 'np.ndarray: Px2 shape index and mesh type.'
+    )
+    triangles_colors = buffer_property(
+        'triangles_colors', 'np.ndarray: Px4 rgba colors of triangles.'
+    )
+
+    _vertex_arrays = [
+        'vertices',
+        'vertices_centers',
+        'vertices_offsets',
+        'vertices_index',
+    ]
+    _triangle_arrays = ['triangles', 'triangles_index', 'triangles_colors']
+
     def __init__(self, ndisplay=2):
 
         self._ndisplay = ndisplay
+        self._buffers = {}
         self.clear()
 
     def clear(self):
@@ -84,3 +117,61 @@ class Mesh:
 
         self._ndisplay = ndisplay
         self.clear()
+
+    def append_vertices(self, vertices, centers, offsets, index):
+        """Appends vertices to the end of the mesh.
+
+        Parameters
+        ----------
+        vertices : np.ndarray
+            Mx2 array of vertices.
+        centers : np.ndarray
+            Mx2 array of centers of the vertices.
+        offsets : np.ndarray
+            Mx2 array of offsets of the vertices.
+        index : np.ndarray
+            Mx2 array of the shape index and mesh type of each vertex.
+        """
+        arrays = [vertices, centers, offsets, index]
+        for name, array in zip(self._vertex_arrays, arrays):
+            self._buffers[name].append(array)
+
+    def append_triangles(self, triangles, index, colors):
+        """Appends triangles to the end of the mesh.
+
+        Parameters
+        ----------
+        triangles : np.ndarray
+            Mx3 array of vertex indices of the triangles.
+        index : np.ndarray
+            Mx2 array of the shape index and mesh type of each triangle.
+        colors : np.ndarray
+            Mx4 array of the rgba color of each triangle.
+        """
+        arrays = [triangles, index, colors]
+        for name, array in zip(self._triangle_arrays, arrays):
+            self._buffers[name].append(array)
+
+    def remove_vertices(self, indices):
+        """Removes vertices from the mesh in a single pass.
+
+        Triangles are not renumbered.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Indices of the vertices to remove, or a mask of them.
+        """
+        for name in self._vertex_arrays:
+            self._buffers[name].delete(indices)
+
+    def remove_triangles(self, indices):
+        """Removes triangles from the mesh in a single pass.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Indices of the triangles to remove, or a mask of them.
+        """
+        for name in self._triangle_arrays:
+            self._buffers[name].delete(indices)
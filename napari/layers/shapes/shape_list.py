@@ -1,10 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import dask.array as da
 import numpy as np
+from ...utils.buffers import buffer_property
 from .shape_models import Shape, Line, Path
-from .shape_utils import inside_triangles, triangles_intersect_box
+from .shape_utils import (
+    inside_triangles,
+    triangles_intersect_box,
+    triangulate_edge,
+    triangulate_edges,
+)
 from .mesh import Mesh
+from .triangle_grid import TriangleGrid
 from ._constants import shape_classes, ShapeType
 
 
+def triangulate_pending(shapes):
+    """Triangulate the edges of shapes created with `skip_triangulation`.
+
+    Edges of two dimensional shapes are triangulated together, with one
+    call to `triangulate_edges` for closed edges and one for open ones.
+
+    Parameters
+    ----------
+    shapes : list of subclass Shape
+        Shapes, some of which may have an edge to triangulate.
+    """
+    batches = {True: [], False: []}
+    for shape in shapes:
+        if shape._pending_edge is not None:
+            batches[shape._pending_edge[1]].append(shape)
+    for closed, batch in batches.items():
+        if len(batch) == 0:
+            continue
+        paths = [s._pending_edge[0] for s in batch]
+        if all(p.shape[1] == 2 for p in paths):
+            meshes = zip(*triangulate_edges(paths, closed=closed))
+        else:
+            meshes = (triangulate_edge(p, closed=closed) for p in paths)
+        for shape, mesh in zip(batch, meshes):
+            shape._set_edge_meshes(*mesh)
+
+
+def shape_ranges(index, n):
+    """Start and length of the contiguous run of each shape in an index.
+
+    Parameters
+    ----------
+    index : np.ndarray
+        Length M array with the index (0, ..., N-1) of the shape each element
+        belongs to. Elements of each shape must be contiguous.
+    n : int
+        Number of shapes.
+
+    Returns
+    ----------
+    starts : np.ndarray
+        Length N array with the position of the first element of each shape.
+    counts : np.ndarray
+        Length N array with the number of elements of each shape.
+    """
+    index = np.asarray(index)
+    starts = np.zeros(n, dtype=int)
+    counts = np.zeros(n, dtype=int)
+    if len(index) == 0:
+        return starts, counts
+    first = np.concatenate([[0], np.flatnonzero(np.diff(index)) + 1])
+    length = np.diff(np.append(first, len(index)))
+    shapes = index[first]
+    starts[shapes] = first
+    counts[shapes] = length
+    return starts, counts
+
+
+def expand_ranges(starts, counts):
+    """Concatenate the ranges `start, ..., start + count - 1`.
+
+    Parameters
+    ----------
+    starts : np.ndarray
+        Length K array of the start of each range.
+    counts : np.ndarray
+        Length K array of the length of each range.
+
+    Returns
+    ----------
+    indices : np.ndarray
+        Length sum(counts) integer array of the concatenated ranges.
+    """
+    ends = np.cumsum(counts)
+    offsets = np.repeat(starts - ends + counts, counts)
+    return np.arange(ends[-1] if len(ends) > 0 else 0) + offsets
+
+
 class ShapeList:
     """List of shapes class.
 
@@ -41,9 +129,6 @@ class ShapeList:
         Opacity for each shape.
     z_indices : (N, ) list of int
         z-index for each shape.
-
-    Extended Summary
-    ----------
     _vertices : np.ndarray
         Mx2 array of all displayed vertices from all shapes
     _index : np.ndarray
@@ -54,11 +139,42 @@ class ShapeList:
     _z_order : np.ndarray
         Length N array with z_order of each shape. This must be a permutation
         of (0, ..., N-1).
+    _z_rank : np.ndarray
+        Length N array with the position of each shape in `_z_order`.
+    _slice_index : dict
+        Mapping from each slice key to the indices of the shapes entirely
+        contained in that slice. Updated shape by shape as shapes are added,
+        edited and removed.
+    _shape_slice_keys : list
+        Key of the slice each shape is entirely contained in, or None if it
+        spans several slices.
+    _triangle_starts, _triangle_counts : np.ndarray
+        Length N arrays with the first mesh triangle of each shape and its
+        number of mesh triangles.
+    _vertex_starts, _vertex_counts : np.ndarray
+        Length N arrays with the first vertex of each shape in `_vertices`
+        and its number of vertices.
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _grid : TriangleGrid or None
+        Spatial index of the triangles of the shapes displayed in the slice
+        `_grid_key`, used for hit-testing. Only the grid of the last slice
+        that was queried is kept.
+    _grid_key : tuple or None
+        Slice key of the shapes indexed by `_grid`.
+    _grid_dirty : set of int
+        Shapes added, edited or moved since `_grid` was last updated, which
+        are inserted into it again on the next query.
+    _tile_size : int
+        Approximate number of points in each of the tiles that shapes are
+        drawn in parallel on when rasterized.
     """
 
+    _vertices = buffer_property('_vertices')
+    _index = buffer_property('_index')
+    _tile_size = 2 ** 22
+
     def __init__(self, data=[], ndisplay=2):
 
         self._ndisplay = ndisplay
@@ -67,15 +183,22 @@ class ShapeList:
         self._slice_key = []
         self.displayed_vertices = []
         self.displayed_index = []
+        self._buffers = {}
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
         self._z_index = np.empty((0), dtype=int)
         self._z_order = np.empty((0), dtype=int)
+        self._z_rank = np.empty((0), dtype=int)
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
+        self._grid = None
+        self._grid_key = None
+        self._grid_dirty = set()
+        self._slice_index = {}
+        self._shape_slice_keys = []
+        self._update_mesh_ranges()
 
-        for d in data:
-            self.add(d)
+        self.add(list(data))
 
     @property
     def data(self):
@@ -94,6 +217,7 @@ class ShapeList:
 
         self._ndisplay = ndisplay
         self._mesh.ndisplay = self.ndisplay
+        self._grid = None
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
         for index in range(len(self.shapes)):
@@ -152,148 +276,286 @@ class ShapeList:
 
     def _update_displayed(self):
         """Update the displayed data based on the slice key."""
-        # The list slice key is repeated to check against both the min and
-        # max values stored in the shapes slice key.
-        slice_key = np.array([self.slice_key, self.slice_key])
-
-        # Slice key must exactly match mins and maxs of shape as then the
-        # shape is entirely contained within the current slice.
-        if len(self.shapes) > 0:
-            self._displayed = np.all(self.slice_keys == slice_key, axis=(1, 2))
-        else:
-            self._displayed = []
-        disp_indices = np.where(self._displayed)[0]
-
-        z_order = self._mesh.triangles_z_order
-        disp_tri = np.isin(
-            self._mesh.triangles_index[z_order, 0], disp_indices
+        # Only shapes whose min and max slice keys both match the slice key
+        # are displayed, as then the shape is entirely contained within the
+        # current slice. These are looked up in the slice index.
+        disp_indices = self._slice_index.get(
+            tuple(self.slice_key), np.empty(0, dtype=int)
+        )
+        self._displayed = np.zeros(len(self.shapes), dtype=bool)
+        self._displayed[disp_indices] = True
+
+        # Triangles of each shape are contiguous, so the displayed triangles
+        # are gathered shape by shape in z order
+        order = disp_indices[np.argsort(self._z_rank[disp_indices])]
+        disp_tri = expand_ranges(
+            self._triangle_starts[order], self._triangle_counts[order]
         )
-        self._mesh.displayed_triangles = self._mesh.triangles[z_order][
+        self._mesh.displayed_triangles = self._mesh.triangles[disp_tri]
+        self._mesh.displayed_triangles_index = self._mesh.triangles_index[
             disp_tri
         ]
-        self._mesh.displayed_triangles_index = self._mesh.triangles_index[
-            z_order
-        ][disp_tri]
         self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
-            z_order
-        ][disp_tri]
+            disp_tri
+        ]
 
-        disp_vert = np.isin(self._index, disp_indices)
+        order = disp_indices[np.argsort(self._vertex_starts[disp_indices])]
+        disp_vert = expand_ranges(
+            self._vertex_starts[order], self._vertex_counts[order]
+        )
         self.displayed_vertices = self._vertices[disp_vert]
         self.displayed_index = self._index[disp_vert]
 
+    def _update_mesh_ranges(self):
+        """Update where the triangles and vertices of each shape are.
+
+        Records where the triangles and vertices of each shape start and how
+        many there are. Must be called whenever shapes are added, removed or
+        their number of triangles changes.
+        """
+        n = len(self.shapes)
+        self._triangle_starts, self._triangle_counts = shape_ranges(
+            self._mesh.triangles_index[:, 0], n
+        )
+        self._vertex_starts, self._vertex_counts = shape_ranges(
+            self._index, n
+        )
+
+    def _index_slice_keys(self, indices):
+        """Add shapes to the slice index.
+
+        Shapes that are contained in a single slice are grouped by their
+        slice key, and each group is appended to the shapes of that slice.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Indices of the shapes, which must not be in the index already.
+        """
+        indices = np.asarray(indices, dtype=int)
+        if len(indices) == 0:
+            return
+        slice_keys = np.array([self.shapes[i].slice_key for i in indices])
+        contained = np.all(slice_keys[:, 0] == slice_keys[:, 1], axis=1)
+        for i, key, inside in zip(indices, slice_keys[:, 0], contained):
+            self._shape_slice_keys[i] = tuple(key) if inside else None
+        indices = indices[contained]
+        if len(indices) == 0:
+            return
+        if slice_keys.shape[2] == 0:
+            groups = {(): indices}
+        else:
+            keys, inverse = np.unique(
+                slice_keys[contained, 0], axis=0, return_inverse=True
+            )
+            inverse = np.ravel(inverse)
+            order = np.argsort(inverse, kind='stable')
+            split = np.split(
+                indices[order], np.cumsum(np.bincount(inverse))[:-1]
+            )
+            groups = {tuple(key): group for key, group in zip(keys, split)}
+        for key, group in groups.items():
+            if key in self._slice_index:
+                group = np.concatenate([self._slice_index[key], group])
+            self._slice_index[key] = group
+
+    def _unindex_slice_key(self, index, renumber=False):
+        """Remove a shape from the slice index.
+
+        Parameters
+        ----------
+        index : int
+            Index of the shape.
+        renumber : bool
+            Whether the shape is deleted, in which case the shapes after it
+            are renumbered.
+        """
+        key = self._shape_slice_keys[index]
+        if key is not None:
+            group = self._slice_index[key]
+            group = group[group != index]
+            if len(group) > 0:
+                self._slice_index[key] = group
+            else:
+                del self._slice_index[key]
+        if renumber:
+            del self._shape_slice_keys[index]
+            for group in self._slice_index.values():
+                group[group > index] -= 1
+        else:
+            self._shape_slice_keys[index] = None
+
     def add(self, shape, shape_index=None):
-        """Adds a single Shape object
+        """Adds a single Shape object, or a list of Shape objects
 
         Parameters
         ----------
-        shape : subclass Shape
+        shape : subclass Shape or list of subclass Shape
             Must be a subclass of Shape, one of "{'Line', 'Rectangle',
-            'Ellipse', 'Path', 'Polygon'}"
+            'Ellipse', 'Path', 'Polygon'}". A list of shapes is added in a
+            single pass, which is much faster than adding the shapes one by
+            one.
         shape_index : None | int
             If int then edits the shape date at current index. To be used in
             conjunction with `remove` when renumber is `False`. If None, then
-            appends a new shape to end of shapes list
+            appends a new shape to end of shapes list. Must be None when
+            adding a list of shapes.
         """
+        if isinstance(shape, list):
+            if shape_index is not None:
+                raise ValueError('shape_index must be None to add a list')
+            self._add_shapes(shape)
+            return
+
         if not issubclass(type(shape), Shape):
             raise ValueError('shape must be subclass of Shape')
+        triangulate_pending([shape])
 
         if shape_index is None:
             z_refresh = True
             shape_index = len(self.shapes)
             self.shapes.append(shape)
+            self._shape_slice_keys.append(None)
             self._z_index = np.append(self._z_index, shape.z_index)
         else:
             z_refresh = False
             self.shapes[shape_index] = shape
             self._z_index[shape_index] = shape.z_index
+        self._index_slice_keys([shape_index])
+        self._update_grid([shape_index])
 
-        self._vertices = np.append(
-            self._vertices, shape.data_displayed, axis=0
-        )
+        self._buffers['_vertices'].append(shape.data_displayed)
         index = np.repeat(shape_index, len(shape.data))
-        self._index = np.append(self._index, index, axis=0)
+        self._buffers['_index'].append(index)
 
         # Add faces to mesh
         m = len(self._mesh.vertices)
         vertices = shape._face_vertices
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._face_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
-        )
-        vertices = np.zeros(shape._face_vertices.shape)
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
         index = np.repeat([[shape_index, 0]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
+        self._mesh.append_vertices(
+            vertices, vertices, np.zeros(vertices.shape), index
         )
-
         triangles = shape._face_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
         index = np.repeat([[shape_index, 0]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
         color = shape.face_color.rgba
         color[3] = color[3] * shape.opacity
         color_array = np.repeat([color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
-        )
+        self._mesh.append_triangles(triangles, index, color_array)
 
         # Add edges to mesh
         m = len(self._mesh.vertices)
         vertices = (
             shape._edge_vertices + shape.edge_width * shape._edge_offsets
         )
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._edge_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
-        )
-        vertices = shape._edge_offsets
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
         index = np.repeat([[shape_index, 1]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
+        self._mesh.append_vertices(
+            vertices, shape._edge_vertices, shape._edge_offsets, index
         )
-
         triangles = shape._edge_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
         index = np.repeat([[shape_index, 1]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
         color = shape.edge_color.rgba
         color[3] = color[3] * shape.opacity
         color_array = np.repeat([color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
-        )
+        self._mesh.append_triangles(triangles, index, color_array)
 
         if z_refresh:
             # Set z_order
             self._update_z_order()
 
+    def _add_shapes(self, shapes):
+        """Appends a list of Shape objects.
+
+        The mesh arrays are extended once for all shapes, and the edges of
+        shapes whose triangulation was skipped are triangulated together.
+
+        Parameters
+        ----------
+        shapes : list of subclass Shape
+            Shapes to be added.
+        """
+        if len(shapes) == 0:
+            return
+        for shape in shapes:
+            if not issubclass(type(shape), Shape):
+                raise ValueError('shape must be subclass of Shape')
+        triangulate_pending(shapes)
+
+        first_index = len(self.shapes)
+        self.shapes.extend(shapes)
+        self._shape_slice_keys.extend([None] * len(shapes))
+        indices = np.arange(first_index, first_index + len(shapes))
+        self._index_slice_keys(indices)
+        self._update_grid(indices)
+        self._z_index = np.concatenate(
+            [self._z_index, [s.z_index for s in shapes]]
+        ).astype(int)
+
+        self._buffers['_vertices'].append(
+            np.concatenate([s.data_displayed for s in shapes], axis=0)
+        )
+        index = np.repeat(indices, [len(s.data) for s in shapes])
+        self._buffers['_index'].append(index)
+
+        # The face and then the edge of each shape are stored one after
+        # the other, in the same order as when adding the shapes one by one
+        vertices = []
+        centers = []
+        offsets = []
+        triangles = []
+        colors = []
+        for shape in shapes:
+            vertices.append(shape._face_vertices)
+            vertices.append(
+                shape._edge_vertices + shape.edge_width * shape._edge_offsets
+            )
+            centers.append(shape._face_vertices)
+            centers.append(shape._edge_vertices)
+            offsets.append(np.zeros(shape._face_vertices.shape))
+            offsets.append(shape._edge_offsets)
+            triangles.append(shape._face_triangles)
+            triangles.append(shape._edge_triangles)
+            for color in (shape.face_color, shape.edge_color):
+                color = color.rgba
+                color[3] = color[3] * shape.opacity
+                colors.append(color)
+        vertex_counts = [len(v) for v in vertices]
+        triangle_counts = [len(t) for t in triangles]
+        mesh_index = np.stack(
+            [np.repeat(indices, 2), np.tile([0, 1], len(shapes))], axis=1
+        )
+        vertex_starts = np.cumsum(vertex_counts) - vertex_counts
+        vertex_starts = vertex_starts + len(self._mesh.vertices)
+
+        triangles = np.concatenate(triangles, axis=0) + np.repeat(
+            vertex_starts, triangle_counts
+        )[:, np.newaxis]
+        self._mesh.append_vertices(
+            np.concatenate(vertices, axis=0),
+            np.concatenate(centers, axis=0),
+            np.concatenate(offsets, axis=0),
+            np.repeat(mesh_index, vertex_counts, axis=0),
+        )
+        self._mesh.append_triangles(
+            triangles,
+            np.repeat(mesh_index, triangle_counts, axis=0),
+            np.repeat(colors, triangle_counts, axis=0),
+        )
+
+        self._update_z_order()
+
     def remove_all(self):
         """Removes all shapes
         """
         self.shapes = []
+        self._slice_index = {}
+        self._shape_slice_keys = []
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
         self._z_index = np.empty((0), dtype=int)
         self._z_order = np.empty((0), dtype=int)
         self._mesh.clear()
-        self._update_displayed()
+        self._grid = None
+        self._update_z_order()
 
     def remove(self, index, renumber=True):
         """Removes a single shape located at index.
@@ -307,23 +569,19 @@ class ShapeList:
             expectation is that this shape is being immediately readded to the
             list using `add_shape`.
         """
-        indices = self._index != index
-        self._vertices = self._vertices[indices]
-        self._index = self._index[indices]
+        self._unindex_slice_key(index, renumber=renumber)
+        indices = self._index == index
+        self._buffers['_vertices'].delete(indices)
+        self._buffers['_index'].delete(indices)
 
         # Remove triangles
-        indices = self._mesh.triangles_index[:, 0] != index
-        self._mesh.triangles = self._mesh.triangles[indices]
-        self._mesh.triangles_colors = self._mesh.triangles_colors[indices]
-        self._mesh.triangles_index = self._mesh.triangles_index[indices]
+        indices = self._mesh.triangles_index[:, 0] == index
+        self._mesh.remove_triangles(indices)
 
         # Remove vertices
-        indices = self._mesh.vertices_index[:, 0] != index
-        self._mesh.vertices = self._mesh.vertices[indices]
-        self._mesh.vertices_centers = self._mesh.vertices_centers[indices]
-        self._mesh.vertices_offsets = self._mesh.vertices_offsets[indices]
-        self._mesh.vertices_index = self._mesh.vertices_index[indices]
-        indices = np.where(np.invert(indices))[0]
+        indices = self._mesh.vertices_index[:, 0] == index
+        self._mesh.remove_vertices(indices)
+        indices = np.where(indices)[0]
         num_indices = len(indices)
         if num_indices > 0:
             indices = self._mesh.triangles > indices[0]
@@ -333,6 +591,13 @@ class ShapeList:
 
         if renumber:
             del self.shapes[index]
+            if self._grid is not None:
+                self._grid.remove(index, renumber=True)
+            self._grid_dirty = {
+                i - 1 if i > index else i
+                for i in self._grid_dirty
+                if i != index
+            }
             indices = self._index > index
             self._index[indices] = self._index[indices] - 1
             self._z_index = np.delete(self._z_index, index)
@@ -362,6 +627,7 @@ class ShapeList:
             faces and to update the underlying shape vertices
         """
         shape = self.shapes[index]
+        self._update_grid([index])
         if edge:
             indices = np.all(self._mesh.vertices_index == [index, 1], axis=1)
             self._mesh.vertices[indices] = (
@@ -383,18 +649,12 @@ class ShapeList:
         """Updates the z order of the triangles given the z_index list
         """
         self._z_order = np.argsort(self._z_index)
-        if len(self._z_order) == 0:
-            self._mesh.triangles_z_order = np.empty((0), dtype=int)
-        else:
-            _, idx, counts = np.unique(
-                self._mesh.triangles_index[:, 0],
-                return_index=True,
-                return_counts=True,
-            )
-            triangles_z_order = [
-                np.arange(idx[z], idx[z] + counts[z]) for z in self._z_order
-            ]
-            self._mesh.triangles_z_order = np.concatenate(triangles_z_order)
+        self._z_rank = np.argsort(self._z_order)
+        self._update_mesh_ranges()
+        self._mesh.triangles_z_order = expand_ranges(
+            self._triangle_starts[self._z_order],
+            self._triangle_counts[self._z_order],
+        )
         self._update_displayed()
 
     def edit(self, index, data, new_type=None):
@@ -678,6 +938,94 @@ class ShapeList:
 
         return centers, offsets, triangles
 
+    def _update_grid(self, indices):
+        """Mark shapes whose triangles changed to be updated in the grid.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Indices of the shapes that were added, edited or moved.
+        """
+        if self._grid is not None:
+            self._grid_dirty.update(int(i) for i in indices)
+
+    def _grid_index(self, indices):
+        """Triangles of shapes and their index for a TriangleGrid.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Indices of the shapes.
+
+        Returns
+        ----------
+        triangles : np.ndarray
+            Px3x2 array of the displayed vertices of each triangle.
+        index : np.ndarray
+            Px2 array with the shape of each triangle and its position
+            within the shape.
+        """
+        starts = self._triangle_starts[indices]
+        counts = self._triangle_counts[indices]
+        positions = expand_ranges(starts, counts)
+        index = np.stack(
+            [
+                np.repeat(indices, counts),
+                positions - np.repeat(starts, counts),
+            ],
+            axis=1,
+        )
+        vertices = self._mesh.vertices[:, -2:]
+        return vertices[self._mesh.triangles[positions]], index
+
+    def _triangle_grid(self):
+        """Spatial index of the displayed triangles of the current slice.
+
+        The index is built on first use for a slice. Shapes that changed
+        since are then removed from it and inserted again, until so many
+        were inserted that it is rebuilt.
+
+        Returns
+        ----------
+        grid : TriangleGrid
+            Grid whose query results are the shape of each triangle and its
+            position within the shape.
+        """
+        key = tuple(self.slice_key)
+        grid = self._grid
+        if grid is not None and key == self._grid_key:
+            dirty = np.array(sorted(self._grid_dirty), dtype=int)
+            self._grid_dirty = set()
+            if len(dirty) > 0:
+                grid.remove(dirty)
+                dirty = dirty[self._displayed[dirty]]
+                grid.insert(*self._grid_index(dirty))
+            if grid.n_inserted <= len(grid):
+                return grid
+
+        displayed = np.flatnonzero(self._displayed)
+        self._grid = TriangleGrid(*self._grid_index(displayed))
+        self._grid_key = key
+        self._grid_dirty = set()
+        return self._grid
+
+    def _candidate_triangles(self, candidates):
+        """Vertices of the triangles returned by a TriangleGrid query.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            Kx2 array with the shape of each triangle and its position
+            within the shape.
+
+        Returns
+        ----------
+        triangles : np.ndarray
+            Kx3xD array of the vertices of each triangle.
+        """
+        positions = self._triangle_starts[candidates[:, 0]] + candidates[:, 1]
+        return self._mesh.vertices[self._mesh.triangles[positions]]
+
     def shapes_in_box(self, corners):
         """Determines which shapes, if any, are inside an axis aligned box.
 
@@ -695,10 +1043,10 @@ class ShapeList:
             List of shapes that are inside the box.
         """
 
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        candidates = self._triangle_grid().query_box(corners)
+        triangles = self._candidate_triangles(candidates)
         intersects = triangles_intersect_box(triangles, corners)
-        shapes = self._mesh.displayed_triangles_index[intersects, 0]
-        shapes = np.unique(shapes).tolist()
+        shapes = np.unique(candidates[intersects, 0]).tolist()
 
         return shapes
 
@@ -717,9 +1065,9 @@ class ShapeList:
             Index of shape if any that is at the coordinates. Returns `None`
             if no shape is found.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
-        indices = inside_triangles(triangles - coord)
-        shapes = self._mesh.displayed_triangles_index[indices, 0]
+        candidates = self._triangle_grid().query_point(coord)
+        triangles = self._candidate_triangles(candidates)
+        shapes = candidates[inside_triangles(triangles - coord), 0]
 
         if len(shapes) > 0:
             z_list = self._z_order.tolist()
@@ -729,14 +1077,16 @@ class ShapeList:
         else:
             return None
 
-    def to_masks(self, mask_shape=None, zoom_factor=1, offset=[0, 0]):
+    def to_masks(
+        self, mask_shape=None, zoom_factor=1, offset=[0, 0], chunks=None
+    ):
         """Returns N binary masks, one for each shape, embedded in an array of
         shape `mask_shape`.
 
         Parameters
         ----------
         mask_shape : np.ndarray | tuple | None
-            2-tuple defining shape of mask to be generated. If non specified,
+            Tuple defining shape of mask to be generated. If non specified,
             takes the max of all the vertiecs
         zoom_factor : float
             Premultiplier applied to coordinates before generating mask. Used
@@ -744,35 +1094,79 @@ class ShapeList:
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        chunks : tuple, optional
+            Chunks of a lazy dask array to return instead of a numpy array,
+            along the shapes axis and each axis of the masks. Each chunk is
+            rasterized when it is computed, so the masks can be stored, for
+            example with `to_zarr`, without holding them in memory.
 
         Returns
         ----------
-        masks : (N, M, P) np.ndarray
+        masks : (N, M, P) np.ndarray or dask.array.Array
             Array where there is one binary mask of shape MxP for each of
             N shapes
         """
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
-            ]
+        if chunks is None:
+            masks = np.array(
+                [
+                    s.to_mask(
+                        mask_shape, zoom_factor=zoom_factor, offset=offset
+                    )
+                    for s in self.shapes
+                ]
+            )
+            return masks
+
+        shape = (len(self.shapes),) + tuple(mask_shape)
+        indices = np.arange(len(self.shapes))
+        low, high = self._bounds(mask_shape, indices, zoom_factor, offset)
+
+        def masks_block(block_info=None):
+            location = block_info[None]['array-location']
+            masks = np.zeros(block_info[None]['chunk-shape'], dtype=bool)
+            start, stop = location[0]
+            for index, mask in zip(range(start, stop), masks):
+                self._draw_region(
+                    mask,
+                    location[1:],
+                    mask_shape,
+                    [index],
+                    [True],
+                    low[index : index + 1],
+                    high[index : index + 1],
+                    zoom_factor,
+                    offset,
+                )
+            return masks
+
+        chunks = da.core.normalize_chunks(chunks, shape, dtype=bool)
+        return da.map_blocks(
+            masks_block,
+            chunks=chunks,
+            dtype=bool,
+            meta=np.empty((0,) * len(shape), dtype=bool),
         )
 
-        return masks
-
-    def to_labels(self, labels_shape=None, zoom_factor=1, offset=[0, 0]):
+    def to_labels(
+        self, labels_shape=None, zoom_factor=1, offset=[0, 0], chunks=None
+    ):
         """Returns a integer labels image, where each shape is embedded in an
         array of shape labels_shape with the value of the index + 1
         corresponding to it, and 0 for background. For overlapping shapes
         z-ordering will be respected.
 
+        Shapes are drawn directly into the labels image, each within its
+        bounding box and, for a labels image with the dimensionality of the
+        shapes, within the planes of its slice key.
+
         Parameters
         ----------
         labels_shape : np.ndarray | tuple | None
-            2-tuple defining shape of labels image to be generated. If non
+            Tuple defining shape of labels image to be generated, either
+            2-tuple or with one value for each dimension of the shapes. If non
             specified, takes the max of all the vertiecs
         zoom_factor : float
             Premultiplier applied to coordinates before generating mask. Used
@@ -780,25 +1174,55 @@ class ShapeList:
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        chunks : tuple, optional
+            Chunks of a lazy dask array to return instead of a numpy array.
+            Each chunk is rasterized when it is computed, only from the shapes
+            that overlap it, so the labels image can be stored, for example
+            with `to_zarr`, without holding it in memory.
 
         Returns
         ----------
-        labels : np.ndarray
-            MxP integer array where each value is either 0 for background or an
+        labels : np.ndarray or dask.array.Array
+            Integer array where each value is either 0 for background or an
             integer up to N for points inside the corresponding shape.
         """
         if labels_shape is None:
             labels_shape = self.displayed_vertices.max(axis=0).astype(np.int)
 
-        labels = np.zeros(labels_shape, dtype=int)
-
-        for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
+        indices = self._z_order[::-1]
+        if chunks is None:
+            labels = np.zeros(labels_shape, dtype=int)
+            self._draw(
+                labels, labels_shape, indices, indices + 1, zoom_factor, offset
             )
-            labels[mask] = ind + 1
+            return labels
+
+        low, high = self._bounds(labels_shape, indices, zoom_factor, offset)
+
+        def labels_block(block_info=None):
+            labels = np.zeros(block_info[None]['chunk-shape'], dtype=int)
+            self._draw_region(
+                labels,
+                block_info[None]['array-location'],
+                labels_shape,
+                indices,
+                indices + 1,
+                low,
+                high,
+                zoom_factor,
+                offset,
+            )
+            return labels
 
-        return labels
+        chunks = da.core.normalize_chunks(
+            chunks, tuple(labels_shape), dtype=int
+        )
+        return da.map_blocks(
+            labels_block,
+            chunks=chunks,
+            dtype=int,
+            meta=np.empty((0,) * len(labels_shape), dtype=int),
+        )
 
     def to_colors(self, colors_shape=None, zoom_factor=1, offset=[0, 0]):
         """Rasterize shapes to an RGBA image array.
@@ -831,21 +1255,182 @@ class ShapeList:
         colors = np.zeros(tuple(colors_shape) + (4,), dtype=float)
         colors[..., 3] = 1
 
-        for ind in self._z_order[::-1]:
-            if self._displayed[ind]:
-                mask = self.shapes[ind].to_mask(
-                    colors_shape, zoom_factor=zoom_factor, offset=offset
-                )
-                if type(self.shapes[ind]) in [Path, Line]:
-                    col = self.shapes[ind].edge_color.rgba
-                    col[3] = col[3] * self.shapes[ind].opacity
-                else:
-                    col = self.shapes[ind].face_color.rgba
-                    col[3] = col[3] * self.shapes[ind].opacity
-                colors[mask, :] = col
+        indices = [ind for ind in self._z_order[::-1] if self._displayed[ind]]
+        values = []
+        for ind in indices:
+            if type(self.shapes[ind]) in [Path, Line]:
+                col = self.shapes[ind].edge_color.rgba
+            else:
+                col = self.shapes[ind].face_color.rgba
+            col[3] = col[3] * self.shapes[ind].opacity
+            values.append(col)
+        self._draw(colors, colors_shape, indices, values, zoom_factor, offset)
 
         return colors
 
+    def _bounds(self, shape, indices, zoom_factor, offset):
+        """Bounds of shapes drawn into an array.
+
+        Along the displayed dimensions the bounds are widened by one to cover
+        the rounding of path vertices, which are also clipped to the array.
+        Along the other dimensions they are given by the slice key.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape of the array, either 2D or with one value for each
+            dimension of the shapes.
+        indices : sequence of int
+            Indices of the shapes.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+
+        Returns
+        ----------
+        low, high : np.ndarray
+            Arrays with, for each shape, the first and last index it may
+            cover along each axis of the array.
+        """
+        low = np.zeros((len(indices), len(shape)), dtype=int)
+        high = np.zeros((len(indices), len(shape)), dtype=int)
+        for i, index in enumerate(indices):
+            s = self.shapes[index]
+            vertices = s._mask_vertices(zoom_factor=zoom_factor, offset=offset)
+            displayed = [0, 1] if len(shape) == 2 else s.dims_displayed[-2:]
+            size = np.take(shape, displayed) - 1
+            low[i, displayed] = np.clip(
+                np.floor(vertices.min(axis=0)) - 1, 0, size
+            )
+            high[i, displayed] = np.clip(
+                np.ceil(vertices.max(axis=0)) + 1, 0, size
+            )
+            if len(shape) > 2:
+                low[i, s.dims_not_displayed] = s.slice_key[0]
+                high[i, s.dims_not_displayed] = s.slice_key[1]
+        return low, high
+
+    def _draw(self, array, shape, indices, values, zoom_factor, offset):
+        """Draw shapes into an array, each over the previous ones.
+
+        The array is split into tiles along its first axis that are drawn in
+        parallel on a thread pool, each shape being drawn in the tiles it
+        overlaps.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Array the shapes are drawn into. Axes after those of `shape` hold
+            the value of each point.
+        shape : tuple of int
+            Shape of the array the shapes are drawn along, either 2D or with
+            one value for each dimension of the shapes.
+        indices : sequence of int
+            Indices of the shapes to draw, from the bottom one to the top one.
+        values : sequence
+            Value written into the points of each shape.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        """
+        if len(indices) == 0 or np.prod(shape) == 0:
+            return
+
+        low, high = self._bounds(shape, indices, zoom_factor, offset)
+        step = max(self._tile_size // int(np.prod(shape[1:])), 1)
+        starts = range(0, shape[0], step)
+
+        def draw_tile(start):
+            stop = min(start + step, shape[0])
+            location = [(start, stop)] + [(0, s) for s in shape[1:]]
+            self._draw_region(
+                array[start:stop],
+                location,
+                shape,
+                indices,
+                values,
+                low,
+                high,
+                zoom_factor,
+                offset,
+            )
+
+        if len(starts) == 1:
+            draw_tile(0)
+        else:
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(draw_tile, starts))
+
+    def _draw_region(
+        self,
+        region,
+        location,
+        shape,
+        indices,
+        values,
+        low,
+        high,
+        zoom_factor,
+        offset,
+    ):
+        """Draw the shapes overlapping a region of an array into it.
+
+        Each shape is rasterized within its bounding box only, along the
+        displayed dimensions, and written into the planes of the region
+        within its slice key, along the other dimensions.
+
+        Parameters
+        ----------
+        region : np.ndarray
+            Region of the array the shapes are drawn into.
+        location : sequence of 2-tuple
+            Start and stop of the region along each axis of `shape`.
+        shape : tuple of int
+            Shape of the whole array the shapes are drawn along.
+        indices : sequence of int
+            Indices of the shapes to draw, from the bottom one to the top one.
+        values : sequence
+            Value written into the points of each shape.
+        low, high : np.ndarray
+            Bounds of each shape, see `_bounds`.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        """
+        start, stop = np.array(location, dtype=int).T
+        overlap = np.all((low < stop) & (high >= start), axis=1)
+        for i in np.where(overlap)[0]:
+            s = self.shapes[indices[i]]
+            if len(shape) == 2:
+                displayed = [0, 1]
+            else:
+                displayed = list(s.dims_displayed[-2:])
+                key = [slice(None)] * len(shape)
+                for axis in s.dims_not_displayed:
+                    key[axis] = slice(
+                        low[i, axis] - start[axis],
+                        high[i, axis] + 1 - start[axis],
+                    )
+                    if key[axis].start < 0:
+                        key[axis] = slice(0, key[axis].stop)
+                planes = np.moveaxis(region[tuple(key)], displayed, [-2, -1])
+            bbox, mask = s.to_bbox_mask(
+                np.take(shape, displayed),
+                zoom_factor=zoom_factor,
+                offset=offset,
+                window=[start[displayed], stop[displayed]],
+            )
+            if len(shape) == 2:
+                region[bbox][mask] = values[i]
+            else:
+                planes[(Ellipsis,) + bbox][..., mask] = values[i]
+
     def to_xml_list(self):
         """Convert the shapes to a list of xml elements according to the svg
         specification. Z ordering of the shapes will be taken into account.
@@ -28,6 +28,8 @@ class Line(Shape):
         ontop of others.
     dims_order : (D,) list
         Order that the dimensions are to be rendered in.
+    skip_triangulation : bool
+        Whether to defer the triangulation of the edge, see `Shape`.
     """
 
     def __init__(
@@ -41,6 +43,7 @@ class Line(Shape):
         z_index=0,
         dims_order=None,
         ndisplay=2,
+        skip_triangulation=False,
     ):
 
         super().__init__(
@@ -51,6 +54,7 @@ class Line(Shape):
             z_index=z_index,
             dims_order=dims_order,
             ndisplay=ndisplay,
+            skip_triangulation=skip_triangulation,
         )
         self._filled = False
         self.data = data
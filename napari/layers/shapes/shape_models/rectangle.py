@@ -30,6 +30,8 @@ class Rectangle(Shape):
         ontop of others.
     dims_order : (D,) list
         Order that the dimensions are to be rendered in.
+    skip_triangulation : bool
+        Whether to defer the triangulation of the edge, see `Shape`.
     """
 
     def __init__(
@@ -43,6 +45,7 @@ class Rectangle(Shape):
         z_index=0,
         dims_order=None,
         ndisplay=2,
+        skip_triangulation=False,
     ):
 
         super().__init__(
@@ -53,6 +56,7 @@ class Rectangle(Shape):
             z_index=z_index,
             dims_order=dims_order,
             ndisplay=ndisplay,
+            skip_triangulation=skip_triangulation,
         )
 
         self._closed = True
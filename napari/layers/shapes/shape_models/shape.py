@@ -1,13 +1,12 @@
 from abc import ABC, abstractmethod
 import numpy as np
-from copy import copy
 from vispy.color import Color
 from ..shape_utils import (
     triangulate_edge,
     triangulate_face,
     is_collinear,
-    poly_to_mask,
-    path_to_mask,
+    poly_to_bbox_mask,
+    path_to_bbox_mask,
 )
 
 
@@ -37,6 +36,10 @@ class Shape(ABC):
         Order that the dimensions are to be rendered in.
     ndisplay : int
         Number of displayed dimensions.
+    skip_triangulation : bool
+        If True the edge is not triangulated when the shape is created, so
+        that it can be triangulated later together with the edges of other
+        shapes, see `ShapeList.add`.
 
     Attributes
     ----------
@@ -105,6 +108,9 @@ class Shape(ABC):
         Flag if array is filled or not.
     _use_face_vertices : bool
         Flag to use face vertices for mask generation.
+    _pending_edge : tuple or None
+        Path and closed flag of an edge that still needs to be triangulated,
+        if triangulation was skipped.
     """
 
     def __init__(
@@ -118,11 +124,14 @@ class Shape(ABC):
         z_index=0,
         dims_order=None,
         ndisplay=2,
+        skip_triangulation=False,
     ):
 
         self._dims_order = dims_order or list(range(2))
         self._ndisplay = ndisplay
         self.slice_key = None
+        self._skip_triangulation = skip_triangulation
+        self._pending_edge = None
 
         self._face_vertices = np.empty((0, self.ndisplay))
         self._face_triangles = np.empty((0, 3), dtype=np.uint32)
@@ -298,7 +307,9 @@ class Shape(ABC):
         edge : bool
             Bool which determines if the edge need to be traingulated
         """
-        if edge:
+        if edge and self._skip_triangulation:
+            self._pending_edge = (data, closed)
+        elif edge:
             centers, offsets, triangles = triangulate_edge(data, closed=closed)
             self._edge_vertices = centers
             self._edge_offsets = offsets
@@ -341,6 +352,24 @@ class Shape(ABC):
             self._face_vertices = np.empty((0, self.ndisplay))
             self._face_triangles = np.empty((0, 3), dtype=np.uint32)
 
+    def _set_edge_meshes(self, centers, offsets, triangles):
+        """Sets the edge mesh of a shape whose triangulation was skipped.
+
+        Parameters
+        ----------
+        centers : np.ndarray
+            Mx2 array of central coordinates of the edge triangles.
+        offsets : np.ndarray
+            Mx2 array of offsets to the central coordinates.
+        triangles : np.ndarray
+            Px3 array of vertex indices that form the edge triangles.
+        """
+        self._edge_vertices = centers
+        self._edge_offsets = offsets
+        self._edge_triangles = triangles
+        self._skip_triangulation = False
+        self._pending_edge = None
+
     def transform(self, transform):
         """Performs a linear transform on the shape
 
@@ -491,41 +520,88 @@ class Shape(ABC):
             got {len(mask_shape)}."""
             )
 
-        if self._use_face_vertices:
-            data = self._face_vertices
+        mask = np.zeros(mask_shape, dtype=bool)
+        bbox, mask_p = self.to_bbox_mask(
+            shape_plane, zoom_factor=zoom_factor, offset=offset
+        )
+
+        # If the mask is to be embedded in a larger array, write it into the
+        # planes within the slice key, with the displayed axes last.
+        if embedded:
+            slice_key = [slice(None)] * len(mask_shape)
+            for j, i in enumerate(self.dims_not_displayed):
+                slice_key[i] = slice(
+                    self.slice_key[0, j], self.slice_key[1, j] + 1
+                )
+            planes = np.moveaxis(
+                mask[tuple(slice_key)], self.dims_displayed, [-2, -1]
+            )
+            planes[(Ellipsis,) + bbox] = mask_p
         else:
-            data = self.data_displayed
+            mask[bbox] = mask_p
+
+        return mask
+
+    def to_bbox_mask(
+        self, mask_shape, zoom_factor=1, offset=[0, 0], window=None
+    ):
+        """Convert the shape vertices to a boolean mask of its bounding box.
 
-        data = data[:, -len(shape_plane) :]
+        Only the bounding box of the shape within the mask is rasterized, so
+        shapes can be drawn directly into a larger array, one part of it at a
+        time if needed.
+
+        Parameters
+        ----------
+        mask_shape : (2,) array
+            Shape of the whole mask, along the displayed dimensions.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask. Used
+            for generating as downsampled mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor. Used for putting negative coordinates into the mask.
+        window : (2, 2) array, optional
+            Start and stop along each axis of the part of the mask to
+            rasterize. If None the whole mask is rasterized.
 
+        Returns
+        ----------
+        bbox : tuple of slice
+            Bounding box of the shape within the window, relative to the
+            start of the window.
+        mask : np.ndarray
+            Boolean array of the shape of the bounding box with `True` for
+            points inside the shape.
+        """
+        data = self._mask_vertices(zoom_factor=zoom_factor, offset=offset)
         if self._filled:
-            mask_p = poly_to_mask(shape_plane, (data - offset) * zoom_factor)
+            return poly_to_bbox_mask(mask_shape, data, window=window)
         else:
-            mask_p = path_to_mask(shape_plane, (data - offset) * zoom_factor)
+            return path_to_bbox_mask(mask_shape, data, window=window)
 
-        # If the mask is to be embedded in a larger array, compute array
-        # and embed as a slice.
-        if embedded:
-            mask = np.zeros(mask_shape, dtype=bool)
-            slice_key = [0] * len(mask_shape)
-            j = 0
-            for i in range(len(mask_shape)):
-                if i in self.dims_displayed:
-                    slice_key[i] = slice(None)
-                else:
-                    slice_key[i] = slice(
-                        self.slice_key[0, j], self.slice_key[1, j] + 1
-                    )
-                j += 1
-            displayed_order = np.array(copy(self.dims_displayed))
-            displayed_order[np.argsort(displayed_order)] = list(
-                range(len(displayed_order))
-            )
-            mask[tuple(slice_key)] == mask_p.transpose(displayed_order)
-        else:
-            mask = mask_p
+    def _mask_vertices(self, zoom_factor=1, offset=[0, 0]):
+        """Vertices used for mask generation, in mask coordinates.
 
-        return mask
+        Parameters
+        ----------
+        zoom_factor : float
+            Premultiplier applied to coordinates.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+
+        Returns
+        ----------
+        vertices : (N, 2) array
+            Displayed vertices of the shape, or of its face if it is used for
+            mask generation, after the zoom and offset.
+        """
+        if self._use_face_vertices:
+            data = self._face_vertices
+        else:
+            data = self.data_displayed
+        return (data[:, -2:] - offset) * zoom_factor
 
     @abstractmethod
     def to_xml(self):
@@ -148,3 +148,14 @@ def test_nD_ellipse():
 
     shape.ndisplay = 3
     assert shape.data_displayed.shape == (4, 3)
+
+
+def test_nD_to_mask():
+    """Test a planar nD shape is embedded in the planes of its slice key."""
+    data = np.array([[2, 1, 1], [2, 1, 6], [2, 8, 6], [2, 8, 1]])
+    shape = Rectangle(data)
+    mask = shape.to_mask((4, 10, 10))
+    assert mask.shape == (4, 10, 10)
+    np.testing.assert_array_equal(mask[2], shape.to_mask((10, 10)))
+    assert mask[2, 1:8, 1:6].all()
+    assert mask.sum() == mask[2].sum()
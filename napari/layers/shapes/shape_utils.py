@@ -611,6 +611,174 @@ def triangulate_edge(path, closed=False):
     return centers, offsets, triangles
 
 
+def triangulate_edges(paths, closed=False, limit=3, bevel=False):
+    """Determines the triangulations of many 2D paths at once.
+
+    Gives the same result as calling `triangulate_edge` on each path, but
+    the vertices of all paths are processed together in vectorized form,
+    which is much faster when there are many paths.
+
+    Parameters
+    ----------
+    paths : list of np.ndarray
+        List of Nx2 arrays of central coordinates of paths to be triangulated
+    closed : bool
+        Bool which determines if the paths are closed or not.
+    limit : float
+        Miter limit which determines when to switch from a miter join to a
+        bevel join
+    bevel : bool
+        Bool which if True causes a bevel join to always be used. If False
+        a bevel join will only be used when the miter limit is exceeded
+
+    Returns
+    -------
+    centers : list of np.ndarray
+        Mx2 arrays of central coordinates of the triangles of each path.
+    offsets : list of np.ndarray
+        Mx2 arrays of the offsets to the central coordinates of each path,
+        see `triangulate_edge`.
+    triangles : list of np.ndarray
+        Px3 arrays of the indices of the vertices that form the triangles of
+        each path.
+    """
+    npaths = len(paths)
+    if npaths == 0:
+        return [], [], []
+    lengths = np.array([len(p) for p in paths])
+    vertices = np.concatenate(paths).astype(float)
+    path_ids = np.repeat(np.arange(npaths), lengths)
+    position = np.arange(len(vertices)) - (np.cumsum(lengths) - lengths)[
+        path_ids
+    ]
+
+    # Remove any equal adjacent points of paths longer than two, and repeat
+    # paths reduced to a single point
+    equal = np.zeros(len(vertices), dtype=bool)
+    equal[1:] = np.all(vertices[1:] == vertices[:-1], axis=1)
+    remove = equal & (position > 0) & (lengths[path_ids] > 2)
+    vertices = vertices[~remove]
+    path_ids = path_ids[~remove]
+    lengths = np.bincount(path_ids, minlength=npaths)
+    repeats = np.where(lengths[path_ids] == 1, 2, 1)
+    vertices = np.repeat(vertices, repeats, axis=0)
+    path_ids = np.repeat(path_ids, repeats)
+    lengths = np.bincount(path_ids, minlength=npaths)
+
+    if closed:
+        # Remove the last point of closed paths if it repeats the first
+        starts = np.cumsum(lengths) - lengths
+        ends = starts + lengths - 1
+        repeated = np.all(vertices[starts] == vertices[ends], axis=1)
+        keep = np.ones(len(vertices), dtype=bool)
+        keep[ends[repeated & (lengths > 2)]] = False
+        vertices = vertices[keep]
+        path_ids = path_ids[keep]
+        lengths = np.bincount(path_ids, minlength=npaths)
+
+    nvertices = len(vertices)
+    index = np.arange(nvertices)
+    starts = np.cumsum(lengths) - lengths
+    n = lengths[path_ids]
+    position = index - starts[path_ids]
+    following = starts[path_ids] + (position + 1) % n
+    preceding = starts[path_ids] + (position - 1) % n
+
+    # Normals of the segments before and after each vertex
+    if closed:
+        before = segment_normal(vertices[preceding], vertices)
+        after = before[following]
+    else:
+        last = position == n - 1
+        after = segment_normal(
+            vertices, vertices[np.where(last, preceding, following)]
+        )
+        after[last] = -after[last]
+        before = after[np.where(position == 0, index, index - 1)]
+
+    miters = (before + after) / 2
+    dots = np.sum(miters * before, axis=1)
+    nonzero = dots != 0
+    miters[nonzero] = miters[nonzero] / dots[nonzero, np.newaxis]
+    miters[~nonzero] = before[~nonzero]
+    miter_lengths = np.linalg.norm(miters, axis=1)
+    miters = 0.5 * miters
+
+    bevels = bevel | (miter_lengths > limit)
+    if not closed:
+        bevels &= (position > 0) & (position < n - 1)
+    group_sizes = 2 + bevels.astype(int)
+
+    # Each vertex has a group of two offsets along the miter, or three for a
+    # bevel join
+    groups = np.zeros((nvertices, 3, 2))
+    groups[:, 0] = -miters
+    groups[:, 1] = miters
+    if np.any(bevels):
+        miter = miters[bevels]
+        offset = np.stack([miter[:, 1], -miter[:, 0]], axis=1)
+        offset = 0.5 * offset / np.linalg.norm(offset, axis=1, keepdims=True)
+        flip = np.sign(np.sum(offset * before[bevels], axis=1, keepdims=True))
+        groups[bevels, 0] = offset
+        groups[bevels, 1] = (
+            -flip * miter / miter_lengths[bevels, np.newaxis] * limit
+        )
+        groups[bevels, 2] = -offset
+    offsets = groups[np.arange(3) < group_sizes[:, np.newaxis]]
+    centers = np.repeat(vertices, group_sizes, axis=0)
+    group_starts = np.cumsum(group_sizes) - group_sizes
+
+    # Each vertex after the first is joined to the previous one by two
+    # triangles, and closed paths have a final join back to the first vertex.
+    # Every join is followed by the triangle of a bevel, if any.
+    rows = index + path_ids
+    nrows = nvertices + npaths
+    row_from = np.zeros(nrows, dtype=int)
+    row_to = np.zeros(nrows, dtype=int)
+    row_from[rows] = index - 1
+    row_to[rows] = index
+    joined = np.zeros(nrows, dtype=bool)
+    joined[rows] = position > 0
+    closing = starts + lengths + np.arange(npaths)
+    row_from[closing] = starts + lengths - 1
+    row_to[closing] = starts
+    joined[closing] = closed
+    row_bevel = np.zeros(nrows, dtype=bool)
+    row_bevel[rows] = bevels
+    row_paths = np.zeros(nrows, dtype=int)
+    row_paths[rows] = path_ids
+    row_paths[closing] = np.arange(npaths)
+
+    a = group_starts[row_from] + group_sizes[row_from] - 2
+    b = group_starts[row_to]
+    ray = vertices[row_to] - vertices[row_from]
+    cross_a = np.cross(offsets[a + 1], ray)
+    cross_b = np.cross(offsets[b + 1], ray)
+    same_side = cross_a * cross_b > 0
+    triangles = np.zeros((nrows, 3, 3), dtype=int)
+    triangles[:, 0] = np.stack([a, a + 1, b + 1], axis=1)
+    triangles[:, 1] = np.stack(
+        [np.where(same_side, a, a + 1), b, b + 1], axis=1
+    )
+    triangles[:, 2] = np.stack([b, b + 1, b + 2], axis=1)
+    valid = np.stack([joined, joined, row_bevel], axis=1)
+    triangles = triangles[valid]
+    triangle_paths = np.repeat(row_paths, valid.sum(axis=1))
+
+    # Make the vertex indices relative to the first vertex of each path
+    vertex_counts = np.bincount(path_ids, group_sizes, minlength=npaths)
+    vertex_counts = vertex_counts.astype(int)
+    vertex_starts = np.cumsum(vertex_counts) - vertex_counts
+    triangles = triangles - vertex_starts[triangle_paths, np.newaxis]
+    triangle_counts = np.bincount(triangle_paths, minlength=npaths)
+
+    splits = np.cumsum(vertex_counts)[:-1]
+    centers = np.split(centers, splits)
+    offsets = np.split(offsets, splits)
+    triangles = np.split(triangles, np.cumsum(triangle_counts)[:-1])
+    return centers, offsets, triangles
+
+
 def generate_2D_edge_meshes(path, closed=False, limit=3, bevel=False):
     """Determines the triangulation of a path in 2D. The resulting `offsets`
     can be mulitplied by a `width` scalar and be added to the resulting
@@ -865,18 +1033,64 @@ def path_to_mask(mask_shape, vertices):
         Boolean array with `True` for points along the path
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bbox, bbox_mask = path_to_bbox_mask(mask_shape, vertices)
+    mask[bbox] = bbox_mask
+    return mask
+
+
+def path_to_bbox_mask(mask_shape, vertices, window=None):
+    """Converts a path to a boolean mask of its bounding box with `True` for
+    points lying along each edge.
+
+    Vertices are clipped to the mask and rounded before the edges are drawn,
+    as in `path_to_mask`, so a path gives the same points whatever part of
+    the mask is rasterized.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of the whole mask.
+    vertices : array (N, 2)
+        Vertices of the path.
+    window : array (2, 2), optional
+        Start and stop along each axis of the part of the mask to rasterize.
+        If None the whole mask is rasterized.
+
+    Returns
+    ----------
+    bbox : tuple of slice
+        Bounding box of the points along the path within the window,
+        relative to the start of the window.
+    mask : np.ndarray
+        Boolean array of the shape of the bounding box with `True` for
+        points along the path.
+    """
+    if window is None:
+        window = np.array([[0, 0], mask_shape])
+    window = np.asarray(window, dtype=int)
     vertices = np.round(
         np.clip(vertices, 0, np.subtract(mask_shape, 1))
     ).astype(int)
+    points = [np.empty((0, 2), dtype=int)]
     for i in range(len(vertices) - 1):
         start = vertices[i]
         stop = vertices[i + 1]
         step = np.ceil(np.max(abs(stop - start))).astype(int)
         x_vals = np.linspace(start[0], stop[0], step)
         y_vals = np.linspace(start[1], stop[1], step)
-        for x, y in zip(x_vals, y_vals):
-            mask[int(x), int(y)] = 1
-    return mask
+        points.append(np.stack([x_vals, y_vals], axis=1).astype(int))
+    points = np.concatenate(points) - window[0]
+    inside = np.all((points >= 0) & (points < window[1] - window[0]), axis=1)
+    points = points[inside]
+
+    if len(points) == 0:
+        return (slice(0, 0), slice(0, 0)), np.zeros((0, 0), dtype=bool)
+    low = points.min(axis=0)
+    high = points.max(axis=0) + 1
+    mask = np.zeros(high - low, dtype=bool)
+    mask[tuple((points - low).T)] = True
+    bbox = (slice(low[0], high[0]), slice(low[1], high[1]))
+    return bbox, mask
 
 
 def poly_to_mask(mask_shape, vertices):
@@ -897,17 +1111,90 @@ def poly_to_mask(mask_shape, vertices):
         Boolean array with `True` for points inside the polygon
     """
     mask = np.zeros(mask_shape, dtype=bool)
-    bottom = vertices.min(axis=0).astype('int')
-    bottom = np.clip(bottom, 0, np.subtract(mask_shape, 1))
-    top = np.ceil(vertices.max(axis=0)).astype('int')
-    # top = np.append([top], [mask_shape], axis=0).min(axis=0)
-    top = np.clip(top, 0, np.subtract(mask_shape, 1))
-    if np.all(top > bottom):
-        bb_mask = grid_points_in_poly(top - bottom, vertices - bottom)
-        mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    bbox, bbox_mask = poly_to_bbox_mask(mask_shape, vertices)
+    mask[bbox] = bbox_mask
     return mask
 
 
+def poly_to_bbox_mask(mask_shape, vertices, window=None):
+    """Converts a polygon to a boolean mask of its bounding box with `True`
+    for points lying inside the shape.
+
+    Points are rasterized one scanline at a time along the last axis, using
+    the even-odd rule: the crossings of each scanline with the edges of the
+    polygon are marked, and a cumulative parity of the marks along the first
+    axis gives the points inside. Only the bounding box of the polygon
+    within the window is computed, and points are tested as in
+    `points_in_poly`, so any part of the mask can be rasterized on its own.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of the whole mask.
+    vertices : array (N, 2)
+        Vertices of the polygon.
+    window : array (2, 2), optional
+        Start and stop along each axis of the part of the mask to rasterize.
+        If None the whole mask is rasterized.
+
+    Returns
+    ----------
+    bbox : tuple of slice
+        Bounding box of the polygon within the window, relative to the start
+        of the window.
+    mask : np.ndarray
+        Boolean array of the shape of the bounding box with `True` for points
+        inside the polygon.
+    """
+    if window is None:
+        window = np.array([[0, 0], mask_shape])
+    window = np.asarray(window, dtype=int)
+    vertices = np.asarray(vertices, dtype=float) - window[0]
+    size = window[1] - window[0]
+
+    low = np.minimum(np.maximum(np.floor(vertices.min(axis=0)), 0), size)
+    high = np.minimum(np.maximum(np.ceil(vertices.max(axis=0)), 0), size)
+    low = low.astype(int)
+    high = high.astype(int)
+    bbox = (slice(low[0], high[0]), slice(low[1], high[1]))
+    if np.any(high <= low):
+        return bbox, np.zeros(np.maximum(high - low, 0), dtype=bool)
+
+    # Each edge from vertex i to the previous vertex j crosses the
+    # scanlines y with min(y_i, y_j) <= y < max(y_i, y_j), so horizontal
+    # edges never cross
+    start = vertices
+    stop = np.roll(vertices, 1, axis=0)
+    d = stop - start
+    first = np.ceil(np.minimum(start[:, 1], stop[:, 1]))
+    last = np.ceil(np.maximum(start[:, 1], stop[:, 1]))
+    first = np.minimum(np.maximum(first, low[1]), high[1]).astype(int)
+    last = np.minimum(np.maximum(last, low[1]), high[1]).astype(int)
+    counts = last - first
+
+    edges = np.repeat(np.arange(len(vertices)), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    cols = np.repeat(first, counts) + np.arange(len(edges)) - starts
+    crossings = (
+        d[edges, 0] * (cols - start[edges, 1]) / d[edges, 1]
+        + start[edges, 0]
+    )
+
+    # Point x lies inside if an odd number of crossings c have x < c. Every
+    # scanline has an even number of crossings, so equivalently if an odd
+    # number have c <= x, that is x >= ceil(c).
+    rows = np.maximum(np.ceil(crossings), low[0]).astype(int)
+    keep = rows < high[0]
+    marks, n_marks = np.unique(
+        (rows[keep] - low[0]) * (high[1] - low[1]) + cols[keep] - low[1],
+        return_counts=True,
+    )
+    mask = np.zeros(high - low, dtype=bool)
+    mask.flat[marks[n_marks % 2 == 1]] = True
+    np.logical_xor.accumulate(mask, axis=0, out=mask)
+    return bbox, mask
+
+
 def grid_points_in_poly(shape, vertices):
     """Converts a polygon to a boolean mask with `True` for points
     lying inside the shape. Loops through all indices in the grid
@@ -296,8 +296,8 @@ class Shapes(Layer):
         self._help = 'enter a selection mode to edit shape properties'
 
         self.events.deselect.connect(self._finish_drawing)
-        self.events.face_color.connect(self._update_thumbnail)
-        self.events.edge_color.connect(self._update_thumbnail)
+        self.events.face_color.connect(lambda e: self._invalidate_thumbnail())
+        self.events.edge_color.connect(lambda e: self._invalidate_thumbnail())
 
         self.add(
             data,
@@ -682,6 +682,7 @@ class Shapes(Layer):
                 ensure_iterable(z_index),
             )
 
+            shapes = []
             for d, st, ew, ec, fc, o, z in shape_inputs:
 
                 # A False slice_key means the shape is invalid as it is not
@@ -696,10 +697,12 @@ class Shapes(Layer):
                     z_index=z,
                     dims_order=self.dims.order,
                     ndisplay=self.dims.ndisplay,
+                    skip_triangulation=True,
                 )
+                shapes.append(shape)
 
-                # Add shape
-                self._data_view.add(shape)
+            # Add all shapes at once, triangulating their edges together
+            self._data_view.add(shapes)
 
         self._display_order_stored = copy(self.dims.order)
         self._ndisplay_stored = copy(self.dims.ndisplay)
@@ -1390,7 +1393,7 @@ class Shapes(Layer):
         """
         return self._data_view.to_xml_list()
 
-    def to_masks(self, mask_shape=None):
+    def to_masks(self, mask_shape=None, chunks=None):
         """Return an array of binary masks, one for each shape.
 
         Parameters
@@ -1398,21 +1401,26 @@ class Shapes(Layer):
         mask_shape : np.ndarray | tuple | None
             tuple defining shape of mask to be generated. If non specified,
             takes the max of all the vertiecs
+        chunks : tuple, optional
+            Chunks of a lazy dask array to return instead of a numpy array,
+            along the shapes axis and each axis of the masks. Chunks are only
+            rasterized when computed, for example when stored with `to_zarr`,
+            so the masks never need to fit in memory.
 
         Returns
         ----------
-        masks : np.ndarray
+        masks : np.ndarray or dask.array.Array
             Array where there is one binary mask for each shape
         """
         if mask_shape is None:
             mask_shape = self.shape
 
         mask_shape = np.ceil(mask_shape).astype('int')
-        masks = self._data_view.to_masks(mask_shape=mask_shape)
+        masks = self._data_view.to_masks(mask_shape=mask_shape, chunks=chunks)
 
         return masks
 
-    def to_labels(self, labels_shape=None):
+    def to_labels(self, labels_shape=None, chunks=None):
         """Return an integer labels image.
 
         Parameters
@@ -1420,10 +1428,14 @@ class Shapes(Layer):
         labels_shape : np.ndarray | tuple | None
             Tuple defining shape of labels image to be generated. If non
             specified, takes the max of all the vertiecs
+        chunks : tuple, optional
+            Chunks of a lazy dask array to return instead of a numpy array.
+            Chunks are only rasterized when computed, for example when stored
+            with `to_zarr`, so the labels image never needs to fit in memory.
 
         Returns
         ----------
-        labels : np.ndarray
+        labels : np.ndarray or dask.array.Array
             Integer array where each value is either 0 for background or an
             integer up to N for points inside the shape at the index value - 1.
             For overlapping shapes z-ordering will be respected.
@@ -1432,7 +1444,9 @@ class Shapes(Layer):
             labels_shape = self.shape
 
         labels_shape = np.ceil(labels_shape).astype('int')
-        labels = self._data_view.to_labels(labels_shape=labels_shape)
+        labels = self._data_view.to_labels(
+            labels_shape=labels_shape, chunks=chunks
+        )
 
         return labels
 
@@ -1733,7 +1747,7 @@ class Shapes(Layer):
             self._fixed_vertex = None
             self._moving_value = (None, None)
             self._set_highlight()
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
         elif self._mode == Mode.DIRECT:
             if not self._is_moving and not self._is_selecting and not shift:
                 if self._value[0] is not None:
@@ -1752,7 +1766,7 @@ class Shapes(Layer):
             self._fixed_vertex = None
             self._moving_value = (None, None)
             self._set_highlight()
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
         elif self._mode in (
             [Mode.ADD_RECTANGLE, Mode.ADD_ELLIPSE, Mode.ADD_LINE]
         ):
@@ -1,6 +1,10 @@
 import numpy as np
 from napari.layers.shapes.shape_list import ShapeList
 from napari.layers.shapes.shape_models import Rectangle, Polygon, Path
+from napari.layers.shapes.shape_utils import (
+    inside_triangles,
+    triangles_intersect_box,
+)
 
 
 def test_empty_shape_list():
@@ -45,3 +49,271 @@ def test_nD_shapes():
     shape_list.ndisplay = 3
     assert shape_list._vertices.shape[1] == 3
     assert shape_list._mesh.vertices.shape[1] == 3
+
+
+def test_adding_list_to_shape_list():
+    """Test adding a list of shapes gives the same mesh as one by one."""
+    np.random.seed(0)
+    shapes = [Rectangle(20 * np.random.random((4, 2))) for i in range(5)]
+    shapes += [Polygon(20 * np.random.random((6, 2))) for i in range(5)]
+    shapes += [Path(20 * np.random.random((6, 2))) for i in range(5)]
+    shape_list = ShapeList()
+    for shape in shapes:
+        shape_list.add(shape)
+
+    batched = [
+        type(s)(s.data, edge_width=2, skip_triangulation=True) for s in shapes
+    ]
+    batch_list = ShapeList()
+    batch_list.add(batched)
+    assert len(batch_list.shapes) == len(shapes)
+
+    for name in [
+        'vertices_centers',
+        'vertices_offsets',
+        'vertices_index',
+        'triangles',
+        'triangles_index',
+        'triangles_colors',
+        'triangles_z_order',
+    ]:
+        np.testing.assert_array_equal(
+            getattr(batch_list._mesh, name), getattr(shape_list._mesh, name)
+        )
+    np.testing.assert_array_equal(
+        batch_list._mesh.vertices,
+        batch_list._mesh.vertices_centers
+        + 2 * batch_list._mesh.vertices_offsets,
+    )
+    np.testing.assert_array_equal(batch_list._vertices, shape_list._vertices)
+    np.testing.assert_array_equal(batch_list._index, shape_list._index)
+
+
+def test_hit_testing_with_spatial_index():
+    """Test inside and shapes_in_box match a scan over all triangles."""
+    np.random.seed(0)
+    shapes = [
+        Rectangle(5 * np.random.random((4, 2)) + 100 * np.random.random(2))
+        for i in range(50)
+    ]
+    shapes += [
+        Polygon(8 * np.random.random((6, 2)) + 100 * np.random.random(2))
+        for i in range(50)
+    ]
+    shape_list = ShapeList(shapes)
+
+    displayed = shape_list._mesh.displayed_triangles
+    triangles = shape_list._mesh.vertices[displayed]
+    shape_index = shape_list._mesh.displayed_triangles_index[:, 0]
+    for coord in 100 * np.random.random((50, 2)):
+        hits = shape_index[inside_triangles(triangles - coord)]
+        if len(hits) == 0:
+            assert shape_list.inside(coord) is None
+        else:
+            z_order = list(shape_list._z_order)
+            expected = min(hits, key=z_order.index)
+            assert shape_list.inside(coord) == expected
+
+    for corner in 100 * np.random.random((20, 2)):
+        corners = np.array([corner, corner + 20])
+        intersects = triangles_intersect_box(triangles, corners)
+        expected = np.unique(shape_index[intersects]).tolist()
+        assert shape_list.shapes_in_box(corners) == expected
+
+    # Editing a shape updates the index
+    shape_list.shift(0, [200, 200])
+    assert shape_list.inside(shape_list.shapes[0].data.mean(axis=0)) == 0
+
+
+def test_spatial_index_updated_incrementally():
+    """Test edits update the spatial index of the slice in place."""
+    np.random.seed(0)
+    shapes = [
+        Rectangle(5 * np.random.random((4, 2)) + 100 * np.random.random(2))
+        for i in range(50)
+    ]
+    shape_list = ShapeList(shapes)
+    grid = shape_list._triangle_grid()
+
+    # moving a shape around and recoloring it keep the same grid
+    for step in range(10):
+        shape_list.shift(3, [5, 5])
+        shape_list.update_face_color(3, 'red')
+        center = shape_list.shapes[3].data.mean(axis=0)
+        assert shape_list.inside(center) == 3
+        assert shape_list._triangle_grid() is grid
+
+    # added and removed shapes are found under their new index
+    shape_list.add(Rectangle(np.array([[0, 300], [10, 310]])))
+    shape_list.remove(0)
+    assert shape_list._triangle_grid() is grid
+    assert shape_list.inside([5, 305]) == 49
+    center = shape_list.shapes[2].data.mean(axis=0)
+    assert shape_list.inside(center) == 2
+
+    # only the grid of the current slice is kept
+    shape_list.slice_key = [1]
+    assert shape_list._triangle_grid() is not grid
+    assert shape_list.inside(center) is None
+
+
+def test_slicing_with_slice_index():
+    """Test displayed data matches a scan over the slice keys of all shapes."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(60):
+        data = 20 * np.random.random((6, 3))
+        data[:, 0] = i % 5
+        shape_type = [Rectangle, Polygon, Path][i % 3]
+        shapes.append(shape_type(data[:4] if i % 3 == 0 else data))
+    # A shape spanning several slices is never displayed
+    shapes.append(Path(20 * np.random.random((6, 3))))
+    shape_list = ShapeList(shapes)
+    shape_list.update_z_index(3, 10)
+    shape_list.edit(7, shapes[7].data + [0, 1, 1])
+    shape_list.remove(11)
+
+    for plane in range(6):
+        shape_list.slice_key = [plane]
+        slice_keys = shape_list.slice_keys
+        displayed = np.all(slice_keys == plane, axis=(1, 2))
+        np.testing.assert_array_equal(shape_list._displayed, displayed)
+
+        mesh = shape_list._mesh
+        z_order = mesh.triangles_z_order
+        indices = np.isin(
+            mesh.triangles_index[z_order, 0], np.where(displayed)[0]
+        )
+        np.testing.assert_array_equal(
+            mesh.displayed_triangles, mesh.triangles[z_order][indices]
+        )
+        np.testing.assert_array_equal(
+            mesh.displayed_triangles_index,
+            mesh.triangles_index[z_order][indices],
+        )
+        indices = np.isin(shape_list._index, np.where(displayed)[0])
+        np.testing.assert_array_equal(
+            shape_list.displayed_vertices, shape_list._vertices[indices]
+        )
+        np.testing.assert_array_equal(
+            shape_list.displayed_index, shape_list._index[indices]
+        )
+
+
+def test_slice_index_updated_incrementally():
+    """Test edits only update the slice index entries of the edited shape."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(20):
+        data = 20 * np.random.random((6, 3))
+        data[:, 0] = i % 2
+        shapes.append(Polygon(data))
+    shape_list = ShapeList(shapes)
+    odd = shape_list._slice_index[(1,)]
+
+    data = 20 * np.random.random((6, 3))
+    shape_list.add(Polygon(data * [0, 1, 1]))
+    shape_list.edit(2, shape_list.shapes[2].data + [2, 0, 0])
+    assert shape_list._slice_index[(1,)] is odd
+    np.testing.assert_array_equal(
+        shape_list._slice_index[(0,)], [0, 4, 6, 8, 10, 12, 14, 16, 18, 20]
+    )
+    np.testing.assert_array_equal(shape_list._slice_index[(2,)], [2])
+
+    # removing a shape renumbers the shapes after it
+    shape_list.remove(1)
+    np.testing.assert_array_equal(
+        shape_list._slice_index[(1,)], [2, 4, 6, 8, 10, 12, 14, 16, 18]
+    )
+    np.testing.assert_array_equal(shape_list._slice_index[(2,)], [1])
+
+
+def test_adding_and_removing_with_buffers():
+    """Test the mesh matches after adding and removing shapes one by one."""
+    np.random.seed(0)
+    data = 20 * np.random.random((30, 4, 2))
+    shape_list = ShapeList()
+    for d in data:
+        shape_list.add(Rectangle(d))
+    for index in [25, 10, 3, 0]:
+        shape_list.remove(index)
+    remaining = np.delete(data, [0, 3, 10, 25], axis=0)
+
+    expected = ShapeList([Rectangle(d) for d in remaining])
+    mesh, expected_mesh = shape_list._mesh, expected._mesh
+    assert len(shape_list.shapes) == 26
+    np.testing.assert_allclose(shape_list._vertices, expected._vertices)
+    np.testing.assert_equal(shape_list._index, expected._index)
+    np.testing.assert_allclose(mesh.vertices, expected_mesh.vertices)
+    np.testing.assert_equal(mesh.triangles, expected_mesh.triangles)
+    np.testing.assert_equal(
+        mesh.triangles_index, expected_mesh.triangles_index
+    )
+    np.testing.assert_equal(
+        mesh.displayed_triangles, expected_mesh.displayed_triangles
+    )
+
+
+def test_to_labels_in_tiles():
+    """Test shapes drawn in tiles respect z order and match their masks."""
+    np.random.seed(0)
+    data = 40 * np.random.random((20, 4, 2)) - 5
+    shapes = [Rectangle(d, z_index=i % 3) for i, d in enumerate(data[:10])]
+    shapes += [Path(d, z_index=i % 3) for i, d in enumerate(data[10:])]
+    shape_list = ShapeList(shapes)
+
+    expected = np.zeros((30, 30), dtype=int)
+    for index in shape_list._z_order[::-1]:
+        expected[shape_list.shapes[index].to_mask((30, 30))] = index + 1
+
+    labels = shape_list.to_labels((30, 30))
+    np.testing.assert_array_equal(labels, expected)
+
+    shape_list._tile_size = 70
+    labels = shape_list.to_labels((30, 30))
+    np.testing.assert_array_equal(labels, expected)
+
+    colors = shape_list.to_colors((30, 30))
+    index = expected[expected > 0] - 1
+    face_colors = np.array([s.face_color.rgba for s in shape_list.shapes])
+    edge_colors = np.array([s.edge_color.rgba for s in shape_list.shapes])
+    expected_colors = np.where(
+        (index >= 10)[:, None], edge_colors[index], face_colors[index]
+    )
+    np.testing.assert_allclose(colors[expected > 0], expected_colors)
+
+
+def test_nD_to_labels_in_chunks():
+    """Test nD shapes are drawn into their planes, dense or chunk by chunk."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(12):
+        data = np.zeros((4, 3))
+        data[:, 0] = i % 5
+        data[:, 1:] = 30 * np.random.random((4, 2)) - 5
+        shapes.append(Polygon(data, z_index=i % 3))
+    # a shape spanning several planes
+    path = np.array([[1, 2, 3], [3, 20, 25], [3, 5, 25]])
+    shapes.append(Path(path, z_index=5))
+    shape_list = ShapeList(shapes)
+
+    labels_shape = (5, 24, 26)
+    expected = np.zeros(labels_shape, dtype=int)
+    for index in shape_list._z_order[::-1]:
+        mask = shape_list.shapes[index].to_mask(labels_shape)
+        expected[mask] = index + 1
+    assert np.all(expected[1:4, 10, 25] == 13)
+    assert not np.any(expected[[0, 4]] == 13)
+
+    labels = shape_list.to_labels(labels_shape)
+    np.testing.assert_array_equal(labels, expected)
+
+    labels = shape_list.to_labels(labels_shape, chunks=(2, 10, 7))
+    assert labels.chunksize == (2, 10, 7)
+    np.testing.assert_array_equal(labels.compute(), expected)
+
+    masks = shape_list.to_masks(labels_shape, chunks=(5, 3, 10, 10))
+    assert masks.shape == (13,) + labels_shape
+    np.testing.assert_array_equal(
+        masks.compute(), shape_list.to_masks(labels_shape)
+    )
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from napari.layers.shapes.shape_utils import (
+    path_to_bbox_mask,
+    points_in_poly,
+    poly_to_bbox_mask,
+    triangulate_edge,
+    triangulate_edges,
+)
+
+
+@pytest.mark.parametrize('closed', [True, False])
+def test_triangulate_edges(closed):
+    """Test batched triangulation matches triangulating paths one by one."""
+    np.random.seed(0)
+    paths = [
+        np.random.randint(0, 5, size=(np.random.randint(2, 10), 2))
+        for i in range(50)
+    ]
+    # repeated points and a path reduced to a single point
+    paths.append(np.array([[0, 0], [0, 0], [1, 2], [1, 2], [0, 0]]))
+    paths.append(np.array([[1, 1], [1, 1], [1, 1]]))
+
+    centers, offsets, triangles = triangulate_edges(paths, closed=closed)
+    assert len(centers) == len(paths)
+    for i, path in enumerate(paths):
+        expected = triangulate_edge(path, closed=closed)
+        np.testing.assert_array_equal(centers[i], expected[0])
+        np.testing.assert_allclose(offsets[i], expected[1])
+        np.testing.assert_array_equal(triangles[i], expected[2])
+
+
+def test_triangulate_edges_empty():
+    """Test triangulating no paths."""
+    assert triangulate_edges([]) == ([], [], [])
+
+
+def test_poly_to_bbox_mask():
+    """Test scanline rasterization matches testing each point."""
+    np.random.seed(0)
+    shape = (25, 22)
+    points = np.indices(shape).reshape(2, -1).T
+    window = np.array([[3, 4], [17, 20]])
+    for i in range(100):
+        vertices = 30 * np.random.random((np.random.randint(3, 9), 2)) - 5
+        if i % 2 == 0:
+            # vertices and edges through the sampled points
+            vertices = np.round(vertices)
+        expected = points_in_poly(points, vertices).reshape(shape)
+
+        bbox, bbox_mask = poly_to_bbox_mask(shape, vertices)
+        mask = np.zeros(shape, dtype=bool)
+        mask[bbox] = bbox_mask
+        np.testing.assert_array_equal(mask, expected)
+
+        bbox, bbox_mask = poly_to_bbox_mask(shape, vertices, window=window)
+        mask = np.zeros(window[1] - window[0], dtype=bool)
+        mask[bbox] = bbox_mask
+        np.testing.assert_array_equal(mask, expected[3:17, 4:20])
+
+
+def test_path_to_bbox_mask():
+    """Test rasterizing part of a path matches cropping the whole one."""
+    shape = (20, 20)
+    vertices = np.array([[2, 3], [15, 8], [15, 25], [-4, 11]])
+    bbox, bbox_mask = path_to_bbox_mask(shape, vertices)
+    mask = np.zeros(shape, dtype=bool)
+    mask[bbox] = bbox_mask
+    assert mask[2, 3] and mask[15, 8] and mask[15, 19] and mask[0, 11]
+    assert mask.sum() < 100
+
+    window = np.array([[5, 0], [12, 20]])
+    bbox, bbox_mask = path_to_bbox_mask(shape, vertices, window=window)
+    part = np.zeros(window[1] - window[0], dtype=bool)
+    part[bbox] = bbox_mask
+    np.testing.assert_array_equal(part, mask[5:12])
@@ -912,6 +912,21 @@ def test_to_labels():
     assert len(np.unique(labels)) <= 11
 
 
+def test_to_labels_in_chunks():
+    """Test the lazy labels generation of nD shapes."""
+    shape = (10, 4, 3)
+    np.random.seed(0)
+    data = 20 * np.random.random(shape)
+    data[:, :, 0] = np.arange(10)[:, np.newaxis]
+    layer = Shapes(data)
+    labels = layer.to_labels(chunks=(3, 8, 8))
+    assert labels.chunksize == (3, 8, 8)
+    labels = labels.compute()
+    np.testing.assert_array_equal(labels, layer.to_labels())
+    # each shape only lies in its own plane
+    for i, plane in enumerate(labels):
+        assert set(np.unique(plane)) <= {0, i + 1}
+
 def test_xml_list():
     """Test the xml generation."""
     shape = (10, 4, 2)
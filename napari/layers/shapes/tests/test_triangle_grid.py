@@ -0,0 +1,64 @@
+import numpy as np
+from napari.layers.shapes.triangle_grid import TriangleGrid
+
+
+def _index(n, shape=0):
+    return np.stack([np.full(n, shape), np.arange(n)], axis=1)
+
+
+def test_empty_triangle_grid():
+    """Test querying a grid without triangles."""
+    grid = TriangleGrid(np.empty((0, 3, 2)), np.empty((0, 2)))
+    assert len(grid.query_point([0, 0])) == 0
+    assert len(grid.query_box(np.array([[0, 0], [10, 10]]))) == 0
+
+
+def test_triangle_grid_candidates():
+    """Test queries return every triangle whose bounding box is hit."""
+    np.random.seed(0)
+    triangles = 100 * np.random.random((1, 3, 2))
+    small = 3 * np.random.random((500, 3, 2))
+    small = small + 97 * np.random.random((500, 1, 2))
+    triangles = np.concatenate([triangles, small])
+    grid = TriangleGrid(triangles, _index(len(triangles)), max_cells=4)
+    assert len(grid._large) > 0
+
+    mins = triangles.min(axis=1)
+    maxs = triangles.max(axis=1)
+    for coord in 110 * np.random.random((100, 2)) - 5:
+        inside = np.all((mins <= coord) & (coord <= maxs), axis=1)
+        candidates = grid.query_point(coord)
+        assert set(np.where(inside)[0]) <= set(candidates[:, 1])
+
+    for corner in 110 * np.random.random((50, 2)) - 5:
+        box = np.array([corner, corner + 10 * np.random.random(2)])
+        overlap = np.all((mins <= box[1]) & (box[0] <= maxs), axis=1)
+        candidates = grid.query_box(box)
+        assert set(np.where(overlap)[0]) <= set(candidates[:, 1])
+        assert len(candidates) < len(triangles)
+
+
+def test_triangle_grid_updates():
+    """Test inserted and removed shapes are found by later queries."""
+    np.random.seed(0)
+    triangles = 3 * np.random.random((30, 3, 2))
+    triangles = triangles + 20 * np.random.random((30, 1, 2))
+    index = np.stack([np.arange(30) // 3, np.arange(30) % 3], axis=1)
+    grid = TriangleGrid(triangles, index)
+    center = triangles[6].mean(axis=0)
+    assert 2 in grid.query_point(center)[:, 0]
+
+    # shape 2 is moved outside of the grid, and shape 4 deleted
+    grid.remove(2)
+    assert 2 not in grid.query_point(center)[:, 0]
+    moved = triangles[6:9] + 100
+    grid.insert(moved, index[6:9])
+    grid.remove(4, renumber=True)
+    assert 2 in grid.query_point(moved[0].mean(axis=0))[:, 0]
+    box = np.array([[-5, -5], [25, 25]])
+    assert set(grid.query_box(box)[:, 0]) == set(range(9))
+    assert 2 in grid.query_box(box + 100)[:, 0]
+
+    # triangles of renumbered shapes are found under their new index
+    center = triangles[15:18].mean(axis=1)[0]
+    assert 4 in grid.query_point(center)[:, 0]
@@ -0,0 +1,276 @@
+import numpy as np
+
+
+class TriangleGrid:
+    """Uniform grid over the bounding boxes of 2D triangles.
+
+    Each triangle is binned into every cell its bounding box overlaps, so a
+    point or box query only has to look at the triangles in the cells it
+    touches rather than at all of them. Triangles that would overlap more
+    than `max_cells` cells are kept in a separate list that is returned by
+    every query.
+
+    Triangles are identified by the index of their shape and their position
+    within the shape, so that the grid stays valid when the triangles of
+    other shapes move in the mesh. The grid is fitted to the triangles it is
+    built with, and triangles of shapes inserted later are binned into the
+    same cells, clipped to the border of the grid, in a separate list that
+    is merged into query results. Removed shapes are only masked out of the
+    binned triangles, see `remove`.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        Px3x2 array of the vertices of each triangle.
+    index : np.ndarray
+        Px2 array with the index of the shape of each triangle and the
+        position of the triangle within the shape.
+    max_cells : int
+        Maximum number of cells a single triangle is binned into.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Number of cells along each axis.
+    origin : np.ndarray
+        Length 2 array with the minimum corner of the grid.
+    cell_size : np.ndarray
+        Length 2 array with the size of a cell along each axis.
+    max_cells : int
+        Maximum number of cells a single triangle is binned into.
+    _starts : np.ndarray
+        Length C + 1 array with, for each of the C cells in raveled order,
+        the start of its triangles in `_entries`.
+    _entries : np.ndarray
+        Index of the triangles binned in each cell, sorted by cell.
+    _large : np.ndarray
+        Index of the triangles that are not binned and always returned.
+    _removed : set of int
+        Shapes whose triangles in `_entries` and `_large` are ignored.
+    _extra_cells : np.ndarray
+        Cell of each triangle inserted after the grid was built, or -1 for
+        triangles that are always returned.
+    _extra : np.ndarray
+        Index of each triangle inserted after the grid was built.
+    """
+
+    def __init__(self, triangles, index, max_cells=64):
+
+        triangles = np.asarray(triangles)
+        index = np.asarray(index, dtype=int).reshape(-1, 2)
+        n = len(triangles)
+        side = int(min(max(np.ceil(np.sqrt(n)), 1), 1024))
+        self.shape = (side, side)
+        self.max_cells = max_cells
+        self._removed = set()
+        self._extra_cells = np.empty(0, dtype=int)
+        self._extra = np.empty((0, 2), dtype=int)
+
+        if n == 0:
+            self.origin = np.zeros(2)
+            self.cell_size = np.ones(2)
+            self._starts = np.zeros(side * side + 1, dtype=int)
+            self._entries = np.empty((0, 2), dtype=int)
+            self._large = np.empty((0, 2), dtype=int)
+            return
+
+        self.origin = triangles.min(axis=(0, 1))
+        extent = triangles.max(axis=(0, 1)) - self.origin
+        cell_size = extent / side
+        cell_size[cell_size == 0] = 1
+        self.cell_size = cell_size
+
+        cells, ids = self._bin(triangles)
+        self._large = index[ids[cells < 0]]
+        binned = cells >= 0
+        cells, ids = cells[binned], ids[binned]
+
+        order = np.argsort(cells, kind='stable')
+        self._entries = index[ids[order]]
+        self._starts = np.searchsorted(
+            cells[order], np.arange(side * side + 1)
+        )
+
+    def __len__(self):
+        """Number of triangles binned when the grid was built."""
+        return len(self._entries) + len(self._large)
+
+    @property
+    def n_inserted(self):
+        """int: Number of cell entries inserted since the grid was built."""
+        return len(self._extra)
+
+    def _cells(self, coords):
+        """Cell indices along each axis of coordinates, clipped to the grid.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Nx2 array of coordinates.
+
+        Returns
+        ----------
+        cells : np.ndarray
+            Nx2 integer array of cell indices.
+        """
+        cells = np.floor((coords - self.origin) / self.cell_size).astype(int)
+        return np.clip(cells, 0, np.subtract(self.shape, 1))
+
+    def _bin(self, triangles):
+        """Cells overlapped by the bounding box of each triangle.
+
+        Parameters
+        ----------
+        triangles : np.ndarray
+            Px3x2 array of the vertices of each triangle.
+
+        Returns
+        ----------
+        cells : np.ndarray
+            Raveled index of each overlapped cell, or -1 once for each
+            triangle that overlaps more than `max_cells` cells.
+        ids : np.ndarray
+            Triangle of each entry in `cells`.
+        """
+        low = self._cells(triangles.min(axis=1))
+        high = self._cells(triangles.max(axis=1))
+        span = high - low + 1
+        counts = span[:, 0] * span[:, 1]
+        large = counts > self.max_cells
+        counts[large] = 1
+
+        # Expand each triangle into one entry per overlapped cell
+        ids = np.repeat(np.arange(len(triangles)), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        local = np.arange(len(ids)) - first
+        span_y = np.repeat(span[:, 1], counts)
+        rows = np.repeat(low[:, 0], counts) + local // span_y
+        cols = np.repeat(low[:, 1], counts) + local % span_y
+        cells = rows * self.shape[1] + cols
+        cells[large[ids]] = -1
+        return cells, ids
+
+    def insert(self, triangles, index):
+        """Bin the triangles of shapes added or edited after the grid was
+        built.
+
+        Parameters
+        ----------
+        triangles : np.ndarray
+            Px3x2 array of the vertices of each triangle.
+        index : np.ndarray
+            Px2 array with the index of the shape of each triangle and the
+            position of the triangle within the shape.
+        """
+        triangles = np.asarray(triangles)
+        if len(triangles) == 0:
+            return
+        index = np.asarray(index, dtype=int).reshape(-1, 2)
+        cells, ids = self._bin(triangles)
+        self._extra_cells = np.concatenate([self._extra_cells, cells])
+        self._extra = np.concatenate([self._extra, index[ids]])
+
+    def remove(self, shapes, renumber=False):
+        """Remove the triangles of shapes.
+
+        Parameters
+        ----------
+        shapes : int or sequence of int
+            Index of the shapes to remove.
+        renumber : bool
+            Whether the shapes are deleted and the shapes after them are
+            renumbered, which is only supported for a single shape. If not,
+            the triangles binned when the grid was built are only masked
+            out, as the shapes are expected to be inserted again.
+        """
+        shapes = np.atleast_1d(shapes).astype(int)
+        keep = ~np.isin(self._extra[:, 0], shapes)
+        self._extra_cells = self._extra_cells[keep]
+        self._extra = self._extra[keep]
+        if not renumber:
+            self._removed.update(shapes.tolist())
+            return
+
+        shape, = shapes
+        deleted = self._entries[:, 0] == shape
+        before = np.concatenate([[0], np.cumsum(deleted)])
+        self._starts = self._starts - before[self._starts]
+        self._entries = self._entries[~deleted]
+        self._large = self._large[self._large[:, 0] != shape]
+        for entries in [self._entries, self._large, self._extra]:
+            entries[entries[:, 0] > shape, 0] -= 1
+        self._removed = {
+            s - 1 if s > shape else s for s in self._removed if s != shape
+        }
+
+    def _visible(self, entries):
+        """Entries binned when the grid was built of shapes not removed."""
+        if len(self._removed) == 0:
+            return entries
+        return entries[~np.isin(entries[:, 0], list(self._removed))]
+
+    def query_point(self, coord):
+        """Triangles whose bounding box may contain a point.
+
+        Parameters
+        ----------
+        coord : sequence of float
+            Length 2 coordinate of the point.
+
+        Returns
+        ----------
+        index : np.ndarray
+            Kx2 array with the shape and position within the shape of each
+            candidate triangle.
+        """
+        coord = np.asarray(coord, dtype=float)[-2:]
+        # points outside the grid are checked against the border cells, in
+        # which triangles inserted outside of it are binned
+        cell = self._cells(coord[np.newaxis])[0]
+        cell = cell[0] * self.shape[1] + cell[1]
+        entries = self._entries[self._starts[cell] : self._starts[cell + 1]]
+        extra = np.isin(self._extra_cells, [cell, -1])
+        return np.concatenate(
+            [
+                self._visible(entries),
+                self._visible(self._large),
+                self._extra[extra],
+            ]
+        )
+
+    def query_box(self, corners):
+        """Triangles whose bounding box may intersect a box.
+
+        Parameters
+        ----------
+        corners : np.ndarray
+            2x2 array of two corners of an axis aligned box.
+
+        Returns
+        ----------
+        index : np.ndarray
+            Kx2 array with the shape and position within the shape of each
+            candidate triangle, sorted and without duplicates.
+        """
+        corners = np.asarray(corners, dtype=float)[:, -2:]
+        low = self._cells(corners.min(axis=0, keepdims=True))[0]
+        high = self._cells(corners.max(axis=0, keepdims=True))[0]
+
+        # Cells of a row of the box are contiguous in raveled order
+        rows = np.arange(low[0], high[0] + 1) * self.shape[1]
+        first = self._starts[rows + low[1]]
+        last = self._starts[rows + high[1] + 1]
+        entries = [self._entries[s:e] for s, e in zip(first, last)]
+        entries = self._visible(np.concatenate(entries + [self._large]))
+
+        cells = self._extra_cells
+        row, col = np.divmod(cells, self.shape[1])
+        extra = (cells < 0) | (
+            (low[0] <= row)
+            & (row <= high[0])
+            & (low[1] <= col)
+            & (col <= high[1])
+        )
+        return np.unique(
+            np.concatenate([entries, self._extra[extra]]), axis=0
+        )
@@ -4,7 +4,9 @@ from dask import array as da
 
 from ..layer_utils import (
     calc_data_range,
+    calc_percentile_range,
     increment_unnamed_colormap,
+    sample_data,
     segment_normal,
 )
 
@@ -71,6 +73,34 @@ def test_calc_data_range_fast_big():
     assert len(val) > 0
 
 
+def test_sample_data():
+    data = np.random.random((100, 100))
+    samples = sample_data(data, max_samples=50)
+    assert samples.shape == (50,)
+    assert np.all(np.isin(samples, data))
+    np.testing.assert_array_equal(samples, sample_data(data, max_samples=50))
+
+    # small data is returned whole
+    assert sample_data(data[:5, :5]).shape == (25,)
+
+    # lazy data is sampled from whole chunks
+    lazy = da.from_array(data, chunks=10)
+    samples = sample_data(lazy, max_samples=150)
+    assert samples.shape == (150,)
+    assert np.all(np.isin(samples, data))
+
+
+def test_calc_percentile_range():
+    data = np.zeros((100, 100))
+    data[:, 50:] = 1
+    data[0, 0] = 1000
+    assert calc_percentile_range(data) == [0, 1]
+    assert calc_percentile_range(data, (0, 100)) == [0, 1000]
+
+    # constant data falls back to the data range
+    assert calc_percentile_range(np.ones((10, 10))) == [0, 1]
+
+
 def test_segment_normal_2d():
     a = np.array([1, 1])
     b = np.array([1, 10])
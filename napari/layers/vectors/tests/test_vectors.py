@@ -221,6 +221,19 @@ def test_thumbnail():
     assert layer.thumbnail.shape == layer._thumbnail_shape
 
 
+def test_thumbnail_lines():
+    """Test the vectors are drawn as lines in the thumbnail."""
+    data = np.array([[[0, 0], [20, 0]], [[0, 0], [0, 20]]])
+    layer = Vectors(data, edge_color='red', opacity=1)
+    layer._update_thumbnail()
+    thumbnail = layer.thumbnail
+    # The vectors end at about (20 - 0.5) * 32 / 21 pixels
+    assert np.all(thumbnail[:29, 0] == [255, 0, 0, 255])
+    assert np.all(thumbnail[0, :29] == [255, 0, 0, 255])
+    assert np.all(thumbnail[30:, 0, :3] == 0)
+    assert np.all(thumbnail[1:, 1:, :3] == 0)
+
+
 def test_value():
     """Test getting the value of the data at the current coordinates."""
     np.random.seed(0)
@@ -238,7 +238,7 @@ class Vectors(Layer):
         """str: edge color of all the vectors."""
         self._edge_color = edge_color
         self.events.edge_color()
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
 
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
@@ -325,14 +325,20 @@ class Vectors(Layer):
         colormapped = np.zeros(self._thumbnail_shape)
         colormapped[..., 3] = 1
         col = Color(self.edge_color).rgba
-        for v in downsampled:
-            start = v[0]
-            stop = v[1]
-            step = int(np.ceil(np.max(abs(stop - start))))
-            x_vals = np.linspace(start[0], stop[0], step)
-            y_vals = np.linspace(start[1], stop[1], step)
-            for x, y in zip(x_vals, y_vals):
-                colormapped[int(x), int(y), :] = col
+        # Sample each vector at about one point per pixel, all at once
+        start = downsampled[:, 0]
+        stop = downsampled[:, 1]
+        steps = np.ceil(np.max(abs(stop - start), axis=1)).astype(int)
+        vector_index = np.repeat(np.arange(len(steps)), steps)
+        first = np.repeat(np.cumsum(steps) - steps, steps)
+        fraction = (np.arange(len(vector_index)) - first) / np.repeat(
+            np.maximum(steps - 1, 1), steps
+        )
+        samples = start[vector_index] + fraction[:, np.newaxis] * (
+            stop - start
+        )[vector_index]
+        samples = samples.astype(int)
+        colormapped[samples[:, 0], samples[:, 1], :] = col
         colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
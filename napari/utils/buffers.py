@@ -0,0 +1,109 @@
+"""Arrays that grow along their first axis.
+"""
+import numpy as np
+
+
+class AppendBuffer:
+    """Array that rows can be appended to at an amortized constant cost.
+
+    Rows are stored at the start of a larger array whose capacity is doubled
+    whenever it is full, so that appending copies only the new rows most of
+    the time. Consumers read `data`, a view of the rows in the buffer. The
+    view can be modified in place, but must be fetched again after rows have
+    been appended or deleted.
+
+    Parameters
+    ----------
+    data : array
+        Initial rows of the buffer. The array is used without copying until
+        rows are appended or deleted.
+
+    Attributes
+    ----------
+    data : array
+        View of the rows in the buffer.
+    capacity : int
+        Number of rows that fit in the buffer before it has to grow.
+    """
+
+    def __init__(self, data):
+        self._array = np.asarray(data)
+        self._length = len(self._array)
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def data(self):
+        """array: view of the rows in the buffer."""
+        return self._array[: self._length]
+
+    @property
+    def capacity(self):
+        """int: number of rows that fit before the buffer has to grow."""
+        return len(self._array)
+
+    def append(self, rows):
+        """Append rows to the end of the buffer.
+
+        Parameters
+        ----------
+        rows : array
+            Rows to append, with the same trailing shape as the buffer. If
+            they have a wider dtype the buffer is promoted to it.
+        """
+        rows = np.asarray(rows)
+        dtype = np.result_type(self._array, rows)
+        length = self._length + len(rows)
+        if length > len(self._array) or dtype != self._array.dtype:
+            capacity = max(length, 2 * len(self._array), 16)
+            array = np.empty((capacity,) + self._array.shape[1:], dtype=dtype)
+            array[: self._length] = self.data
+            self._array = array
+        self._array[self._length : length] = rows
+        self._length = length
+
+    def delete(self, indices):
+        """Delete rows from the buffer in a single pass.
+
+        The remaining rows are copied into a new array, so views fetched
+        before the deletion keep their values.
+
+        Parameters
+        ----------
+        indices : int, sequence of int, or array of bool
+            Indices of the rows to delete, or a mask of the rows to delete.
+        """
+        keep = np.ones(self._length, dtype=bool)
+        keep[indices] = False
+        self._array = self.data[keep]
+        self._length = len(self._array)
+
+
+def buffer_property(name, doc=None):
+    """Property exposing the rows of a buffer stored on the instance.
+
+    The buffer is stored in the `_buffers` dict of the instance. Getting the
+    property returns a view of the rows of the buffer, and setting it replaces
+    the buffer with a new one holding the given rows.
+
+    Parameters
+    ----------
+    name : str
+        Key of the buffer in `_buffers`.
+    doc : str, optional
+        Docstring of the property.
+
+    Returns
+    ----------
+    prop : property
+        Property reading and replacing the buffer.
+    """
+
+    def fget(self):
+        return self._buffers[name].data
+
+    def fset(self, value):
+        self._buffers[name] = AppendBuffer(value)
+
+    return property(fget, fset, doc=doc)
@@ -1,5 +1,7 @@
 import os
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
 
@@ -7,8 +9,18 @@ import numpy as np
 from skimage import io
 from skimage.io.collection import alphanumeric_key
 
-from dask import delayed
 from dask import array as da
+from dask.base import tokenize
+
+try:
+    import tifffile
+except ImportError:
+    tifffile = None
+
+try:
+    from PIL import Image as PIL_Image
+except ImportError:
+    PIL_Image = None
 
 
 def magic_imread(filenames, *, use_dask=None, stack=True):
@@ -65,26 +77,24 @@ def magic_imread(filenames, *, use_dask=None, stack=True):
         use_dask = len(filenames_expanded) > 1
 
     # then, read in images
-    images = []
-    shape = None
-    for filename in filenames_expanded:
-        ext = os.path.splitext(filename)[-1]
-        if ext == '.zarr':
-            image, zarr_shape = read_zarr_dataset(filename)
-            if shape is None:
-                shape = zarr_shape
+    if any(_ext(f) == '.zarr' for f in filenames_expanded):
+        # zarr datasets are read lazily by dask already
+        images = []
+        for f in filenames_expanded:
+            if _ext(f) == '.zarr':
+                images.append(read_zarr_dataset(f)[0])
+            elif use_dask:
+                images.append(read_lazy_image(f))
+            else:
+                images.append(imread(f))
+    elif use_dask:
+        if stack and len(filenames_expanded) > 1:
+            images = [read_lazy_stack(filenames_expanded)]
         else:
-            if shape is None:
-                image = io.imread(filename)
-                shape = image.shape
-                dtype = image.dtype
-            if use_dask:
-                image = da.from_delayed(
-                    delayed(io.imread)(filename), shape=shape, dtype=dtype
-                )
-            elif len(images) > 0:  # not read by shape clause
-                image = io.imread(filename)
-        images.append(image)
+            images = [read_lazy_image(f) for f in filenames_expanded]
+    else:
+        images = read_files(filenames_expanded)
+
     if len(images) == 1:
         image = images[0]
     else:
@@ -98,6 +108,290 @@ def magic_imread(filenames, *, use_dask=None, stack=True):
     return image
 
 
+def _ext(filename):
+    """Lower case extension of a filename."""
+    return os.path.splitext(filename)[-1].lower()
+
+
+def read_header(filename):
+    """Read the shape and dtype of an image file.
+
+    Only the header of npy files, tiff files and common 8 and 16 bit
+    formats is read, other files are decoded entirely.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the image file.
+
+    Returns
+    -------
+    shape : tuple of int
+        Shape of the image.
+    dtype : np.dtype
+        Data type of the image.
+    """
+    ext = _ext(filename)
+    if ext == '.npy':
+        image = np.load(filename, mmap_mode='r')
+        return image.shape, image.dtype
+    if ext in ('.tif', '.tiff') and tifffile is not None:
+        with tifffile.TiffFile(filename) as tif:
+            series = tif.series[0]
+            return tuple(series.shape), np.dtype(series.dtype)
+    if PIL_Image is not None and ext in ('.png', '.jpg', '.jpeg', '.bmp'):
+        with PIL_Image.open(filename) as image:
+            if image.mode in _PIL_MODES:
+                channels, dtype = _PIL_MODES[image.mode]
+                shape = (image.height, image.width) + channels
+                return shape, np.dtype(dtype)
+    image = io.imread(filename)
+    return image.shape, image.dtype
+
+
+# channels and dtype of the PIL image modes decoded without conversion
+_PIL_MODES = {
+    'L': ((), np.uint8),
+    'RGB': ((3,), np.uint8),
+    'RGBA': ((4,), np.uint8),
+    'I;16': ((), np.uint16),
+}
+
+
+def imread(filename, mmap=False):
+    """Read an image file.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the image file.
+    mmap : bool
+        If True, npy files and uncompressed tiff files are memory-mapped
+        read-only rather than read, so that only the accessed parts of the
+        file are loaded.
+
+    Returns
+    -------
+    image : array
+        Image data.
+    """
+    ext = _ext(filename)
+    if ext == '.npy':
+        return np.load(filename, mmap_mode='r' if mmap else None)
+    if mmap and ext in ('.tif', '.tiff') and tifffile is not None:
+        try:
+            return tifffile.memmap(filename, mode='r')
+        except ValueError:
+            # compressed or not contiguous, so it must be decoded
+            pass
+    return io.imread(filename)
+
+
+def _read_group(filenames):
+    """Read a group of image files with the same shape into one array.
+
+    A single file is memory-mapped if possible, and returned as a view of
+    the map so that only the parts of it that are accessed are read.
+    """
+    if len(filenames) == 1:
+        return imread(filenames[0], mmap=True)[np.newaxis]
+    return np.stack([imread(f) for f in filenames])
+
+
+def _mappable(filename):
+    """Whether an image file can be memory-mapped by `imread`."""
+    ext = _ext(filename)
+    if ext == '.npy':
+        return True
+    if ext in ('.tif', '.tiff') and tifffile is not None:
+        with tifffile.TiffFile(filename) as tif:
+            # compressed or not contiguous data has no offset
+            return tif.series[0].dataoffset is not None
+    return False
+
+
+def read_lazy_stack(filenames, chunk_bytes=2 ** 24):
+    """Lazily read a stack of image files with the same shape.
+
+    Only the header of the first file is read, see `read_header`. Files
+    that can be memory-mapped (npy and uncompressed tiff files) are each a
+    chunk of the returned array that maps the file, so that they are never
+    copied into memory as a whole. Other files are decoded, and are grouped
+    so that each chunk holds about `chunk_bytes` bytes, which keeps the
+    number of dask tasks low for folders with many small files.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Paths of the image files.
+    chunk_bytes : int
+        Target size of each chunk of decoded files in bytes.
+
+    Returns
+    -------
+    stack : dask.array.Array
+        Stacked images, with the files along the first axis.
+    """
+    shape, dtype = read_header(filenames[0])
+    nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+    if _mappable(filenames[0]):
+        per_chunk = 1
+    else:
+        per_chunk = int(np.clip(chunk_bytes // nbytes, 1, len(filenames)))
+    groups = [
+        filenames[start : start + per_chunk]
+        for start in range(0, len(filenames), per_chunk)
+    ]
+    name = _file_name('imread', *filenames)
+    origin = (0,) * len(shape)
+    graph = {
+        (name, i) + origin: (_read_group, group)
+        for i, group in enumerate(groups)
+    }
+    chunks = (tuple(len(group) for group in groups),)
+    chunks += tuple((size,) for size in shape)
+    return da.Array(graph, name, chunks, dtype=dtype)
+
+
+def read_lazy_image(filename):
+    """Lazily read a single image file, as one chunk.
+
+    Only the header of the file is read, see `read_header`.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the image file.
+
+    Returns
+    -------
+    image : dask.array.Array
+        Image data.
+    """
+    shape, dtype = read_header(filename)
+    name = _file_name('imread', filename)
+    graph = {(name,) + (0,) * len(shape): (imread, filename, True)}
+    chunks = tuple((size,) for size in shape)
+    return da.Array(graph, name, chunks, dtype=dtype)
+
+
+def read_files(filenames, max_workers=None):
+    """Read image files into memory, decoding them on a thread pool.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Paths of the image files.
+    max_workers : int, optional
+        Maximum number of threads.
+
+    Returns
+    -------
+    images : list of np.ndarray
+        Image data of each file.
+    """
+    if len(filenames) == 1:
+        return [imread(filenames[0])]
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(imread, filenames))
+
+
+# paths of the files read into the dask arrays named by `_file_name`, for
+# the most recently read arrays only
+_file_sources = OrderedDict()
+_MAX_FILE_SOURCES = 256
+
+
+def _file_name(prefix, *paths):
+    """Dask name of an array read from files.
+
+    The name depends on the paths of the files, and on the size and
+    modification time of those paths, without looking inside directories
+    so that opening large zarr datasets stays cheap. The paths are
+    remembered so that the content of the files can be identified later,
+    see `file_token`.
+
+    Parameters
+    ----------
+    prefix : str
+        Prefix of the name.
+    *paths : str
+        Paths of the files or directories.
+
+    Returns
+    -------
+    name : str
+        Name of the dask array.
+    """
+    paths = tuple(os.path.abspath(path) for path in paths)
+    stats = [os.stat(path) for path in paths]
+    stats = [(stat.st_size, stat.st_mtime_ns) for stat in stats]
+    name = f'{prefix}-{tokenize(paths, stats)}'
+    _file_sources[name] = paths
+    _file_sources.move_to_end(name)
+    while len(_file_sources) > _MAX_FILE_SOURCES:
+        _file_sources.popitem(last=False)
+    return name
+
+
+def _file_stats(path):
+    """Path, size and modification time of a file or of the files in a
+    directory, such as the chunks of a zarr array.
+    """
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return [(path, stat.st_size, stat.st_mtime_ns)]
+    stats = []
+    for root, dirs, names in os.walk(path):
+        dirs.sort()
+        for name in sorted(names):
+            stats.extend(_file_stats(os.path.join(root, name)))
+    return stats
+
+
+def is_read_from_files(data):
+    """Whether an array was recently read from files by this module.
+
+    Parameters
+    ----------
+    data : array
+        Array to check.
+
+    Returns
+    -------
+    from_files : bool
+        True if the data is a dask array read from files, whose paths are
+        still remembered.
+    """
+    return isinstance(data, da.Array) and data.name in _file_sources
+
+
+def file_token(data):
+    """Token identifying the content of the files an array was read from.
+
+    The token depends on the paths, sizes and modification times of the
+    files, including every file inside directories, so that the same files
+    get the same token in every session until they are modified. As every
+    file is visited, it is only computed when needed, such as to cache
+    results on disk.
+
+    Parameters
+    ----------
+    data : array
+        Array read from files.
+
+    Returns
+    -------
+    token : str or None
+        Token of the files, or None if the data was not read from files by
+        this module, see `is_read_from_files`.
+    """
+    if not is_read_from_files(data):
+        return None
+    paths = _file_sources[data.name]
+    return tokenize([_file_stats(path) for path in paths])
+
+
 def read_zarr_dataset(path):
     """Read a zarr dataset, including an array or a group of arrays.
 
@@ -115,7 +409,7 @@ def read_zarr_dataset(path):
     """
     if os.path.exists(os.path.join(path, '.zarray')):
         # load zarr array
-        image = da.from_zarr(path)
+        image = da.from_zarr(path, name=_file_name('from-zarr', path))
         shape = image.shape
     elif os.path.exists(os.path.join(path, '.zgroup')):
         # else load zarr all arrays inside file, useful for pyramid data
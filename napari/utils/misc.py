@@ -5,6 +5,7 @@ import re
 import inspect
 import itertools
 import numpy as np
+from vispy.color import ColorArray
 
 
 def str_to_rgb(arg):
@@ -46,6 +47,49 @@ def is_iterable(arg, color=False):
         return True
 
 
+def transform_color(colors):
+    """Convert one or many colors to an (N, 4) float32 array of RGBA values.
+
+    Color names and hex strings are converted once per unique value, so long
+    lists of repeated names convert quickly. Arrays of numeric values are
+    converted without parsing.
+
+    Parameters
+    ----------
+    colors : str, sequence of str, or array
+        A single color name, hex string or 1-D array of RGB or RGBA values,
+        or a sequence of them.
+
+    Returns
+    -------
+    rgba : (N, 4) array
+        RGBA values between 0 and 1 for each color.
+    """
+    if not is_iterable(colors, color=True):
+        colors = [colors]
+    if len(colors) == 0:
+        return np.empty((0, 4), dtype=np.float32)
+    if isinstance(colors, np.ndarray) and colors.dtype.kind in 'biuf':
+        array = colors
+    elif all(isinstance(c, str) for c in colors):
+        names, inverse = np.unique(np.asarray(colors), return_inverse=True)
+        rgba = ColorArray(list(names)).rgba.astype(np.float32)
+        return rgba[inverse]
+    else:
+        try:
+            array = np.asarray(colors, dtype=float)
+        except (TypeError, ValueError):
+            return np.concatenate(
+                [ColorArray(c).rgba for c in colors], axis=0
+            ).astype(np.float32)
+    if array.ndim == 1:
+        # a single RGB or RGBA sequence that is not a list, such as a tuple
+        array = array[np.newaxis]
+    rgba = np.ones((len(array), 4), dtype=np.float32)
+    rgba[:, : array.shape[1]] = array
+    return rgba
+
+
 def formatdoc(obj):
     """Substitute globals and locals into an object's docstring."""
     frame = inspect.currentframe().f_back
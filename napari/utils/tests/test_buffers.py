@@ -0,0 +1,42 @@
+import numpy as np
+from napari.utils.buffers import AppendBuffer
+
+
+def test_append_buffer():
+    data = np.random.random((10, 2))
+    buffer = AppendBuffer(data)
+    assert len(buffer) == 10
+    assert np.all(buffer.data == data)
+
+    rows = np.random.random((5, 2))
+    buffer.append(rows)
+    assert len(buffer) == 15
+    capacity = buffer.capacity
+    assert capacity >= 20
+    assert np.all(buffer.data == np.concatenate([data, rows]))
+
+    # Appending within the capacity does not reallocate
+    buffer.append(rows)
+    assert buffer.capacity == capacity
+    assert len(buffer) == 20
+
+
+def test_append_buffer_promotes_dtype():
+    buffer = AppendBuffer(np.zeros((2, 2), dtype=int))
+    buffer.append([[0.5, 1.5]])
+    assert buffer.data.dtype == float
+    assert np.all(buffer.data[-1] == [0.5, 1.5])
+
+
+def test_append_buffer_delete():
+    data = np.arange(10)
+    buffer = AppendBuffer(data)
+    buffer.append([10, 11])
+    view = buffer.data
+    buffer.delete([0, 5, 11])
+    assert np.all(buffer.data == [1, 2, 3, 4, 6, 7, 8, 9, 10])
+    assert np.all(view == np.arange(12))
+
+    mask = buffer.data % 2 == 0
+    buffer.delete(mask)
+    assert np.all(buffer.data == [1, 3, 7, 9])
@@ -4,6 +4,7 @@ from pathlib import Path
 import numpy as np
 from dask import array as da
 from skimage.data import data_dir
+from skimage.io import imsave
 from tempfile import TemporaryDirectory
 from napari.utils import io
 import pytest
@@ -16,6 +17,13 @@ try:
 except ImportError:
     zarr_available = False
 
+try:
+    import tifffile
+
+    tifffile_available = True
+except ImportError:
+    tifffile_available = False
+
 
 @pytest.fixture
 def single_png():
@@ -73,6 +81,23 @@ def test_multi_png_defaults(two_pngs):
     assert images.shape == (2, 512, 512)
 
 
+def test_lazy_names_depend_on_files(two_pngs):
+    first = io.magic_imread(two_pngs)
+    assert io.magic_imread(two_pngs).name == first.name
+    assert io.magic_imread(two_pngs[::-1]).name != first.name
+
+    with TemporaryDirectory() as tmp:
+        copies = []
+        for i, png in enumerate(two_pngs):
+            copies.append(os.path.join(tmp, f'{i}.png'))
+            with open(png, 'rb') as src, open(copies[-1], 'wb') as dst:
+                dst.write(src.read())
+        name = io.magic_imread(copies).name
+        # modifying a file changes the name
+        os.utime(copies[0], (0, 0))
+        assert io.magic_imread(copies).name != name
+
+
 def test_multi_png_pathlib(two_pngs):
     image_files = [Path(png) for png in two_pngs]
     images = io.magic_imread(image_files)
@@ -142,6 +167,52 @@ def test_zarr():
         np.testing.assert_array_equal(image, image_in)
 
 
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_zarr_and_file_lazy(tmp_path):
+    image = np.random.random((20, 20))
+    path = str(tmp_path / 'data.zarr')
+    z = zarr.open(path, 'a', shape=image.shape)
+    z[:] = image
+    filename = str(tmp_path / 'data.npy')
+    np.save(filename, image)
+
+    # files next to zarr datasets are read lazily too
+    images = io.magic_imread([path, filename], stack=False)
+    assert all(isinstance(im, da.Array) for im in images)
+    np.testing.assert_array_equal(images[1], image)
+
+    images = io.magic_imread([path, filename], use_dask=False, stack=False)
+    assert isinstance(images[1], np.ndarray)
+
+
+@pytest.mark.skipif(not zarr_available, reason='zarr not installed')
+def test_zarr_opened_without_walk(tmp_path, monkeypatch):
+    path = str(tmp_path / 'data.zarr')
+    z = zarr.open(path, 'w', shape=(20, 20), chunks=(5, 5))
+    z[:] = 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError('chunks visited')
+
+    # the chunks are only visited once the files are identified
+    monkeypatch.setattr(os, 'walk', fail)
+    image = io.magic_imread(path)
+    assert io.is_read_from_files(image)
+    monkeypatch.undo()
+    assert io.file_token(image) is not None
+
+
+def test_file_sources_bounded(single_png, monkeypatch):
+    monkeypatch.setattr(io, '_file_sources', io.OrderedDict())
+    monkeypatch.setattr(io, '_MAX_FILE_SOURCES', 2)
+    first = io.read_lazy_image(single_png[0])
+    for prefix in ['a', 'b']:
+        io._file_name(prefix, single_png[0])
+    assert len(io._file_sources) == 2
+    assert not io.is_read_from_files(first)
+    assert io.file_token(first) is None
+
+
 @pytest.mark.skipif(not zarr_available, reason='zarr not installed')
 def test_zarr_pyramid():
     pyramid = [
@@ -161,3 +232,62 @@ def test_zarr_pyramid():
         # the context manager. Alternatively, we could convert to NumPy here.
         for images, images_in in zip(pyramid, pyramid_in):
             np.testing.assert_array_equal(images, images_in)
+
+
+def test_read_header(two_pngs, tmp_path):
+    for png in two_pngs:
+        image = io.imread(png)
+        assert io.read_header(png) == (image.shape, image.dtype)
+
+    data = np.random.random((4, 5))
+    np.save(tmp_path / 'data.npy', data)
+    assert io.read_header(str(tmp_path / 'data.npy')) == ((4, 5), data.dtype)
+
+
+@pytest.mark.skipif(not tifffile_available, reason='tifffile not installed')
+def test_tiff_header_and_memmap(tmp_path):
+    data = np.random.randint(0, 1000, (3, 15, 10)).astype(np.uint16)
+    filename = str(tmp_path / 'data.tif')
+    tifffile.imwrite(filename, data)
+    assert io.read_header(filename) == ((3, 15, 10), np.dtype(np.uint16))
+
+    image = io.imread(filename, mmap=True)
+    assert isinstance(image, np.memmap)
+    np.testing.assert_array_equal(image, data)
+    assert not isinstance(io.imread(filename), np.memmap)
+
+
+def test_lazy_stack_chunks(tmp_path):
+    data = np.random.randint(0, 255, (10, 10, 10), dtype=np.uint8)
+    filenames = []
+    for i, plane in enumerate(data):
+        filenames.append(str(tmp_path / f'{i}.png'))
+        imsave(filenames[-1], plane)
+
+    # each chunk groups as many decoded files as fit in chunk_bytes
+    stack = io.read_lazy_stack(filenames, chunk_bytes=3 * data[0].nbytes)
+    assert stack.chunks[0] == (3, 3, 3, 1)
+    np.testing.assert_array_equal(stack, data)
+
+
+def test_lazy_stack_memmaps(tmp_path):
+    data = np.random.random((10, 10, 10))
+    filenames = []
+    for i, plane in enumerate(data):
+        filenames.append(str(tmp_path / f'{i}.npy'))
+        np.save(filenames[-1], plane)
+
+    # memory-mapped files are not copied into larger chunks
+    stack = io.read_lazy_stack(filenames, chunk_bytes=3 * data[0].nbytes)
+    assert stack.chunks[0] == (1,) * 10
+    chunk = io._read_group(filenames[:1])
+    assert isinstance(chunk.base, np.memmap)
+    np.testing.assert_array_equal(stack, data)
+
+    images = io.magic_imread(str(tmp_path))
+    assert isinstance(images, da.Array)
+    np.testing.assert_array_equal(images, data)
+
+    images = io.magic_imread(str(tmp_path), use_dask=False)
+    assert isinstance(images, np.ndarray)
+    np.testing.assert_array_equal(images, data)
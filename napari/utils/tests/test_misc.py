@@ -1,7 +1,8 @@
 from enum import auto
 
+import numpy as np
 import pytest
-from napari.utils.misc import callsignature, StringEnum
+from napari.utils.misc import callsignature, StringEnum, transform_color
 
 
 def test_callsignature():
@@ -94,3 +95,26 @@ def test_string_enum():
     assert str(animals.AARDVARK) == 'aardvark'
     assert animals('BUffALO') == animals.BUFFALO
     assert animals['BUffALO'] == animals.BUFFALO
+
+
+def test_transform_color():
+    """Test converting colors to an RGBA array."""
+    np.testing.assert_array_equal(transform_color('red'), [[1, 0, 0, 1]])
+    np.testing.assert_array_equal(transform_color([0, 0, 1]), [[0, 0, 1, 1]])
+    np.testing.assert_array_equal(
+        transform_color(['red', 'blue', 'red']),
+        [[1, 0, 0, 1], [0, 0, 1, 1], [1, 0, 0, 1]],
+    )
+    np.testing.assert_array_equal(
+        transform_color(np.zeros((2, 3))), [[0, 0, 0, 1], [0, 0, 0, 1]]
+    )
+    np.testing.assert_array_equal(
+        transform_color(['#ff0000', (0, 1, 0, 0.5)]),
+        [[1, 0, 0, 1], [0, 1, 0, 0.5]],
+    )
+    np.testing.assert_array_equal(
+        transform_color((1, 0, 0, 0.5)), [[1, 0, 0, 0.5]]
+    )
+    np.testing.assert_array_equal(transform_color((0, 1, 0)), [[0, 1, 0, 1]])
+    assert transform_color([]).shape == (0, 4)
+    assert transform_color('white').dtype == np.float32
@@ -14,6 +14,7 @@ def view_image(
     rendering='mip',
     iso_threshold=0.5,
     attenuation=0.5,
+    projection='max',
     name=None,
     metadata=None,
     scale=None,
@@ -77,6 +78,9 @@ def view_image(
         Threshold for isosurface.
     attenuation : float
         Attenuation rate for attenuated maximum intensity projection.
+    projection : str
+        Reduction used to project the data over the intervals of dimensions
+        in INTERVAL mode. One of {'max', 'min', 'mean', 'sum'}.
     name : str
         Name of the layer.
     metadata : dict
@@ -127,6 +131,7 @@ def view_image(
         rendering=rendering,
         iso_threshold=iso_threshold,
         attenuation=attenuation,
+        projection=projection,
         name=name,
         metadata=metadata,
         scale=scale,